@@ -0,0 +1,323 @@
+"""
+```yaml
+# 🌐🕸
+batch:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: multi repository batch runs from a manifest on a shared worker pool for semantify³.
+```
+"""
+
+import fnmatch
+import glob
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from basemkit.yamlable import lod_storable
+
+from sem3.extractor import Extractor
+from sem3.lod2rdf import RDFDumper
+from sem3.parse_limits import ParseLimits
+from sem3.storable import NoneDefaults
+
+
+@lod_storable
+@dataclass
+class RepositoryConfig(NoneDefaults):
+    """Configuration of a single repository of a batch manifest."""
+
+    none_defaults = {"include": lambda: ["**/*.py"], "exclude": list}
+
+    name: str
+    root: str = "."
+    include: Optional[List[str]] = None
+    exclude: Optional[List[str]] = None
+    base_uri: str = "https://semantify3.bitplan.com/source_code/"
+    namespace: str = "python_module"
+    type_name: str = "PythonModule"
+    id_field: str = "name"
+    id_scheme: str = "hash"
+    output: Optional[str] = None
+    format: str = "turtle"
+
+
+@lod_storable
+@dataclass
+class BatchManifest(NoneDefaults):
+    """A list of repositories to be processed in one batch run."""
+
+    none_defaults = {"repositories": list}
+
+    repositories: Optional[List[RepositoryConfig]] = None
+    # optional path of the aggregate summary YAML file
+    summary: Optional[str] = None
+
+
+@lod_storable
+@dataclass
+class RepositorySummary:
+    """Result of a single repository of a batch run."""
+
+    name: str
+    files: int = 0
+    bytes: int = 0
+    markups: int = 0
+    skipped: int = 0
+    entities: int = 0
+    triples: int = 0
+    output: Optional[str] = None
+    error: Optional[str] = None
+
+
+@lod_storable
+@dataclass
+class BatchSummary(NoneDefaults):
+    """Aggregate result of a batch run."""
+
+    none_defaults = {"repositories": list}
+
+    repositories: Optional[List[RepositorySummary]] = None
+    files: int = 0
+    bytes: int = 0
+    markups: int = 0
+    skipped: int = 0
+    entities: int = 0
+    triples: int = 0
+    errors: int = 0
+    workers: int = 0
+    seconds: float = 0.0
+
+
+# per worker process extractor - see init_worker
+worker_extractor: Optional[Extractor] = None
+
+
+def init_worker(limits: Dict[str, Any], scan_bytes: Optional[int] = None):
+    """Initialize the extractor of a worker process once."""
+    global worker_extractor
+    worker_extractor = Extractor(limits=ParseLimits(**limits), scan_bytes=scan_bytes)
+
+
+def extract_file(filepath: str) -> Tuple[List[Dict[str, Any]], int, int]:
+    """Extract the list of dicts of a single file in a worker.
+
+    Args:
+        filepath: the file to extract from.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], int, int]: the list of dicts, the number of
+        markups and the number of skipped markups.
+    """
+    extractor = worker_extractor
+    extractor.skipped = []
+    markups = extractor.extract_from_file(filepath)
+    lod = extractor.markups_to_lod(markups) if markups else []
+    return lod, len(markups), len(extractor.skipped)
+
+
+class InlineExecutor(Executor):
+    """Executor running the tasks in the calling thread (workers=0)."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as ex:
+            future.set_exception(ex)
+        return future
+
+
+class BatchRunner:
+    """Run the extraction of many repositories on one shared worker pool.
+
+    The files of all repositories are scheduled largest first so that no
+    worker idles at the end of the run while a big file is still parsed.
+    Each repository is serialized as soon as its last file is done.
+    """
+
+    def __init__(
+        self,
+        manifest: BatchManifest,
+        base_path: str = ".",
+        workers: Optional[int] = None,
+        limits: Optional[ParseLimits] = None,
+        backend: str = "rdflib",
+        scan_bytes: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        debug: bool = False,
+    ):
+        """Initialize the batch runner.
+
+        Args:
+            manifest: the batch manifest.
+            base_path: directory relative repository roots and outputs are resolved against.
+            workers: number of worker processes (None: cpu count, 0: inline).
+            limits: per markup parse limits.
+            backend: the RDF backend for the outputs.
+            scan_bytes: if set only scan the header of each file - see Extractor.
+            max_in_flight: maximum number of submitted files whose results are
+                not collected yet (None: twice the number of workers).
+            debug: if True print debug output.
+        """
+        self.manifest = manifest
+        self.base_path = base_path
+        self.workers = os.cpu_count() if workers is None else workers
+        self.limits = limits or ParseLimits()
+        self.backend = backend
+        self.scan_bytes = scan_bytes
+        self.max_in_flight = max_in_flight or 2 * max(self.workers, 1)
+        self.debug = debug
+
+    @classmethod
+    def from_manifest_file(cls, manifest_path: str, **kwargs) -> "BatchRunner":
+        """Create a batch runner for the given manifest YAML file."""
+        manifest = BatchManifest.load_from_yaml_file(manifest_path)
+        base_path = os.path.dirname(os.path.abspath(manifest_path))
+        return cls(manifest, base_path=base_path, **kwargs)
+
+    def resolve(self, path: str) -> str:
+        return os.path.normpath(os.path.join(self.base_path, path))
+
+    def expand_files(self, repo: RepositoryConfig) -> List[str]:
+        """Get the sorted files of a repository matching include but not exclude."""
+        root = self.resolve(repo.root)
+        files = set()
+        for pattern in repo.include:
+            for path in glob.glob(os.path.join(root, pattern), recursive=True):
+                if not os.path.isfile(path):
+                    continue
+                rel_path = os.path.relpath(path, root)
+                if any(fnmatch.fnmatch(rel_path, ex) for ex in repo.exclude):
+                    continue
+                files.add(path)
+        return sorted(files)
+
+    def write_repository(
+        self,
+        repo: RepositoryConfig,
+        lod: List[Dict[str, Any]],
+        summary: RepositorySummary,
+    ):
+        """Serialize the list of dicts of a repository to its output."""
+        dumper = RDFDumper(
+            base_uri=repo.base_uri,
+            namespace_prefix=repo.namespace,
+            backend=self.backend,
+            id_scheme=repo.id_scheme,
+        )
+        graph = dumper.as_rdf(lod, repo.type_name, repo.id_field)
+        summary.triples = len(graph)
+        if repo.output:
+            output = self.resolve(repo.output)
+            os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+            graph.serialize(destination=output, format=repo.format)
+            summary.output = output
+
+    def run(self) -> BatchSummary:
+        """Run the batch.
+
+        Returns:
+            BatchSummary: the per repository and aggregate results.
+        """
+        start = time.time()
+        summary = BatchSummary(workers=self.workers)
+        repos = self.manifest.repositories
+        # (size, repo index, path) of all files of all repositories
+        tasks: List[Tuple[int, int, str]] = []
+        pending: Dict[int, int] = {}
+        results: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+        for repo_idx, repo in enumerate(repos):
+            repo_summary = RepositorySummary(name=repo.name)
+            summary.repositories.append(repo_summary)
+            files = self.expand_files(repo)
+            repo_summary.files = len(files)
+            pending[repo_idx] = len(files)
+            results[repo_idx] = {}
+            for path in files:
+                size = os.path.getsize(path)
+                repo_summary.bytes += size
+                tasks.append((size, repo_idx, path))
+        # largest files first
+        tasks.sort(key=lambda task: -task[0])
+
+        def finish(repo_idx: int):
+            repo = repos[repo_idx]
+            repo_summary = summary.repositories[repo_idx]
+            file_lods = results.pop(repo_idx)
+            lod = [item for path in sorted(file_lods) for item in file_lods[path]]
+            repo_summary.entities = len(lod)
+            try:
+                self.write_repository(repo, lod, repo_summary)
+            except Exception as ex:
+                repo_summary.error = str(ex)
+            if self.debug:
+                print(
+                    f"{repo.name}: {repo_summary.entities} entities → {repo_summary.output}"
+                )
+
+        for repo_idx, count in pending.items():
+            if count == 0:
+                finish(repo_idx)
+
+        limits = asdict(self.limits)
+        if self.workers == 0:
+            init_worker(limits, self.scan_bytes)
+            executor = InlineExecutor()
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=init_worker,
+                initargs=(limits, self.scan_bytes),
+            )
+
+        def collect(future: Future, repo_idx: int, path: str):
+            repo_summary = summary.repositories[repo_idx]
+            try:
+                lod, markup_count, skipped_count = future.result()
+                results[repo_idx][path] = lod
+                repo_summary.markups += markup_count
+                repo_summary.skipped += skipped_count
+            except Exception as ex:
+                repo_summary.error = f"{path}: {ex}"
+            pending[repo_idx] -= 1
+            if pending[repo_idx] == 0:
+                finish(repo_idx)
+
+        with executor:
+            # bound the submitted futures so that memory does not grow with
+            # the number of files of the manifest
+            in_flight: Dict[Future, Tuple[int, str]] = {}
+            for _size, repo_idx, path in tasks:
+                if len(in_flight) >= self.max_in_flight:
+                    done, _not_done = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future, *in_flight.pop(future))
+                in_flight[executor.submit(extract_file, path)] = (repo_idx, path)
+            while in_flight:
+                done, _not_done = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future, *in_flight.pop(future))
+
+        for repo_summary in summary.repositories:
+            summary.files += repo_summary.files
+            summary.bytes += repo_summary.bytes
+            summary.markups += repo_summary.markups
+            summary.skipped += repo_summary.skipped
+            summary.entities += repo_summary.entities
+            summary.triples += repo_summary.triples
+            if repo_summary.error:
+                summary.errors += 1
+        summary.seconds = time.time() - start
+        if self.manifest.summary:
+            summary.save_to_yaml_file(self.resolve(self.manifest.summary))
+        return summary
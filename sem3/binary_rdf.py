@@ -0,0 +1,389 @@
+"""
+```yaml
+# 🌐🕸
+binary_rdf:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: streaming dictionary encoded binary RDF (sem3b) writer and reader for semantify³.
+```
+"""
+
+import io
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import RDF
+
+from sem3.dedup import TripleDeduplicator
+
+Triple = Tuple[Any, Any, Any]
+
+# file signature with format version
+MAGIC = b"SEM3B\x01"
+
+# record tags
+TAG_PREFIX = 0
+TAG_TERM = 1
+TAG_TRIPLE = 2
+
+# term kinds
+KIND_IRI = 0
+KIND_LITERAL = 1
+KIND_TYPED_LITERAL = 2
+KIND_LANG_LITERAL = 3
+
+
+def write_varint(buf: bytearray, value: int):
+    """Append an unsigned LEB128 varint."""
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def zigzag(value: int) -> int:
+    """Map a signed to an unsigned int: 0, -1, 1, -2 … → 0, 1, 2, 3 …"""
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+class BinaryRDFWriter:
+    """Write triples as a sem3b stream.
+
+    The stream is a sequence of records:
+        prefix: IRI prefix string, gets the next prefix id
+        term: kind and string (IRI: prefix id + local part, typed literal:
+            datatype term id, language literal: language tag), gets the next
+            term id
+        triple: zigzag varint deltas of the subject, predicate and object
+            term ids to the previous triple
+
+    Terms and prefixes are defined just before their first use, so the
+    stream can be written and read without seeking. Triples repeating a
+    previous triple are dropped - within the memory ceiling of the given
+    deduplicator or with an unbounded set of term id triples - unless
+    deduplicate is False.
+    """
+
+    def __init__(
+        self,
+        out: BinaryIO,
+        flush_size: int = 1 << 16,
+        dedup: Optional[TripleDeduplicator] = None,
+        deduplicate: bool = True,
+    ):
+        """Initialize the writer and write the file signature.
+
+        Args:
+            out: the binary stream to write to.
+            flush_size: the buffer size in bytes after which the buffer is written.
+            dedup: the deduplicator for the written triples (default: in memory set).
+            deduplicate: if False write repeated triples as well.
+        """
+        self.out = out
+        self.flush_size = flush_size
+        self.dedup = dedup
+        self.deduplicate = deduplicate
+        self.buf = bytearray(MAGIC)
+        self.prefixes: Dict[str, int] = {}
+        self.terms: Dict[Any, int] = {}
+        self.seen = set()
+        self.last = (0, 0, 0)
+        self.triple_count = 0
+
+    def __enter__(self) -> "BinaryRDFWriter":
+        return self
+
+    def __exit__(self, *_args):
+        self.close()
+
+    def write_string(self, value: str):
+        data = value.encode("utf-8")
+        write_varint(self.buf, len(data))
+        self.buf += data
+
+    def prefix_id(self, prefix: str) -> int:
+        """Get the id of an IRI prefix - defining it if needed (0 = no prefix)."""
+        if not prefix:
+            return 0
+        pid = self.prefixes.get(prefix)
+        if pid is None:
+            pid = len(self.prefixes) + 1
+            self.prefixes[prefix] = pid
+            write_varint(self.buf, TAG_PREFIX)
+            self.write_string(prefix)
+        return pid
+
+    def term_id(self, term: Any) -> int:
+        """Get the id of a term - defining it if needed."""
+        # Literals of different datatype/language compare unequal as keys
+        tid = self.terms.get(term)
+        if tid is not None:
+            return tid
+        buf = self.buf
+        if isinstance(term, Literal):
+            if term.language:
+                record = (KIND_LANG_LITERAL, term.language)
+            elif term.datatype:
+                record = (KIND_TYPED_LITERAL, self.term_id(URIRef(term.datatype)))
+            else:
+                record = (KIND_LITERAL, None)
+            write_varint(buf, TAG_TERM)
+            write_varint(buf, record[0])
+            if record[0] == KIND_LANG_LITERAL:
+                self.write_string(record[1])
+            elif record[0] == KIND_TYPED_LITERAL:
+                write_varint(buf, record[1])
+            self.write_string(str(term))
+        elif isinstance(term, URIRef):
+            iri = str(term)
+            cut = max(iri.rfind("/"), iri.rfind("#")) + 1
+            pid = self.prefix_id(iri[:cut])
+            write_varint(buf, TAG_TERM)
+            write_varint(buf, KIND_IRI)
+            write_varint(buf, pid)
+            self.write_string(iri[cut:])
+        else:
+            raise ValueError(f"sem3b can not encode {type(term).__name__} {term}")
+        tid = len(self.terms)
+        self.terms[term] = tid
+        return tid
+
+    def write_triple(self, triple: Triple):
+        """Write a single triple."""
+        s, p, o = triple
+        ids = (self.term_id(s), self.term_id(p), self.term_id(o))
+        if self.deduplicate:
+            if self.dedup is not None:
+                if not self.dedup.add(b"%d %d %d" % ids):
+                    return
+            elif ids in self.seen:
+                return
+            else:
+                self.seen.add(ids)
+        buf = self.buf
+        write_varint(buf, TAG_TRIPLE)
+        for tid, last in zip(ids, self.last):
+            write_varint(buf, zigzag(tid - last))
+        self.last = ids
+        self.triple_count += 1
+        if len(buf) >= self.flush_size:
+            self.flush()
+
+    def write_all(self, triples: Iterable[Triple]):
+        for triple in triples:
+            self.write_triple(triple)
+
+    def flush(self):
+        self.out.write(self.buf)
+        self.buf = bytearray()
+
+    def close(self):
+        """Write the buffered records - the stream is not closed."""
+        self.flush()
+        self.out.flush()
+
+
+class BinaryRDFReader:
+    """Read a sem3b stream back into triples, an rdflib Graph or a list of dicts.
+
+    Records are decoded incrementally from a buffered stream so memory is
+    bounded by the term dictionary, not by the file size.
+    """
+
+    def __init__(self, source: Union[bytes, str, BinaryIO], chunk_size: int = 1 << 16):
+        """Initialize the reader.
+
+        Args:
+            source: the content of a sem3b file, its path or a binary stream -
+                a stream can only be iterated once.
+            chunk_size: the number of bytes to read at a time.
+
+        Raises:
+            ValueError: if the source is not a sem3b stream.
+        """
+        self.chunk_size = chunk_size
+        self.data: Optional[bytes] = None
+        self.path: Optional[str] = None
+        self.stream: Optional[BinaryIO] = None
+        if isinstance(source, (bytes, bytearray)):
+            self.data = bytes(source)
+            header = self.data[: len(MAGIC)]
+        elif isinstance(source, str):
+            self.path = source
+            with open(source, "rb") as f:
+                header = f.read(len(MAGIC))
+        else:
+            self.stream = source
+            header = source.read(len(MAGIC))
+        if header != MAGIC:
+            raise ValueError("not a sem3b stream")
+
+    @classmethod
+    def from_file(cls, path: str) -> "BinaryRDFReader":
+        return cls(path)
+
+    def open(self) -> Tuple[BinaryIO, bool]:
+        """Open the stream positioned after the signature.
+
+        Returns:
+            Tuple[BinaryIO, bool]: the stream and whether it is to be closed.
+        """
+        if self.data is not None:
+            stream: BinaryIO = io.BytesIO(self.data)
+        elif self.path is not None:
+            stream = open(self.path, "rb")
+        else:
+            return self.stream, False
+        stream.read(len(MAGIC))
+        return stream, True
+
+    def iter_triples(self) -> Iterator[Triple]:
+        """Decode the triples.
+
+        Yields:
+            Triple: rdflib (subject, predicate, object) terms.
+
+        Raises:
+            ValueError: if the stream is invalid or truncated.
+        """
+        stream, owned = self.open()
+        try:
+            yield from self.decode(stream)
+        finally:
+            if owned:
+                stream.close()
+
+    def decode(self, stream: BinaryIO) -> Iterator[Triple]:
+        """Decode the records of the given stream chunk by chunk."""
+        data = b""
+        size = 0
+        pos = 0
+        prefixes: List[str] = [""]
+        terms: List[Any] = []
+        s = p = o = 0
+
+        # reading past the end of the buffered data raises IndexError
+        def varint() -> int:
+            nonlocal pos
+            result = 0
+            shift = 0
+            while True:
+                byte = data[pos]
+                pos += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    return result
+                shift += 7
+
+        def string() -> str:
+            nonlocal pos
+            length = varint()
+            if pos + length > size:
+                raise IndexError("incomplete string")
+            value = data[pos : pos + length].decode("utf-8")
+            pos += length
+            return value
+
+        while True:
+            chunk = stream.read(self.chunk_size)
+            if not chunk:
+                if pos < size:
+                    raise ValueError(f"truncated sem3b stream: {size - pos} bytes left")
+                return
+            data = data[pos:] + chunk
+            size = len(data)
+            pos = 0
+            while pos < size:
+                # a record incomplete in the buffer is decoded again after the next read
+                start = pos
+                try:
+                    tag = data[pos]
+                    pos += 1
+                    if tag == TAG_TRIPLE:
+                        ds, dp, do = varint(), varint(), varint()
+                    elif tag == TAG_TERM:
+                        kind = varint()
+                        if kind == KIND_IRI:
+                            prefix = prefixes[varint()]
+                            terms.append(URIRef(prefix + string()))
+                        elif kind == KIND_LITERAL:
+                            terms.append(Literal(string()))
+                        elif kind == KIND_TYPED_LITERAL:
+                            datatype = terms[varint()]
+                            terms.append(Literal(string(), datatype=datatype))
+                        elif kind == KIND_LANG_LITERAL:
+                            lang = string()
+                            terms.append(Literal(string(), lang=lang))
+                        else:
+                            raise ValueError(f"invalid sem3b term kind {kind}")
+                        continue
+                    elif tag == TAG_PREFIX:
+                        prefixes.append(string())
+                        continue
+                    else:
+                        raise ValueError(f"invalid sem3b record tag {tag}")
+                except IndexError:
+                    pos = start
+                    break
+                s += unzigzag(ds)
+                p += unzigzag(dp)
+                o += unzigzag(do)
+                yield terms[s], terms[p], terms[o]
+
+    def to_graph(self, graph: Optional[Graph] = None) -> Graph:
+        """Load the triples into the given or a new rdflib Graph."""
+        if graph is None:
+            graph = Graph()
+        graph.addN((s, p, o, graph) for s, p, o in self.iter_triples())
+        return graph
+
+    def to_lod(self, base_uri: str) -> List[Dict[str, Any]]:
+        """Load the triples as list of dicts - one dict per subject.
+
+        Properties are the predicates in the base_uri namespace, repeated
+        properties become lists; rdf:type is represented by isA - the
+        first type in the base_uri namespace if there is no isA property.
+
+        Args:
+            base_uri: the base URI the RDFDumper used.
+
+        Returns:
+            List[Dict[str, Any]]: the list of dicts in order of the subjects.
+        """
+        by_subject: Dict[Any, Dict[str, Any]] = {}
+        types: Dict[Any, str] = {}
+        for s, p, o in self.iter_triples():
+            item = by_subject.setdefault(s, {})
+            if p == RDF.type:
+                if s not in types and o.startswith(base_uri):
+                    types[s] = o[len(base_uri) :]
+                continue
+            if not p.startswith(base_uri):
+                continue
+            key = p[len(base_uri) :]
+            value = o.toPython() if isinstance(o, Literal) else str(o)
+            if key in item:
+                previous = item[key]
+                if not isinstance(previous, list):
+                    previous = item[key] = [previous]
+                previous.append(value)
+            else:
+                item[key] = value
+        for subject, type_name in types.items():
+            by_subject[subject].setdefault("isA", type_name)
+        return list(by_subject.values())
@@ -0,0 +1,251 @@
+"""
+```yaml
+# 🌐🕸
+canonical:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: canonical sorted N-Triples and grouped Turtle output via external merge sort for semantify³.
+```
+"""
+
+import heapq
+import os
+import re
+import sys
+import tempfile
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sem3.lod2rdf import RDFDumper
+
+
+class ExternalSorter:
+    """Sort and deduplicate lines in bounded memory.
+
+    Lines are buffered up to ``max_lines`` and then spilled as a sorted run
+    to a temporary file. Iterating merges the runs with ``heapq.merge`` and
+    drops adjacent duplicates - at most ``fan_in`` runs are open at a time,
+    more runs are first merged in passes into fewer, longer runs. Lines are
+    compared by code point which is the byte order of their UTF-8 encoding
+    as with ``LC_ALL=C sort -u``.
+    """
+
+    def __init__(
+        self,
+        max_lines: int = 100_000,
+        tmp_dir: Optional[str] = None,
+        fan_in: int = 64,
+    ):
+        """Initialize the sorter.
+
+        Args:
+            max_lines: maximum number of lines kept in memory.
+            tmp_dir: directory for the spill files (default: system temp dir).
+            fan_in: maximum number of runs merged at a time (open files).
+        """
+        self.max_lines = max(1, max_lines)
+        self.tmp_dir = tmp_dir
+        self.fan_in = max(2, fan_in)
+        self.buffer: List[str] = []
+        self.runs: List[str] = []
+
+    def add(self, line: str):
+        """Add a newline terminated line."""
+        self.buffer.append(line)
+        if len(self.buffer) >= self.max_lines:
+            self.spill()
+
+    def add_all(self, lines: Iterable[str]):
+        for line in lines:
+            self.add(line)
+
+    def spill(self):
+        """Write the buffer as a sorted run."""
+        if not self.buffer:
+            return
+        self.runs.append(self.write_run(sorted(self.buffer)))
+        self.buffer = []
+
+    def write_run(self, lines: Iterable[str]) -> str:
+        """Write the given sorted lines deduplicated to a new run file."""
+        fd, path = tempfile.mkstemp(prefix="sem3_sort_", suffix=".nt", dir=self.tmp_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                f.writelines(self.dedup(lines))
+        except BaseException:
+            os.remove(path)
+            raise
+        return path
+
+    def merge_runs(self, paths: List[str]) -> str:
+        """Merge the given runs into a single new run and remove them."""
+        files = [open(path, "r", encoding="utf-8", newline="\n") for path in paths]
+        try:
+            merged = self.write_run(heapq.merge(*files))
+        finally:
+            for f in files:
+                f.close()
+        for path in paths:
+            os.remove(path)
+        return merged
+
+    @staticmethod
+    def dedup(lines: Iterable[str]) -> Iterator[str]:
+        """Drop adjacent duplicates of sorted lines."""
+        previous = None
+        for line in lines:
+            if line != previous:
+                yield line
+                previous = line
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the sorted unique lines and remove the spill files."""
+        files = []
+        try:
+            # the buffer takes one slot of the final merge
+            while len(self.runs) >= self.fan_in:
+                merged = self.merge_runs(self.runs[: self.fan_in])
+                self.runs = self.runs[self.fan_in :] + [merged]
+            self.buffer.sort()
+            for path in self.runs:
+                files.append(open(path, "r", encoding="utf-8", newline="\n"))
+            yield from self.dedup(heapq.merge(self.buffer, *files))
+        finally:
+            for f in files:
+                f.close()
+            self.close()
+
+    def close(self):
+        """Remove the spill files."""
+        for path in self.runs:
+            if os.path.exists(path):
+                os.remove(path)
+        self.runs = []
+        self.buffer = []
+
+
+class CanonicalWriter:
+    """Write the triples of a list of dicts in a deterministic sorted order.
+
+    Formats:
+        ntriples: sorted unique N-Triples lines
+        turtle: the same order grouped by subject with the namespace prefix
+
+    Like the pipeline sinks the writer is called with list of dicts chunks
+    and writes the output on close.
+    """
+
+    formats = ["ntriples", "turtle"]
+    local_name_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*$")
+    # subject and predicate are IRIs or blank nodes, the object is the rest
+    ntriple_pattern = re.compile(
+        r"^(?P<s><[^>]*>|_:\S+)[ \t]+(?P<p><[^>]*>)[ \t]+(?P<o>.+?)[ \t]*\.[ \t]*\r?\n?$",
+        re.DOTALL,
+    )
+
+    def __init__(
+        self,
+        dumper: RDFDumper,
+        type_name: str,
+        id_field: Optional[str] = None,
+        output_format: str = "ntriples",
+        destination: Optional[str] = None,
+        max_lines: int = 100_000,
+    ):
+        """Initialize the writer.
+
+        Args:
+            dumper: the RDFDumper mapping the dicts to triples.
+            type_name: RDF type name for resources.
+            id_field: Field to use as resource identifier.
+            output_format: ntriples or turtle.
+            destination: the file path to write to (None → stdout).
+            max_lines: maximum number of lines kept in memory while sorting.
+        """
+        if output_format not in self.formats:
+            raise ValueError(f"canonical output does not support {output_format}")
+        self.dumper = dumper
+        self.type_name = type_name
+        self.id_field = id_field
+        self.output_format = output_format
+        self.destination = destination
+        self.sorter = ExternalSorter(max_lines)
+        self.idx = 0
+        self.triples = 0
+
+    def __call__(self, lod: List[Dict[str, Any]]):
+        dumper = self.dumper
+        dumper.id_minter.prepare(lod, self.type_name, self.id_field)
+        for item in lod:
+            for triple in dumper.iter_resource_triples(
+                item, self.type_name, self.id_field, self.idx
+            ):
+                self.sorter.add(dumper.to_ntriple(triple))
+            self.idx += 1
+
+    def write(self, lod: List[Dict[str, Any]]):
+        """Write the canonical output of the given list of dicts."""
+        self(lod)
+        self.close()
+
+    def close(self):
+        """Merge the sorted runs into the output."""
+        dumper = self.dumper
+        self.sorter.add_all(
+            dumper.to_ntriple(triple) for triple in dumper.iter_hierarchy_triples()
+        )
+        if self.destination:
+            with open(self.destination, "w", encoding="utf-8", newline="\n") as out:
+                self.write_lines(out)
+        else:
+            self.write_lines(sys.stdout)
+
+    def write_lines(self, out: IO[str]):
+        if self.output_format == "ntriples":
+            for line in self.sorter:
+                out.write(line)
+                self.triples += 1
+        else:
+            self.write_turtle(self.sorter, out)
+
+    @classmethod
+    def split_ntriple(cls, line: str) -> Tuple[str, str, str]:
+        """Split an N-Triples line into subject, predicate and object terms.
+
+        Raises:
+            ValueError: if the line is not a triple.
+        """
+        match = cls.ntriple_pattern.match(line)
+        if match is None:
+            raise ValueError(f"invalid N-Triples line: {line!r}")
+        return match.group("s"), match.group("p"), match.group("o")
+
+    def turtle_term(self, term: str) -> str:
+        """Abbreviate an N-Triples IRI in the namespace to a prefixed name."""
+        base_uri = self.dumper.base_uri
+        if term.startswith(f"<{base_uri}"):
+            local = term[len(base_uri) + 1 : -1]
+            if self.local_name_pattern.match(local):
+                return f"{self.dumper.namespace_prefix}:{local}"
+        return term
+
+    def write_turtle(self, lines: Iterable[str], out: IO[str]):
+        """Write sorted N-Triples lines as Turtle grouped by subject."""
+        out.write(
+            f"@prefix {self.dumper.namespace_prefix}: <{self.dumper.base_uri}> .\n"
+        )
+        subject = None
+        for line in lines:
+            s, p, o = self.split_ntriple(line)
+            if s != subject:
+                if subject is not None:
+                    out.write(" .\n")
+                out.write(
+                    f"\n{self.turtle_term(s)}\n    {self.turtle_term(p)} {self.turtle_term(o)}"
+                )
+                subject = s
+            else:
+                out.write(f" ;\n    {self.turtle_term(p)} {self.turtle_term(o)}")
+            self.triples += 1
+        if subject is not None:
+            out.write(" .\n")
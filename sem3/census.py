@@ -0,0 +1,186 @@
+"""
+```yaml
+# 🌐🕸
+census:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: marker density census of source trees by fence scan only without parsing for semantify³.
+```
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from basemkit.yamlable import lod_storable
+
+from sem3.extractor import Extractor
+from sem3.notebook import is_notebook
+from sem3.storable import NoneDefaults
+
+# bytes read and blocks by language of a single file
+FileCount = Tuple[int, Dict[str, int]]
+
+
+@lod_storable
+@dataclass
+class CensusCount(NoneDefaults):
+    """Counts of a group of scanned files."""
+
+    none_defaults = {"blocks_by_lang": dict}
+
+    files: int = 0
+    marked_files: int = 0
+    blocks: int = 0
+    blocks_by_lang: Optional[Dict[str, int]] = None
+    bytes: int = 0
+
+    def add(self, size: int, blocks_by_lang: Dict[str, int]):
+        """Add the counts of a single file."""
+        self.files += 1
+        self.bytes += size
+        if blocks_by_lang:
+            self.marked_files += 1
+        for lang, count in blocks_by_lang.items():
+            self.blocks += count
+            self.blocks_by_lang[lang] = self.blocks_by_lang.get(lang, 0) + count
+
+
+@lod_storable
+@dataclass
+class CensusReport(NoneDefaults):
+    """Result of a census run."""
+
+    none_defaults = {
+        "total": CensusCount,
+        "by_directory": dict,
+        "by_extension": dict,
+    }
+
+    total: Optional[CensusCount] = None
+    by_directory: Optional[Dict[str, CensusCount]] = None
+    by_extension: Optional[Dict[str, CensusCount]] = None
+    errors: int = 0
+    seconds: float = 0.0
+    mb_per_second: float = 0.0
+    files_per_second: float = 0.0
+
+
+class Census:
+    """Count files, marked files and markup blocks without parsing them.
+
+    Only the marker search and the fence scan of the comment profile of
+    each file are run - no YAML, SiDIF or RDF. Files are read by a thread
+    pool, files without the marker cost a single byte search.
+    """
+
+    def __init__(self, extractor: Extractor, threads: int = 8, debug: bool = False):
+        """Initialize the census.
+
+        Args:
+            extractor: the extractor providing marker, comment profiles and scan_bytes.
+            threads: the number of reading threads.
+            debug: if True print debug output.
+        """
+        self.extractor = extractor
+        self.threads = max(1, threads)
+        self.debug = debug
+
+    def count_blocks(self, data: bytes, filepath: str) -> Dict[str, int]:
+        """Count the marked blocks of the given file content by language."""
+        extractor = self.extractor
+        counts: Dict[str, int] = {}
+        profile = extractor.profiles.for_path(filepath)
+        for match in profile.iter_byte_blocks(data):
+            start = extractor.find_code_start(
+                data,
+                match.group("prefix"),
+                match.start("content"),
+                match.end("content"),
+            )
+            if start is not None:
+                lang = match.group("lang").decode("ascii")
+                counts[lang] = counts.get(lang, 0) + 1
+        return counts
+
+    def scan_file(self, filepath: str) -> Optional[FileCount]:
+        """Scan a single file.
+
+        Args:
+            filepath: the path of the file.
+
+        Returns:
+            Optional[FileCount]: the bytes read and blocks by language - None
+            if the file could not be read.
+        """
+        extractor = self.extractor
+        try:
+            if extractor.scan_bytes and not is_notebook(filepath):
+                data = extractor.read_header(filepath)
+            else:
+                with open(filepath, "rb") as f:
+                    data = f.read()
+        except OSError as ex:
+            if self.debug:
+                print(f"census: can not read {filepath}: {ex}")
+            return None
+        if is_notebook(filepath):
+            counts: Dict[str, int] = {}
+            for markup in extractor.extract_from_notebook(data, filepath):
+                counts[markup.lang] = counts.get(markup.lang, 0) + 1
+            return len(data), counts
+        if extractor.marker_bytes not in data:
+            return len(data), {}
+        return len(data), self.count_blocks(data, filepath)
+
+    def run(self, files: Iterable[str], chunk_size: int = 1024) -> CensusReport:
+        """Run the census on the given files.
+
+        Args:
+            files: the file paths.
+            chunk_size: the number of files handed to the thread pool at a time.
+
+        Returns:
+            CensusReport: the counts and throughput.
+        """
+        report = CensusReport()
+        start = time.time()
+        by_directory: Dict[str, CensusCount] = {}
+        by_extension: Dict[str, CensusCount] = {}
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            chunk: List[str] = []
+            for filepath in files:
+                chunk.append(filepath)
+                if len(chunk) >= chunk_size:
+                    self.add_chunk(report, executor, chunk, by_directory, by_extension)
+                    chunk = []
+            self.add_chunk(report, executor, chunk, by_directory, by_extension)
+        report.by_directory = dict(sorted(by_directory.items()))
+        report.by_extension = dict(sorted(by_extension.items()))
+        report.seconds = time.time() - start
+        if report.seconds > 0:
+            report.mb_per_second = report.total.bytes / report.seconds / 1e6
+            report.files_per_second = report.total.files / report.seconds
+        return report
+
+    def add_chunk(
+        self,
+        report: CensusReport,
+        executor: ThreadPoolExecutor,
+        chunk: List[str],
+        by_directory: Dict[str, CensusCount],
+        by_extension: Dict[str, CensusCount],
+    ):
+        for filepath, result in zip(chunk, executor.map(self.scan_file, chunk)):
+            if result is None:
+                report.errors += 1
+                continue
+            size, counts = result
+            directory = os.path.dirname(filepath) or "."
+            extension = os.path.splitext(filepath)[1].lower() or "(none)"
+            report.total.add(size, counts)
+            by_directory.setdefault(directory, CensusCount()).add(size, counts)
+            by_extension.setdefault(extension, CensusCount()).add(size, counts)
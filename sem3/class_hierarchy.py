@@ -0,0 +1,180 @@
+"""
+```yaml
+# 🌐🕸
+class_hierarchy:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: materialized transitive closure of isA class hierarchies for semantify³.
+```
+"""
+
+import os
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import yaml
+from rdflib import Namespace, URIRef
+from rdflib.namespace import RDFS
+
+from sem3.extractor import Extractor
+
+
+class ClassHierarchy:
+    """Index of the transitive closure of subClassOf declarations.
+
+    The hierarchy can be declared in a plain YAML file::
+
+        PythonTestModule: PythonModule
+        PythonModule: [Module, SourceFile]
+
+    or as YAML/SiDIF markup of entities with a ``subClassOf`` property e.g.::
+
+        PythonTestModule isA Class
+        "PythonModule" is subClassOf of it
+
+    The closure is computed once on first use, afterwards superclass,
+    subclass and subsumption lookups are dict/set hits.
+    """
+
+    def __init__(self, debug: bool = False):
+        """Initialize an empty hierarchy.
+
+        Args:
+            debug: if True print debug output.
+        """
+        self.debug = debug
+        self.parents: Dict[str, Set[str]] = {}
+        self._ancestors: Optional[Dict[str, Tuple[str, ...]]] = None
+        self._descendants: Optional[Dict[str, Set[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def add(self, class_name: str, superclass: str):
+        """Declare class_name as a direct subclass of superclass."""
+        if class_name == superclass:
+            return
+        self.parents.setdefault(class_name, set()).add(superclass)
+        self.parents.setdefault(superclass, set())
+        # invalidate the closure
+        self._ancestors = None
+        self._descendants = None
+
+    def add_lod(self, lod: List[Dict[str, Any]]) -> int:
+        """Add the subClassOf declarations of the entities of a list of dicts.
+
+        Args:
+            lod: the list of dicts - entities need a name and a subClassOf
+                string or list of strings.
+
+        Returns:
+            int: the number of declarations added.
+        """
+        count = 0
+        for item in lod:
+            superclasses = item.get("subClassOf")
+            name = item.get("name")
+            if superclasses is None or name is None:
+                continue
+            if not isinstance(superclasses, list):
+                superclasses = [superclasses]
+            for superclass in superclasses:
+                self.add(str(name), str(superclass))
+                count += 1
+        return count
+
+    def add_mapping(self, mapping: Dict[str, Any]):
+        """Add a class → superclass(es) mapping as read from a YAML file."""
+        for name, value in mapping.items():
+            if isinstance(value, dict):
+                value = value.get("subClassOf")
+            if value is None:
+                continue
+            for superclass in value if isinstance(value, list) else [value]:
+                self.add(str(name), str(superclass))
+
+    @classmethod
+    def load(cls, path: str, debug: bool = False) -> "ClassHierarchy":
+        """Load a hierarchy from a YAML file or a file with YAML/SiDIF markup.
+
+        Args:
+            path: the file path.
+            debug: if True print debug output.
+
+        Returns:
+            ClassHierarchy: the hierarchy.
+        """
+        hierarchy = cls(debug=debug)
+        extractor = Extractor(debug=debug)
+        markups = extractor.extract_from_file(path)
+        if markups:
+            hierarchy.add_lod(extractor.markups_to_lod(markups))
+        elif os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+            with open(path, "r", encoding="utf-8") as f:
+                mapping = yaml.safe_load(f)
+            if isinstance(mapping, dict):
+                hierarchy.add_mapping(mapping)
+        if debug:
+            print(f"class hierarchy: {len(hierarchy)} classes from {path}")
+        return hierarchy
+
+    def build(self):
+        """Compute the transitive closure (cycle safe)."""
+        ancestors: Dict[str, Tuple[str, ...]] = {}
+        for start in self.parents:
+            seen: Set[str] = set()
+            stack = list(self.parents[start])
+            while stack:
+                current = stack.pop()
+                if current in seen or current == start:
+                    continue
+                seen.add(current)
+                stack.extend(self.parents.get(current, ()))
+            ancestors[start] = tuple(sorted(seen))
+        descendants: Dict[str, Set[str]] = {}
+        for name, supers in ancestors.items():
+            for superclass in supers:
+                descendants.setdefault(superclass, set()).add(name)
+        self._ancestors = ancestors
+        self._descendants = descendants
+
+    @property
+    def ancestors(self) -> Dict[str, Tuple[str, ...]]:
+        """The closure: class → all its (transitive) superclasses."""
+        if self._ancestors is None:
+            self.build()
+        return self._ancestors
+
+    def superclasses(self, class_name: str) -> Tuple[str, ...]:
+        """Get all transitive superclasses of the given class."""
+        return self.ancestors.get(class_name, ())
+
+    def subclasses(self, class_name: str) -> Set[str]:
+        """Get all transitive subclasses of the given class."""
+        if self._descendants is None:
+            self.build()
+        return self._descendants.get(class_name, set())
+
+    def is_subclass(self, class_name: str, superclass: str) -> bool:
+        """Check whether class_name is superclass or one of its subclasses."""
+        return class_name == superclass or class_name in self.subclasses(superclass)
+
+    def select(
+        self, lod: List[Dict[str, Any]], class_name: str
+    ) -> List[Dict[str, Any]]:
+        """Get the entities of the given class or one of its subclasses."""
+        classes = self.subclasses(class_name) | {class_name}
+        return [item for item in lod if item.get("isA") in classes]
+
+    def iter_triples(self, ns: Namespace) -> Iterator[Tuple[URIRef, URIRef, URIRef]]:
+        """Generate the materialized rdfs:subClassOf triples of the closure.
+
+        Args:
+            ns: the namespace of the class IRIs.
+
+        Yields:
+            Tuple[URIRef, URIRef, URIRef]: (class, rdfs:subClassOf, superclass)
+        """
+        for name, supers in self.ancestors.items():
+            for superclass in supers:
+                yield ns[name], RDFS.subClassOf, ns[superclass]
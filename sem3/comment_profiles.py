@@ -0,0 +1,135 @@
+"""
+```yaml
+# 🌐🕸
+comment_profiles:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: per file extension comment syntax profiles with precompiled fence scanners for semantify³.
+```
+"""
+
+import os
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class CommentProfile:
+    """The line comment prefixes a markup fence may have in a type of file.
+
+    Fences in block comments (``/* */``, ``<!-- -->``, ``--[[ ]]``) are
+    expected on lines of their own - either unprefixed or with the ``*``
+    continuation prefix of C style comments. The closing fence must repeat
+    the prefix of the opening fence.
+    """
+
+    def __init__(self, name: str, prefixes: List[str], extensions: List[str]):
+        """Initialize and compile the scanners of the profile.
+
+        Args:
+            name: the name of the profile.
+            prefixes: the line comment prefixes e.g. ``--`` or ``%``.
+            extensions: the lower case file extensions including the dot.
+        """
+        self.name = name
+        self.prefixes = prefixes
+        self.extensions = extensions
+        # longest first so that e.g. "//" wins over "/"
+        alternatives = "|".join(
+            re.escape(prefix) for prefix in sorted(prefixes, key=len, reverse=True)
+        )
+        prefix_re = rf"^[ \t]*(?:{alternatives})?[ \t]*" if prefixes else r"^[ \t]*"
+        block_re = (
+            rf"(?P<prefix>{prefix_re})```(?P<lang>yaml|sidif)\s*\n"
+            r"(?P<content>.*?)"
+            r"\n(?P=prefix)```"
+        )
+        flags = re.DOTALL | re.MULTILINE
+        self.text_pattern = re.compile(block_re, flags)
+        self.byte_pattern = re.compile(block_re.encode("utf-8"), flags)
+        # opening fences for the header only scan
+        self.fence_pattern = re.compile(
+            rf"(?P<prefix>{prefix_re})```(?:yaml|sidif)".encode("utf-8"), re.MULTILINE
+        )
+
+    def iter_byte_blocks(self, buf, end: Optional[int] = None) -> Iterator[re.Match]:
+        """Find the blocks of a byte buffer like byte_pattern.finditer.
+
+        The regex is only tried at the starts of lines containing a fence
+        instead of at every line of the buffer.
+
+        Args:
+            buf: the bytes or memory map to scan.
+            end: the end offset of the scan (default: end of buf).
+
+        Yields:
+            re.Match: the byte_pattern matches.
+        """
+        if end is None:
+            end = len(buf)
+        floor = 0
+        pos = buf.find(b"```", 0, end)
+        while pos != -1:
+            line_start = buf.rfind(b"\n", 0, pos) + 1
+            # a line started within the previous block can not start a block
+            match = None
+            if line_start >= floor:
+                match = self.byte_pattern.match(buf, line_start, end)
+            if match:
+                yield match
+                floor = match.end()
+                pos = buf.find(b"```", floor, end)
+            else:
+                eol = buf.find(b"\n", pos, end)
+                pos = -1 if eol == -1 else buf.find(b"```", eol, end)
+
+    def __repr__(self) -> str:
+        return f"CommentProfile({self.name}, {self.prefixes})"
+
+
+class CommentProfiles:
+    """Registry of comment profiles by file extension.
+
+    The profiles are compiled once when the registry is created. Files with
+    an unknown extension get the default profile with the ``#`` and ``//``
+    prefixes.
+    """
+
+    # name: (blank separated line comment prefixes, blank separated extensions)
+    definitions = {
+        "default": ("# //", ""),
+        "hash": ("#", ".py .pyi .sh .bash .rb .pl .r .yaml .yml .toml .cfg .ini"),
+        "c": (
+            "// *",
+            ".c .h .cc .cpp .hpp .java .js .ts .go .rs .cs .kt .scala .swift .php .css",
+        ),
+        "dashdash": ("--", ".sql .lua .hs .ada .adb .ads .elm"),
+        "percent": ("%", ".tex .sty .cls .bib .erl .m"),
+        "markup": ("", ".html .htm .xml .xhtml .svg .md .vue"),
+    }
+
+    def __init__(self, definitions: Optional[Dict[str, Tuple[str, str]]] = None):
+        """Initialize and compile the profiles.
+
+        Args:
+            definitions: name → (prefixes, extensions) - the built-in ones if None.
+        """
+        if definitions is None:
+            definitions = self.definitions
+        self.profiles: Dict[str, CommentProfile] = {}
+        self.by_extension: Dict[str, CommentProfile] = {}
+        for name, (prefixes, extensions) in definitions.items():
+            profile = CommentProfile(name, prefixes.split(), extensions.split())
+            self.profiles[name] = profile
+            for extension in profile.extensions:
+                self.by_extension[extension] = profile
+        self.default = self.profiles.get("default") or CommentProfile(
+            "default", ["#", "//"], []
+        )
+
+    def for_path(self, path: Optional[str]) -> CommentProfile:
+        """Get the profile for the given file path."""
+        if not path:
+            return self.default
+        extension = os.path.splitext(path)[1].lower()
+        return self.by_extension.get(extension, self.default)
@@ -0,0 +1,189 @@
+"""
+```yaml
+# 🌐🕸
+compact_markup:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: compact offset based markup representation with lazily materialized code for semantify³.
+```
+"""
+
+import mmap
+from collections import OrderedDict
+from typing import AnyStr, Dict, List, Optional
+
+
+def strip_prefix(line: AnyStr, prefix: AnyStr, bare_prefix: AnyStr) -> AnyStr:
+    """Strip the comment/indentation prefix of a markup line (str or bytes).
+
+    Args:
+        line: the line to clean.
+        prefix: the prefix found before the opening fence.
+        bare_prefix: the prefix without trailing whitespace.
+
+    Returns:
+        str: the line without its prefix (unchanged if the prefix does not match).
+    """
+    if line.startswith(prefix):
+        return line[len(prefix) :]
+    if line.startswith(bare_prefix):
+        # lines that are just the prefix (or prefix w/o trailing space)
+        return line[len(bare_prefix) :]
+    return line
+
+
+class SourceTable:
+    """Registry of source files by id with lazily opened read-only memory maps.
+
+    Only a bounded number of maps is kept open at a time so that scanning
+    millions of files does not exhaust file descriptors.
+    """
+
+    def __init__(self, max_open: int = 64):
+        """Initialize the source table.
+
+        Args:
+            max_open: maximum number of memory maps to keep open.
+        """
+        self.max_open = max_open
+        self.paths: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.maps: "OrderedDict[int, mmap.mmap]" = OrderedDict()
+
+    def add(self, path: str) -> int:
+        """Register the given path.
+
+        Args:
+            path: the file path.
+
+        Returns:
+            int: the file id of the path.
+        """
+        file_id = self.ids.get(path)
+        if file_id is None:
+            file_id = len(self.paths)
+            self.paths.append(path)
+            self.ids[path] = file_id
+        return file_id
+
+    def path(self, file_id: int) -> str:
+        """Get the path of the given file id."""
+        return self.paths[file_id]
+
+    def buffer(self, file_id: int) -> Optional[mmap.mmap]:
+        """Get the memory map of the given file id.
+
+        Args:
+            file_id: the id of the file.
+
+        Returns:
+            Optional[mmap.mmap]: the read-only map or None for empty files.
+        """
+        buf = self.maps.get(file_id)
+        if buf is not None:
+            self.maps.move_to_end(file_id)
+            return buf
+        with open(self.paths[file_id], "rb") as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can not be mapped
+                return None
+        self.maps[file_id] = buf
+        while len(self.maps) > self.max_open:
+            _old_id, old_buf = self.maps.popitem(last=False)
+            old_buf.close()
+        return buf
+
+    def close(self):
+        """Close all open memory maps."""
+        for buf in self.maps.values():
+            buf.close()
+        self.maps.clear()
+
+    def __enter__(self) -> "SourceTable":
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+
+class CompactMarkup:
+    """A markup recorded as byte offsets into its source file.
+
+    Offers the same ``lang``, ``code`` and ``source`` attributes as
+    :class:`sem3.extractor.Markup` but the cleaned code is only materialized
+    from the memory mapped source when it is asked for.
+    """
+
+    __slots__ = (
+        "table",
+        "file_id",
+        "fence_start",
+        "start",
+        "end",
+        "prefix_len",
+        "lang",
+        "line_num",
+    )
+
+    def __init__(
+        self,
+        table: SourceTable,
+        file_id: int,
+        fence_start: int,
+        start: int,
+        end: int,
+        prefix_len: int,
+        lang: str,
+        line_num: int,
+    ):
+        """Initialize the compact markup.
+
+        Args:
+            table: the source table the file id refers to.
+            file_id: the id of the source file.
+            fence_start: byte offset of the line with the opening fence.
+            start: byte offset of the first code line (after the marker line).
+            end: byte offset of the end of the code (before the closing fence).
+            prefix_len: byte length of the prefix before the opening fence.
+            lang: the language (yaml/sidif).
+            line_num: the line number of the opening fence.
+        """
+        self.table = table
+        self.file_id = file_id
+        self.fence_start = fence_start
+        self.start = start
+        self.end = end
+        self.prefix_len = prefix_len
+        self.lang = lang
+        self.line_num = line_num
+
+    @property
+    def source(self) -> str:
+        return f"{self.table.path(self.file_id)}:{self.line_num}"
+
+    @property
+    def prefix(self) -> str:
+        buf = self.table.buffer(self.file_id)
+        prefix = buf[self.fence_start : self.fence_start + self.prefix_len]
+        return prefix.decode("utf-8")
+
+    @property
+    def code(self) -> str:
+        """Materialize the cleaned code from the memory mapped source."""
+        buf = self.table.buffer(self.file_id)
+        raw = buf[self.start : self.end].decode("utf-8")
+        # line breaks as read in text mode by Markup - other separators such
+        # as \x0b or \u2028 stay part of their line
+        raw = raw.replace("\r\n", "\n").replace("\r", "\n")
+        prefix = self.prefix
+        bare_prefix = prefix.rstrip()
+        code = "\n".join(
+            strip_prefix(line, prefix, bare_prefix) for line in raw.split("\n")
+        )
+        return code.strip()
+
+    def __repr__(self) -> str:
+        return f"CompactMarkup({self.lang} {self.source} [{self.start}:{self.end}])"
@@ -0,0 +1,171 @@
+"""
+```yaml
+# 🌐🕸
+dedup:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: bounded memory deduplication of streamed triples with disk spill and bloom pre-filter for semantify³.
+```
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+from typing import Iterable, Iterator, Optional, Set, Union
+
+
+class BloomFilter:
+    """Bit array membership pre-filter - no false negatives."""
+
+    def __init__(self, size_bytes: int, hash_count: int = 7):
+        """Initialize the filter.
+
+        Args:
+            size_bytes: the size of the bit array in bytes.
+            hash_count: the number of bit positions per key.
+        """
+        self.bits = bytearray(max(1, size_bytes))
+        self.bit_count = len(self.bits) * 8
+        self.hash_count = hash_count
+
+    def positions(self, digest: bytes) -> Iterator[int]:
+        # double hashing on the two halves of the (already random) digest
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.bit_count
+
+    def add(self, digest: bytes):
+        for pos in self.positions(digest):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(
+            self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self.positions(digest)
+        )
+
+
+class TripleDeduplicator:
+    """Drop repeated triples of a stream within a memory ceiling.
+
+    Each triple is keyed by a 128 bit BLAKE2b digest of its N-Triples line
+    (or any other canonical str/bytes key). Digests are kept in a set up to
+    the memory ceiling, then spilled to a temporary SQLite table. Keys not
+    in memory are confirmed against the table - an optional bloom filter of
+    the spilled digests skips that lookup for most new triples.
+    """
+
+    # estimated bytes per in memory digest: bytes object plus set slot
+    entry_bytes = 100
+
+    def __init__(
+        self,
+        max_memory_mb: float = 64,
+        bloom_mb: float = 0,
+        tmp_dir: Optional[str] = None,
+    ):
+        """Initialize the deduplicator.
+
+        Args:
+            max_memory_mb: the memory ceiling of the in memory digest set in MB.
+            bloom_mb: the size of the bloom filter in MB (0: no bloom filter).
+            tmp_dir: directory for the spill database (default: system temp dir).
+        """
+        self.max_entries = max(1, int(max_memory_mb * 1_000_000 / self.entry_bytes))
+        self.bloom = BloomFilter(int(bloom_mb * 1_000_000)) if bloom_mb > 0 else None
+        self.tmp_dir = tmp_dir
+        self.seen: Set[bytes] = set()
+        self.db_path: Optional[str] = None
+        self.conn: Optional[sqlite3.Connection] = None
+        self.unique = 0
+        self.duplicates = 0
+        self.spills = 0
+        self.lookups = 0
+
+    @staticmethod
+    def digest(key: Union[str, bytes]) -> bytes:
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+        return hashlib.blake2b(key, digest_size=16).digest()
+
+    def add(self, key: Union[str, bytes]) -> bool:
+        """Register a key.
+
+        Args:
+            key: the canonical key of the triple e.g. its N-Triples line.
+
+        Returns:
+            bool: True if the key is new, False for a duplicate.
+        """
+        digest = self.digest(key)
+        if self.contains_digest(digest):
+            self.duplicates += 1
+            return False
+        self.seen.add(digest)
+        self.unique += 1
+        if len(self.seen) >= self.max_entries:
+            self.spill()
+        return True
+
+    def contains_digest(self, digest: bytes) -> bool:
+        if digest in self.seen:
+            return True
+        if self.conn is None or (self.bloom is not None and digest not in self.bloom):
+            return False
+        self.lookups += 1
+        found = self.conn.execute(
+            "SELECT 1 FROM seen WHERE digest = ?", (digest,)
+        ).fetchone()
+        return found is not None
+
+    def __contains__(self, key: Union[str, bytes]) -> bool:
+        """Check whether a key has been registered without registering it."""
+        return self.contains_digest(self.digest(key))
+
+    def filter(self, keys: Iterable[str]) -> Iterator[str]:
+        """Yield the keys not seen before."""
+        for key in keys:
+            if self.add(key):
+                yield key
+
+    def spill(self):
+        """Move the in memory digests to the spill database."""
+        if self.conn is None:
+            fd, self.db_path = tempfile.mkstemp(
+                prefix="sem3_dedup_", suffix=".db", dir=self.tmp_dir
+            )
+            os.close(fd)
+            self.conn = sqlite3.connect(self.db_path)
+            self.conn.execute("PRAGMA synchronous = OFF")
+            self.conn.execute("PRAGMA journal_mode = OFF")
+            self.conn.execute(
+                "CREATE TABLE seen (digest BLOB PRIMARY KEY) WITHOUT ROWID"
+            )
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen VALUES (?)",
+                ((digest,) for digest in self.seen),
+            )
+        if self.bloom is not None:
+            for digest in self.seen:
+                self.bloom.add(digest)
+        self.seen = set()
+        self.spills += 1
+
+    def close(self):
+        """Remove the spill database."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        if self.db_path and os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        self.db_path = None
+        self.seen = set()
+
+    def __str__(self) -> str:
+        return (
+            f"dedup: {self.unique} unique {self.duplicates} duplicates "
+            f"{self.spills} spills {self.lookups} lookups"
+        )
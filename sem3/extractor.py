@@ -11,17 +11,23 @@ extractor:
 """
 
 import glob
+import itertools
 import logging
 import os
 import re
-import textwrap
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-import yaml
 from basemkit.yamlable import lod_storable
 from sidif.sidif import SiDIFParser
 
+from sem3.comment_profiles import CommentProfile, CommentProfiles
+from sem3.compact_markup import CompactMarkup, SourceTable, strip_prefix
+from sem3.filters import EntityFilter
+from sem3.notebook import is_notebook, iter_cell_sources, marker_variants
+from sem3.parse_limits import LimitExceeded, ParseLimits, SkippedMarkup
+from sem3.sidif_fast import FastSiDIFParser
+
 
 @lod_storable
 @dataclass
@@ -33,22 +39,52 @@ class Markup:
     source: str
 
 
+def source_file(source: Optional[str]) -> str:
+    """Get the file part of a source location such as ``path:line`` or ``path:cell:line``."""
+    if not source:
+        return ""
+    return re.sub(r"(?::\d+)+$", "", source)
+
+
 class Extractor:
     """Extract semantic annotation markup from files."""
 
-    def __init__(self, marker: str = "🌐🕸", lenient: bool = True, debug: bool = False):
+    def __init__(
+        self,
+        marker: str = "🌐🕸",
+        lenient: bool = True,
+        debug: bool = False,
+        limits: Optional[ParseLimits] = None,
+        scan_bytes: Optional[int] = None,
+        entity_filter: Optional[EntityFilter] = None,
+    ):
         """
         constructor for Semantic markup Extractor
         Args:
             marker (str, optional): utf-8 symbol sequence inside backticks that calls for picking up semantic markup
             lenient (bool): if True (default) - only log exception if false raise
             debug (bool): if True log debug output otherwise ignore log messages
+            limits (ParseLimits): per markup resource limits - markups exceeding them are skipped
+            scan_bytes (int): if set only scan the header of each file up to this many bytes - extended to close a block started in it
+            entity_filter (EntityFilter): only keep the entities passing this filter - markups that can not contain any are not parsed
         """
         self.marker = marker
         self.lenient = lenient
         self.debug = debug
+        self.limits = limits if limits is not None else ParseLimits()
+        self.scan_bytes = scan_bytes or None
+        self.entity_filter = (
+            entity_filter
+            if entity_filter is not None and entity_filter.active
+            else None
+        )
+        self.skipped: List[SkippedMarkup] = []
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG if debug else logging.INFO)
+        self.marker_bytes = marker.encode("utf-8")
+        self.notebook_markers = marker_variants(marker)
+        # comment syntax profiles by file extension - compiled once per run
+        self.profiles = CommentProfiles()
 
     def log(self, msg: str):
         if self.debug:
@@ -65,16 +101,270 @@ class Extractor:
         """
         markups = []
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-            markups = self.extract_from_text(content, source_path=filepath)
+            content = self.read_content(filepath)
+            markups = self.extract_from_content(content, filepath)
         except (IOError, UnicodeDecodeError) as e:
             self.logger.warning(f"Error reading {filepath}: {e}")
             markups = []
         return markups
 
+    def read_content(self, filepath: str) -> Union[str, bytes]:
+        """Read the content of a file to extract markups from.
+
+        Args:
+            filepath: Path to the file to read.
+
+        Returns:
+            Union[str, bytes]: the text - the header only if scan_bytes is set -
+            or the bytes of a Jupyter notebook.
+
+        Raises:
+            IOError: if the file can not be read.
+            UnicodeDecodeError: if the file is not UTF-8 encoded.
+        """
+        if is_notebook(filepath):
+            with open(filepath, "rb") as f:
+                return f.read()
+        if self.scan_bytes:
+            return self.read_header(filepath).decode("utf-8")
+        with open(filepath, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def read_header(self, filepath: str) -> bytes:
+        """Read the first scan_bytes of a file.
+
+        The read is extended to the end of the line and - if a block starts
+        in the header - until the block is closed, but not further than the
+        markup size limit beyond the header.
+
+        Args:
+            filepath: Path to the file to read.
+
+        Returns:
+            bytes: the header of the file.
+        """
+        window = self.scan_bytes
+        max_extend = window + self.limits.max_bytes if self.limits.max_bytes else None
+        with open(filepath, "rb") as f:
+            data = f.read(window)
+            if len(data) < window:
+                return data
+            data += f.readline()
+            profile = self.profiles.for_path(filepath)
+            while True:
+                end = self.scan_end(data, window, profile)
+                if end is not None:
+                    return data[:end]
+                if max_extend is not None and len(data) > max_extend:
+                    return data
+                chunk = f.read(window)
+                if not chunk:
+                    return data
+                data += chunk + f.readline()
+
+    def scan_end(
+        self, buf, window: int, profile: Optional[CommentProfile] = None
+    ) -> Optional[int]:
+        """Get the end of the header of a buffer.
+
+        Args:
+            buf: the bytes or memory map of the file (start).
+            window: the number of bytes to scan.
+            profile: the comment profile of the file (default profile if None).
+
+        Returns:
+            Optional[int]: the offset after the line ending the window or the
+            last block started in it - None if such a block is not closed in buf.
+        """
+
+        def line_end(pos: int) -> int:
+            eol = buf.find(b"\n", pos)
+            return len(buf) if eol == -1 else eol + 1
+
+        fence_pattern = (profile or self.profiles.default).fence_pattern
+        end = line_end(window) if window < len(buf) else len(buf)
+        pos = 0
+        while True:
+            match = fence_pattern.search(buf, pos, end)
+            if match is None:
+                return end
+            closing = b"\n" + match.group("prefix") + b"```"
+            close = buf.find(closing, match.end())
+            if close == -1:
+                return None
+            pos = close + len(closing)
+            if pos > end:
+                end = line_end(pos)
+
+    def extract_from_content(
+        self, content: Union[str, bytes], filepath: str
+    ) -> List[Markup]:
+        """Extract markup snippets from the content of a file.
+
+        Jupyter notebooks are handled cell by cell, all other files as text.
+
+        Args:
+            content: the content of the file (bytes only for notebooks).
+            filepath: Path of the file for the type and location tracking.
+
+        Returns:
+            List[Markup]: List of extracted markup snippets.
+        """
+        if is_notebook(filepath):
+            return self.extract_from_notebook(content, filepath)
+        return self.extract_from_text(content, source_path=filepath)
+
+    def extract_from_notebook(
+        self, content: Union[str, bytes], source_path: Optional[str] = None
+    ) -> List[Markup]:
+        """Extract markup snippets from the cell sources of a Jupyter notebook.
+
+        The sources are reported as ``file:cell:line`` with the index of the
+        cell in ``cells`` and the line within the cell.
+
+        Args:
+            content: the notebook JSON.
+            source_path: Optional file path for location tracking.
+
+        Returns:
+            List[Markup]: List of extracted markup snippets.
+        """
+        markups = []
+        # markdown and code cells - the kernel language is not looked at
+        profile = self.profiles.default
+        try:
+            for cell_idx, source in iter_cell_sources(content, self.notebook_markers):
+                cell_path = f"{source_path}:{cell_idx}" if source_path else None
+                markups.extend(
+                    self.extract_from_text(
+                        source, source_path=cell_path, profile=profile
+                    )
+                )
+        except (ValueError, AttributeError) as e:
+            self.logger.warning(f"Invalid notebook {source_path}: {e}")
+        return markups
+
+    def extract_compact_from_file(
+        self, filepath: str, table: SourceTable
+    ) -> List[CompactMarkup]:
+        """Extract compact markups from a single memory mapped file.
+
+        Only the offsets of the blocks are recorded - the code is materialized
+        lazily from the source when it is asked for.
+
+        Args:
+            filepath: Path to the file to extract from.
+            table: the source table to register the file in.
+
+        Returns:
+            List[CompactMarkup]: List of compact markups.
+        """
+        markups = []
+        file_id = table.add(filepath)
+        try:
+            buf = table.buffer(file_id)
+        except OSError as e:
+            self.logger.warning(f"Error reading {filepath}: {e}")
+            return markups
+        if buf is None:
+            return markups
+        profile = self.profiles.for_path(filepath)
+        end = len(buf)
+        if self.scan_bytes:
+            end = self.scan_end(buf, self.scan_bytes, profile) or end
+        if buf.find(self.marker_bytes, 0, end) == -1:
+            return markups
+
+        line_num = 1
+        last_pos = 0
+        for match in profile.byte_pattern.finditer(buf, 0, end):
+            line_num += buf[last_pos : match.start()].count(b"\n")
+            last_pos = match.start()
+            prefix = match.group("prefix")
+            start = self.find_code_start(
+                buf, prefix, match.start("content"), match.end("content")
+            )
+            if start is None:
+                continue
+            markup = CompactMarkup(
+                table=table,
+                file_id=file_id,
+                fence_start=match.start(),
+                start=start,
+                end=match.end("content"),
+                prefix_len=len(prefix),
+                lang=match.group("lang").decode("ascii"),
+                line_num=line_num,
+            )
+            markups.append(markup)
+
+        if self.debug and len(markups) > 0:
+            self.log(f"Found {len(markups)} snippets in {filepath}")
+        return markups
+
+    def find_code_start(
+        self, buf, prefix: bytes, start: int, end: int
+    ) -> Optional[int]:
+        """Validate a block in a byte buffer and find the start of its code.
+
+        Byte level equivalent of the checks in create_markup_from_block.
+
+        Args:
+            buf: the byte buffer (e.g. a memory map).
+            prefix: the prefix of the opening fence.
+            start: the start offset of the block content.
+            end: the end offset of the block content.
+
+        Returns:
+            Optional[int]: offset of the first code line or None if the block
+            has no marker or no code.
+        """
+        bare_prefix = prefix.rstrip()
+        code_start = None
+        pos = start
+        while pos < end:
+            eol = buf.find(b"\n", pos, end)
+            if eol == -1:
+                eol = end
+            line = strip_prefix(buf[pos:eol], prefix, bare_prefix).strip()
+            pos = eol + 1
+            if not line:
+                continue
+            if code_start is None:
+                if self.marker_bytes not in line:
+                    return None
+                code_start = pos
+            else:
+                return code_start
+        return None
+
+    def extract_compact_from_files(
+        self, files: List[str], table: SourceTable
+    ) -> List[Union[CompactMarkup, Markup]]:
+        """Extract compact markups from the given files.
+
+        Args:
+            files: the file paths.
+            table: the source table to register the files in.
+
+        Returns:
+            List[Union[CompactMarkup, Markup]]: All compact markups of the files -
+            plain Markups for notebooks.
+        """
+        all_markups = []
+        for filepath in files:
+            if is_notebook(filepath):
+                # JSON escaped cell sources have no byte offsets to refer to
+                all_markups.extend(self.extract_from_file(filepath))
+            else:
+                all_markups.extend(self.extract_compact_from_file(filepath, table))
+        return all_markups
+
     def extract_from_text(
-        self, text: str, source_path: Optional[str] = None
+        self,
+        text: str,
+        source_path: Optional[str] = None,
+        profile: Optional[CommentProfile] = None,
     ) -> List[Markup]:
         """Extract all semantic markup snippets from text in a single pass.
 
@@ -84,6 +374,7 @@ class Extractor:
         Args:
             text: The source text to extract from.
             source_path: Optional file path for location tracking.
+            profile: the comment profile to scan with - by the extension of source_path if None.
 
         Returns:
             List[Markup]: List of extracted markup snippets.
@@ -94,16 +385,12 @@ class Extractor:
 
         markups = []
 
-        # Single Regex: Matches indentation/comments (prefix), language, and content.
-        # Ensure the closing fence matches the opening prefix exactly.
-        pattern = re.compile(
-            r"(?P<prefix>^[ \t]*(?:#|//)?[ \t]*)```(?P<lang>yaml|sidif)\s*\n"
-            r"(?P<content>.*?)"
-            r"\n(?P=prefix)```",
-            re.DOTALL | re.MULTILINE,
-        )
+        # Single Regex of the comment profile: Matches indentation/comments (prefix),
+        # language, and content. The closing fence matches the opening prefix exactly.
+        if profile is None:
+            profile = self.profiles.for_path(source_path)
 
-        for match in pattern.finditer(text):
+        for match in profile.text_pattern.finditer(text):
             # Calculate line number based on the match start position
             line_num = text[: match.start()].count("\n") + 1
 
@@ -150,42 +437,35 @@ class Extractor:
             Optional[Markup]: The valid Markup object, or None if invalid/empty.
         """
         lines = raw_content.split("\n")
-        cleaned_lines = []
-
-        # 1. Clean the lines (Strip the prefix)
-        for line in lines:
-            if line.startswith(prefix):
-                cleaned_lines.append(line[len(prefix) :])
-            elif line.startswith(prefix.rstrip()):
-                # Handle lines that are just the prefix (or prefix w/o trailing space)
-                cleaned_lines.append(line[len(prefix.rstrip()) :])
-            else:
-                # If indentation doesn't match, keep line as is (or could be error)
-                cleaned_lines.append(line)
+        bare_prefix = prefix.rstrip()
 
-        # 2. Locate the first actual content line
+        # 1. Locate the first actual content line (stripping the prefix)
         first_content_idx = None
-        for idx, line in enumerate(cleaned_lines):
-            if line.strip():
+        first_line = ""
+        for idx, line in enumerate(lines):
+            first_line = strip_prefix(line, prefix, bare_prefix).strip()
+            if first_line:
                 first_content_idx = idx
                 break
 
         if first_content_idx is None:
             return None
 
-        # 3. Validate Marker
-        first_line = cleaned_lines[first_content_idx].strip()
+        # 2. Validate Marker
         if self.marker not in first_line:
             return None
 
-        # 4. Extract code content (everything after the marker line)
-        code_lines = cleaned_lines[first_content_idx + 1 :]
-        code = "\n".join(code_lines).strip()
+        # 3. Extract code content (everything after the marker line)
+        # cleaning lazily to avoid intermediate line lists
+        code_lines = itertools.islice(lines, first_content_idx + 1, None)
+        code = "\n".join(
+            strip_prefix(line, prefix, bare_prefix) for line in code_lines
+        ).strip()
 
         if not code:
             return None
 
-        # 5. Build Source String
+        # 4. Build Source String
         source = ""
         if source_path:
             source = f"{source_path}:{line_num}"
@@ -233,49 +513,49 @@ class Extractor:
 
         return all_markups
 
+    def extract_from_files(self, files: Iterable[str]) -> List[Markup]:
+        """Extract markup snippets from the given files without globbing.
+
+        Args:
+            files: the file paths - consumed lazily e.g. as streamed by --files-from.
+
+        Returns:
+            List[Markup]: All markup snippets of the files.
+        """
+        all_markups = []
+        for filepath in files:
+            all_markups.extend(self.extract_from_file(filepath))
+        return all_markups
+
     def markups_to_lod(self, markups: List["Markup"]) -> List[Dict[str, Any]]:
         """
         Convert the given list of markups to a **flat** list of dicts LOD.
         - YAML: {"extractor": {"isA": "PythonModule", ...}} → [{"name": "extractor", "isA": "PythonModule", ...}]
         - SiDIF: "base_sem3test isA PythonModule\n... is author of it" → [{"name": "base_sem3test", "isA": "PythonModule", "author": "..."}]
-        Uses py-sidif parser for full SiDIF support.
+        Uses a fast parser for the common SiDIF subset and py-sidif for full SiDIF support.
+        Markups exceeding the parse limits are skipped and recorded in self.skipped.
+        With an entity filter markups failing its raw code pre-check are not
+        parsed and only the entities passing the filter are kept.
         """
         lod = []
-        sidif_parser = SiDIFParser(showErrors=False)  # Silent, no debug
+        # py-sidif is only used for markups outside the common subset
+        sidif_parser = FastSiDIFParser(SiDIFParser(showErrors=False))
+        limits = self.limits
+        entity_filter = self.entity_filter
 
         for markup in markups:
             try:
-                if markup.lang == "yaml":
-                    data = yaml.safe_load(markup.code or "")
-                    if not isinstance(data, dict):
-                        continue
-                    # Flatten ALL top-level keys (handles single/multi YAML)
-                    for name, props in data.items():
-                        flat_props = {}
-                        if isinstance(props, dict):
-                            flat_props = props.copy()
-                        else:
-                            flat_props = {"value": props}  # Rare scalar
-                        flat_props["name"] = name
-                        flat_props["source"] = markup.source
-                        lod.append(flat_props)
-
-                elif markup.lang == "sidif":
-                    # fix indentation from code blocks
-                    sidif_code = textwrap.dedent(markup.code or "")
-                    title = f"{markup.source}"
-                    # Parse with py-sidif → DataInterchange → dict of dicts → flatten each subject
-                    result, error = sidif_parser.parseText(
-                        markup.code or "",
-                    )
-                    if error is None and result:
-                        dif = result[0]  # DataInterchange
-                        nested_dod = dif.toDictOfDicts()
-                        for subject_name, subject_props in nested_dod.items():
-                            flat_props = subject_props.copy()
-                            flat_props["name"] = subject_name
-                            lod.append(flat_props)
-
+                code = markup.code or ""
+                if entity_filter and not entity_filter.may_match(code):
+                    continue
+                limits.check_size(code)
+                start = len(lod)
+                with limits.time_limit():
+                    self.markup_to_lod(markup, code, sidif_parser, lod)
+                if entity_filter:
+                    lod[start:] = entity_filter.filter(lod[start:])
+            except LimitExceeded as ex:
+                self.skip_markup(markup, ex)
             except Exception as ex:
                 if self.lenient:
                     msg = f"Lenient: skipped {markup.lang} in {markup.source}: {ex}"
@@ -285,6 +565,59 @@ class Extractor:
 
         return lod
 
+    def skip_markup(self, markup: Markup, ex: LimitExceeded):
+        """Record and report a markup that exceeded a parse limit.
+
+        Args:
+            markup: the skipped markup.
+            ex: the exceeded limit.
+        """
+        skipped = SkippedMarkup(
+            source=markup.source, lang=markup.lang, limit=ex.limit, reason=str(ex)
+        )
+        self.skipped.append(skipped)
+        self.logger.warning(f"skipped {markup.lang} in {markup.source}: {ex}")
+
+    def markup_to_lod(
+        self,
+        markup: Markup,
+        code: str,
+        sidif_parser: FastSiDIFParser,
+        lod: List[Dict[str, Any]],
+    ):
+        """Parse a single markup and append its flattened entities to the given LOD.
+
+        Args:
+            markup: the markup to convert.
+            code: the code of the markup.
+            sidif_parser: the parser to use for SiDIF markups - falls back to py-sidif.
+            lod: the list of dicts to append to.
+        """
+        if markup.lang == "yaml":
+            data = self.limits.yaml_load(code)
+            if not isinstance(data, dict):
+                return
+            # Flatten ALL top-level keys (handles single/multi YAML)
+            for name, props in data.items():
+                flat_props = {}
+                if isinstance(props, dict):
+                    flat_props = props.copy()
+                else:
+                    flat_props = {"value": props}  # Rare scalar
+                flat_props["name"] = name
+                flat_props["source"] = markup.source
+                lod.append(flat_props)
+
+        elif markup.lang == "sidif":
+            # Parse the common subset directly or with py-sidif → dict of dicts → flatten each subject
+            nested_dod = sidif_parser.to_dict_of_dicts(code)
+            if nested_dod is not None:
+                for subject_name, subject_props in nested_dod.items():
+                    flat_props = subject_props.copy()
+                    flat_props["name"] = subject_name
+                    flat_props["source"] = markup.source
+                    lod.append(flat_props)
+
     def print_markups(self, markups: list, limit: int = None, verbose: bool = True):
         """
         Helper to print a list of markups to stdout for debugging/CLI output.
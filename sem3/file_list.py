@@ -0,0 +1,77 @@
+"""
+```yaml
+# 🌐🕸
+file_list:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: streaming NUL or newline separated input file lists for semantify³.
+```
+"""
+
+import os
+import sys
+from typing import BinaryIO, Iterator
+
+
+def iter_file_list(stream: BinaryIO, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """Iterate the paths of a file list as they arrive.
+
+    The list is NUL separated (``find -print0``, ``git ls-files -z``) if a
+    NUL byte comes before the first newline, otherwise newline separated.
+    Empty entries are skipped.
+
+    Args:
+        stream: the binary stream of the list e.g. ``sys.stdin.buffer``.
+        chunk_size: the maximum number of bytes to read at a time.
+
+    Yields:
+        str: the paths decoded with the file system encoding.
+    """
+    # read1 returns what is available instead of waiting for a full chunk
+    read = getattr(stream, "read1", stream.read)
+    separator = None
+    rest = b""
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        data = rest + chunk
+        if separator is None:
+            nul = data.find(b"\0")
+            newline = data.find(b"\n")
+            if nul == -1 and newline == -1:
+                rest = data
+                continue
+            separator = (
+                b"\0" if nul != -1 and (newline == -1 or nul < newline) else b"\n"
+            )
+        parts = data.split(separator)
+        rest = parts.pop()
+        for part in parts:
+            yield from decode_entry(part, separator)
+    yield from decode_entry(rest, separator)
+
+
+def decode_entry(entry: bytes, separator: bytes) -> Iterator[str]:
+    """Decode a single entry of a file list - nothing for an empty entry."""
+    if separator != b"\0" and entry.endswith(b"\r"):
+        entry = entry[:-1]
+    if entry:
+        yield os.fsdecode(entry)
+
+
+def iter_files_from(source: str) -> Iterator[str]:
+    """Iterate the paths of the file list given by --files-from.
+
+    Args:
+        source: the path of the list or ``-`` for stdin.
+
+    Yields:
+        str: the paths in the order of the list.
+    """
+    if source == "-":
+        yield from iter_file_list(sys.stdin.buffer)
+    else:
+        with open(source, "rb") as stream:
+            yield from iter_file_list(stream)
@@ -0,0 +1,154 @@
+"""
+```yaml
+# 🌐🕸
+filters:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: entity filters with a raw markup pre-check applied before parsing for semantify³.
+```
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
+
+import yaml
+
+
+class EntityFilter:
+    """Filter entities by isA and property values.
+
+    ``only_isa`` classes are alternatives, ``where`` conditions must all
+    hold. The filter is applied in two steps:
+
+    1. may_match: a cheap pattern pre-check on the raw markup code
+       that discards blocks which can not contain a matching entity
+       before they are parsed - only for values whose spelling in the
+       markup is known so the result never changes
+    2. matches: the exact check on each parsed entity
+    """
+
+    def __init__(
+        self,
+        only_isa: Optional[List[str]] = None,
+        where: Optional[List[str]] = None,
+        class_hierarchy=None,
+    ):
+        """Initialize the filter.
+
+        Args:
+            only_isa: the accepted isA classes (any class if None or empty).
+            where: ``key=value`` conditions.
+            class_hierarchy: optional ClassHierarchy - subclasses of the
+                only_isa classes are accepted as well.
+
+        Raises:
+            ValueError: if a condition is not of the form key=value.
+        """
+        self.classes: Set[str] = set(only_isa or [])
+        if class_hierarchy is not None:
+            for class_name in list(self.classes):
+                self.classes |= class_hierarchy.subclasses(class_name)
+        self.conditions: List[Tuple[str, str]] = [
+            self.parse_condition(condition) for condition in where or []
+        ]
+        # patterns of values that appear in the markup of a matching entity
+        self.class_needles: Optional[List[Pattern]] = None
+        if self.classes and all(self.is_plain(name) for name in self.classes):
+            self.class_needles = [self.needle(name) for name in self.classes]
+        self.needles = [
+            self.needle(value)
+            for key, value in self.conditions
+            if key != "source" and self.is_plain(value)
+        ]
+        self.skipped_blocks = 0
+        self.filtered_entities = 0
+
+    @staticmethod
+    def parse_condition(condition: str) -> Tuple[str, str]:
+        """Split a key=value condition."""
+        key, sep, value = condition.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            raise ValueError(f"invalid condition '{condition}' - expected key=value")
+        return key, value.strip()
+
+    @staticmethod
+    def is_plain(value: str) -> bool:
+        """Check whether the given value can only be spelled as text in the markup.
+
+        Numbers, booleans, dates and the like have alternative spellings
+        e.g. ``0x10`` for ``16`` so they can not be searched for.
+        """
+        if not value or value.lower().lstrip("+-.") in ("inf", "nan"):
+            return False
+        try:
+            return yaml.safe_load(value) == value
+        except yaml.YAMLError:
+            return False
+
+    @staticmethod
+    def needle(value: str) -> Pattern:
+        """Get the pattern of a plain value as it may be spelled in the markup.
+
+        Multi line plain, quoted and folded scalars may break the value at
+        any whitespace and single quoted scalars double the quote.
+        """
+        words = [
+            r"'{1,2}".join(re.escape(part) for part in word.split("'"))
+            for word in value.split()
+        ]
+        return re.compile(r"\s+".join(words))
+
+    @property
+    def active(self) -> bool:
+        return bool(self.classes or self.conditions)
+
+    def may_match(self, code: str) -> bool:
+        """Check whether the raw code of a markup may contain a matching entity.
+
+        Args:
+            code: the YAML or SiDIF code of the markup.
+
+        Returns:
+            bool: False only if no entity of the markup can match.
+        """
+        # escapes, YAML aliases and tags may spell values differently
+        if "\\" in code or "*" in code or "!" in code:
+            return True
+        if self.class_needles is not None and not any(
+            needle.search(code) for needle in self.class_needles
+        ):
+            self.skipped_blocks += 1
+            return False
+        for needle in self.needles:
+            if not needle.search(code):
+                self.skipped_blocks += 1
+                return False
+        return True
+
+    @staticmethod
+    def value_matches(value: Any, expected: str) -> bool:
+        if isinstance(value, list):
+            return any(EntityFilter.value_matches(v, expected) for v in value)
+        if isinstance(value, bool):
+            return str(value).lower() == expected.lower()
+        return value is not None and str(value) == expected
+
+    def matches(self, item: Dict[str, Any]) -> bool:
+        """Check whether the given parsed entity passes the filter."""
+        if self.classes:
+            isa = item.get("isA")
+            names = isa if isinstance(isa, list) else [isa]
+            if not any(str(name) in self.classes for name in names):
+                return False
+        for key, expected in self.conditions:
+            if not self.value_matches(item.get(key), expected):
+                return False
+        return True
+
+    def filter(self, lod: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Get the entities of the list of dicts passing the filter."""
+        result = [item for item in lod if self.matches(item)]
+        self.filtered_entities += len(lod) - len(result)
+        return result
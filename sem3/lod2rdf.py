@@ -12,21 +12,32 @@ lod2rdf:
 import re
 import textwrap
 from dataclasses import asdict, is_dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from rdflib import Graph, Literal, Namespace, URIRef
 from rdflib.namespace import RDF, XSD
 
+from sem3.class_hierarchy import ClassHierarchy
+from sem3.rdf_backend import RDFBackend, nt_term, to_ntriple
+from sem3.subject_ids import SubjectIdMinter
+
 
 class RDFDumper:
     """Converts list of dicts/dataclasses to RDF.
 
     This class provides functionality to convert Python dataclasses or dictionaries
-    into RDF format using the rdflib library.
+    into RDF format using the rdflib library or one of the other RDFBackends.
     """
 
     def __init__(
-        self, base_uri: str, namespace_prefix: str = "ex", debug: bool = False
+        self,
+        base_uri: str,
+        namespace_prefix: str = "ex",
+        debug: bool = False,
+        backend: str = "rdflib",
+        id_scheme: str = "hash",
+        class_hierarchy: Optional[ClassHierarchy] = None,
+        infer_types: bool = False,
     ):
         """Initialize RDF dumper.
 
@@ -34,11 +45,20 @@ class RDFDumper:
             base_uri: Base URI for resources.
             namespace_prefix: Prefix for namespace.
             debug: Enable debug logging (default: False).
+            backend: name of the RDFBackend to collect and serialize the triples (default: rdflib).
+            id_scheme: SubjectIdMinter scheme for resources without id field (default: hash).
+            class_hierarchy: the isA class hierarchy for inferred triples.
+            infer_types: if True add the rdf:type triples of all superclasses and the
+                rdfs:subClassOf triples of the class_hierarchy closure.
         """
         self.base_uri = base_uri
         self.namespace_prefix = namespace_prefix
         self.ns = Namespace(base_uri)
         self.debug = debug
+        self.backend = backend
+        self.id_minter = SubjectIdMinter(id_scheme)
+        self.class_hierarchy = class_hierarchy
+        self.infer_types = infer_types and class_hierarchy is not None
 
     def sanitize_query(self, sparql_query: str) -> str:
         """Handle RDFlib/pyparsing/SPARQL parser quirks (strict WS after projection).
@@ -71,7 +91,7 @@ class RDFDumper:
         lod: List[Dict[str, Any]],  # ✅ LOD (List of Dicts/Dataclasses)
         type_name: str,
         id_field: Optional[str] = None,
-    ) -> Graph:
+    ) -> Union[Graph, RDFBackend]:
         """Convert list of dicts/dataclasses to RDF Graph (PURE: no I/O).
 
         Args:
@@ -80,19 +100,15 @@ class RDFDumper:
             id_field: Field to use as resource identifier (auto-generated if None).
 
         Returns:
-            Graph: Fresh rdflib.Graph with triples (serialize yourself).
+            Graph: Fresh rdflib.Graph with triples (serialize yourself) - for
+            other backends the RDFBackend offering serialize() and len().
         """
         if self.debug:
             print(f"LOD→RDF: {len(lod)} | type={type_name} | id={id_field or 'auto'}")
 
-        graph = Graph()
-        graph.bind(self.namespace_prefix, self.ns)
-
-        for idx, item in enumerate(lod):
-            item_dict = asdict(item) if is_dataclass(item) else item
-            self.add_resource(
-                graph, item_dict, type_name, id_field, idx
-            )  # Inject graph
+        backend = RDFBackend.create(self.backend, self.namespace_prefix, self.base_uri)
+        backend.add_all(self.iter_triples(lod, type_name, id_field))
+        graph = backend.as_graph()
 
         if self.debug:
             print(f"Graph ready: {len(graph)} triples")
@@ -106,7 +122,7 @@ class RDFDumper:
         id_field: Optional[str] = None,
         output_path: Optional[str] = None,  # None → stdout
         output_format: str = "turtle",
-    ) -> Graph:
+    ) -> Union[Graph, RDFBackend]:
         """LOD → RDF Graph + serialize (file/stdout). Wrapper over as_rdf().
 
         Args:
@@ -127,7 +143,10 @@ class RDFDumper:
                 print(f"Saved {len(graph)} triples → {output_path} ({output_format})")
         else:
             # ✅ CLI stdout
-            print(graph.serialize(format=output_format).decode("utf-8"))
+            serialized = graph.serialize(format=output_format)
+            if isinstance(serialized, bytes):
+                serialized = serialized.decode("utf-8")
+            print(serialized)
             if self.debug:
                 print(f"Serialized {len(graph)} triples ({output_format}) → stdout")
 
@@ -150,22 +169,81 @@ class RDFDumper:
             id_field: Field name containing resource identifier.
             idx: Index for auto-generating IDs.
         """
-        if id_field and id_field in item_dict:
-            resource_id = item_dict[id_field]
-        else:
-            resource_id = f"{type_name.lower()}_{idx}"
+        for triple in self.iter_resource_triples(item_dict, type_name, id_field, idx):
+            graph.add(triple)
+
+    def iter_resource_triples(
+        self,
+        item_dict: Dict[str, Any],
+        type_name: str,
+        id_field: Optional[str],
+        idx: int,
+    ) -> Iterator[Tuple[URIRef, URIRef, Any]]:
+        """Generate the triples of a single resource.
 
+        Args:
+            item_dict: Dictionary with resource data.
+            type_name: RDF type name for resource (used as fallback if isA not in data).
+            id_field: Field name containing resource identifier.
+            idx: Index of the resource in the list of dicts.
+
+        Yields:
+            Tuple[URIRef, URIRef, Any]: the (subject, predicate, object) triples.
+        """
+        resource_id = self.id_minter.resource_id(item_dict, type_name, id_field, idx)
         subject = URIRef(f"{self.base_uri}{resource_id}")
-        
+
         # Use isA from data if available, otherwise fall back to type_name parameter
-        actual_type = item_dict.get('isA', type_name)
-        graph.add((subject, RDF.type, self.ns[actual_type]))
+        actual_type = item_dict.get("isA", type_name)
+        yield subject, RDF.type, self.ns[actual_type]
+        if self.infer_types:
+            for superclass in self.class_hierarchy.superclasses(actual_type):
+                yield subject, RDF.type, self.ns[superclass]
 
         for key, value in item_dict.items():
             if value is not None:
                 predicate = self.ns[key]
                 obj = self.create_literal(value)
-                graph.add((subject, predicate, obj))
+                yield subject, predicate, obj
+
+    def iter_triples(
+        self,
+        lod: List[Dict[str, Any]],
+        type_name: str,
+        id_field: Optional[str] = None,
+    ) -> Iterator[Tuple[URIRef, URIRef, Any]]:
+        """Stream the triples of a list of dicts/dataclasses without building a Graph.
+
+        The triples may contain duplicates which a Graph would have merged.
+
+        Args:
+            lod: List of dicts or dataclass instances.
+            type_name: RDF type name for resources.
+            id_field: Field to use as resource identifier (auto-generated if None).
+
+        Yields:
+            Tuple[URIRef, URIRef, Any]: the (subject, predicate, object) triples.
+        """
+        yield from self.iter_hierarchy_triples()
+        self.id_minter.prepare(lod, type_name, id_field)
+        for idx, item in enumerate(lod):
+            item_dict = asdict(item) if is_dataclass(item) else item
+            yield from self.iter_resource_triples(item_dict, type_name, id_field, idx)
+
+    def iter_hierarchy_triples(self) -> Iterator[Tuple[URIRef, URIRef, URIRef]]:
+        """Generate the rdfs:subClassOf triples of the class hierarchy closure if types are inferred."""
+        if self.infer_types:
+            yield from self.class_hierarchy.iter_triples(self.ns)
+
+    @staticmethod
+    def nt_term(term: Any) -> str:
+        """Get the N-Triples representation of an IRI or literal."""
+        return nt_term(term)
+
+    @staticmethod
+    def to_ntriple(triple: Tuple[Any, Any, Any]) -> str:
+        """Get the N-Triples line (with trailing newline) of the given triple."""
+        return to_ntriple(triple)
 
     def create_literal(self, value: Any) -> Literal:
         """Create RDF literal from Python value.
@@ -0,0 +1,469 @@
+"""
+```yaml
+# 🌐🕸
+neo4j_writer:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: streaming neo4j-admin import CSV and batched Cypher writers for semantify³.
+```
+"""
+
+import csv
+import json
+import math
+import os
+import re
+import sys
+from dataclasses import asdict, is_dataclass
+from datetime import date
+from typing import (
+    Any,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from sem3.dedup import TripleDeduplicator
+from sem3.subject_ids import SubjectIdMinter
+
+
+class Neo4jExport:
+    """Common mapping of a list of dicts to property graph nodes and relationships.
+
+    Every entity becomes a node labeled with its ``isA`` (or the fallback type
+    name) and the common label ``Sem3``. Property values that are the id of
+    another entity become relationships named after the property.
+    """
+
+    # label shared by all nodes for the id constraint/index
+    common_label = "Sem3"
+    # properties that never become relationships
+    no_relationship_props = {"name", "isA", "source"}
+
+    def __init__(
+        self,
+        type_name: str,
+        id_field: Optional[str] = None,
+        batch_size: int = 1000,
+        debug: bool = False,
+        id_scheme: str = "hash",
+    ):
+        """Initialize the export.
+
+        Args:
+            type_name: fallback label for entities without isA.
+            id_field: Field to use as node identifier (auto-generated if None).
+            batch_size: number of rows per batch.
+            debug: if True print debug output.
+            id_scheme: SubjectIdMinter scheme for entities without id field.
+        """
+        self.type_name = type_name
+        self.id_field = id_field
+        self.batch_size = batch_size
+        self.debug = debug
+        self.id_minter = SubjectIdMinter(id_scheme)
+        self.node_count = 0
+        self.duplicate_count = 0
+        self.relationship_count = 0
+
+    def iter_nodes(
+        self, lod: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """Iterate the nodes of the given list of dicts.
+
+        Yields:
+            Tuple[str, str, Dict[str, Any]]: node id, label and properties.
+        """
+        for idx, item in enumerate(lod):
+            item_dict = asdict(item) if is_dataclass(item) else item
+            node_id = str(
+                self.id_minter.resource_id(
+                    item_dict, self.type_name, self.id_field, idx
+                )
+            )
+            label = str(item_dict.get("isA", self.type_name))
+            props = {
+                key: value for key, value in item_dict.items() if value is not None
+            }
+            yield node_id, label, props
+
+    def iter_relationships(
+        self, lod: List[Dict[str, Any]], node_ids: Container[str]
+    ) -> Iterator[Tuple[str, str, str]]:
+        """Iterate the relationships between the nodes of the given list of dicts.
+
+        Args:
+            lod: the list of dicts.
+            node_ids: the ids of all nodes.
+
+        Yields:
+            Tuple[str, str, str]: start id, end id and relationship type.
+        """
+        for node_id, _label, props in self.iter_nodes(lod):
+            for key, value in props.items():
+                if key in self.no_relationship_props:
+                    continue
+                values = value if isinstance(value, list) else [value]
+                for target in values:
+                    if (
+                        isinstance(target, str)
+                        and target in node_ids
+                        and target != node_id
+                    ):
+                        yield node_id, target, key
+
+    @staticmethod
+    def to_value(value: Any) -> Any:
+        """Convert a value to a neo4j compatible property value.
+
+        Maps, nested lists and lists mixing value types are not valid
+        property values and become JSON strings.
+        """
+        if isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, date):
+            return value.isoformat()
+        if isinstance(value, list):
+            values = [Neo4jExport.to_value(v) for v in value]
+            if len({type(v) for v in values}) <= 1 and not any(
+                isinstance(v, list) for v in values
+            ):
+                return values
+        return json.dumps(value, default=str)
+
+
+class Neo4jCsvWriter(Neo4jExport):
+    """Write node and relationship CSV files for ``neo4j-admin database import``.
+
+    One node file per label is written with a header derived from cheap
+    passes over the list of dicts; rows are then streamed to the files.
+    Node ids and relationships are deduplicated within a memory ceiling
+    by TripleDeduplicator. An entity occurring more than once is written
+    as a single node with the merged properties and labels as the Cypher
+    MERGE would create it - only these repeated entities are held in
+    memory. The
+    array delimiter is the first candidate not contained in any array
+    element or label - the ``import.args`` file has the matching options
+    for ``neo4j-admin database import full @import.args``.
+    """
+
+    array_delimiter = ";"
+    array_delimiter_candidates = [";", "|", "\x1f"]
+
+    def __init__(
+        self,
+        type_name: str,
+        id_field: Optional[str] = None,
+        batch_size: int = 1000,
+        debug: bool = False,
+        id_scheme: str = "hash",
+        max_memory_mb: float = 64,
+        tmp_dir: Optional[str] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            type_name: fallback label for entities without isA.
+            id_field: Field to use as node identifier (auto-generated if None).
+            batch_size: number of rows per batch.
+            debug: if True print debug output.
+            id_scheme: SubjectIdMinter scheme for entities without id field.
+            max_memory_mb: memory ceiling of the node id and relationship
+                deduplication each - spilling to disk beyond.
+            tmp_dir: directory for the spill databases (default: system temp dir).
+        """
+        super().__init__(type_name, id_field, batch_size, debug, id_scheme)
+        self.max_memory_mb = max_memory_mb
+        self.tmp_dir = tmp_dir
+
+    def column_type(self, types: Set[str]) -> str:
+        """Get the neo4j-admin column type for the given python value types."""
+        is_array = "list" in types
+        types = types - {"list"}
+        if types == {"int"}:
+            col_type = "long"
+        elif types and types <= {"int", "float"}:
+            col_type = "double"
+        elif types == {"bool"}:
+            col_type = "boolean"
+        else:
+            col_type = "string"
+        if is_array:
+            col_type = "string[]"
+        return col_type
+
+    def choose_array_delimiter(self, values: Set[str]) -> str:
+        """Get the first array delimiter candidate not contained in the given values.
+
+        Raises:
+            ValueError: if every candidate is contained in some value.
+        """
+        for candidate in self.array_delimiter_candidates:
+            if not any(candidate in value for value in values):
+                return candidate
+        raise ValueError(
+            f"no array delimiter of {self.array_delimiter_candidates!r} is unused"
+        )
+
+    def delimiter_option(self) -> str:
+        """Get the --array-delimiter option value (U+XXXX if not printable)."""
+        delimiter = self.array_delimiter
+        if delimiter.isprintable():
+            return delimiter
+        return f"U+{ord(delimiter):04X}"
+
+    def to_cell(self, value: Any) -> str:
+        value = self.to_value(value)
+        if isinstance(value, list):
+            return self.array_delimiter.join(str(v) for v in value)
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+
+    def add_columns(
+        self,
+        columns: Dict[str, Dict[str, Set[str]]],
+        delimited: Set[str],
+        labels: List[str],
+        props: Dict[str, Any],
+    ):
+        """Add the columns, value types and delimited values of a node."""
+        # a node is written to the file of its first label
+        label_columns = columns.setdefault(labels[0], {})
+        delimited.update(labels)
+        for key, value in props.items():
+            value = self.to_value(value)
+            label_columns.setdefault(key, set()).add(type(value).__name__)
+            if isinstance(value, list):
+                delimited.update(str(v) for v in value)
+
+    def node_row(
+        self, node_id: str, labels: List[str], props: Dict[str, Any], keys: Iterable
+    ) -> List[str]:
+        """Get the CSV row of a node for the given column keys."""
+        row = [node_id]
+        for key in keys:
+            value = props.get(key)
+            row.append("" if value is None else self.to_cell(value))
+        row.append(self.array_delimiter.join(labels + [self.common_label]))
+        return row
+
+    def write(self, lod: List[Dict[str, Any]], output_dir: str) -> List[str]:
+        """Write the CSV files for the given list of dicts.
+
+        Args:
+            lod: the list of dicts.
+            output_dir: the directory for the CSV files.
+
+        Returns:
+            List[str]: the paths of the written files.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        self.id_minter.prepare(lod, self.type_name, self.id_field)
+        node_ids = TripleDeduplicator(self.max_memory_mb, tmp_dir=self.tmp_dir)
+        relationships = TripleDeduplicator(self.max_memory_mb, tmp_dir=self.tmp_dir)
+        try:
+            return self.write_files(lod, output_dir, node_ids, relationships)
+        finally:
+            node_ids.close()
+            relationships.close()
+
+    def write_files(
+        self,
+        lod: List[Dict[str, Any]],
+        output_dir: str,
+        node_ids: TripleDeduplicator,
+        relationships: TripleDeduplicator,
+    ) -> List[str]:
+        # pass 1: the ids of all nodes and of the repeated ones
+        duplicate_ids: Set[str] = set()
+        for node_id, _label, _props in self.iter_nodes(lod):
+            if not node_ids.add(node_id):
+                duplicate_ids.add(node_id)
+                self.duplicate_count += 1
+        # pass 2: columns and value types per label - repeated nodes merged
+        merged: Dict[str, Tuple[List[str], Dict[str, Any]]] = {}
+        columns: Dict[str, Dict[str, Set[str]]] = {}
+        delimited: Set[str] = set()
+        for node_id, label, props in self.iter_nodes(lod):
+            if node_id not in duplicate_ids:
+                self.add_columns(columns, delimited, [label], props)
+                continue
+            node = merged.get(node_id)
+            if node is None:
+                merged[node_id] = ([label], dict(props))
+            else:
+                labels, merged_props = node
+                if label not in labels:
+                    labels.append(label)
+                merged_props.update(props)
+        for labels, props in merged.values():
+            self.add_columns(columns, delimited, labels, props)
+        self.array_delimiter = self.choose_array_delimiter(delimited)
+
+        # pass 3: stream the node rows
+        paths = []
+        node_paths = []
+        files: Dict[str, TextIO] = {}
+        writers = {}
+        try:
+            for label, label_columns in columns.items():
+                safe_label = re.sub(r"[^\w.-]", "_", label)
+                path = os.path.join(output_dir, f"nodes_{safe_label}.csv")
+                node_paths.append(path)
+                f = open(path, "w", newline="", encoding="utf-8")
+                files[label] = f
+                header = ["id:ID"]
+                for key, types in label_columns.items():
+                    header.append(f"{key}:{self.column_type(types)}")
+                header.append(":LABEL")
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writers[label] = writer
+            for node_id, label, props in self.iter_nodes(lod):
+                if node_id not in duplicate_ids:
+                    row = self.node_row(node_id, [label], props, columns[label])
+                    writers[label].writerow(row)
+                    self.node_count += 1
+            for node_id, (labels, props) in merged.items():
+                row = self.node_row(node_id, labels, props, columns[labels[0]])
+                writers[labels[0]].writerow(row)
+                self.node_count += 1
+        finally:
+            for f in files.values():
+                f.close()
+        paths.extend(node_paths)
+
+        # pass 4: stream the unique relationship rows
+        rel_path = os.path.join(output_dir, "relationships.csv")
+        paths.append(rel_path)
+        with open(rel_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([":START_ID", ":END_ID", ":TYPE"])
+            for relationship in self.iter_relationships(lod, node_ids):
+                if not relationships.add("\x00".join(relationship)):
+                    continue
+                writer.writerow(relationship)
+                self.relationship_count += 1
+        args_path = os.path.join(output_dir, "import.args")
+        paths.append(args_path)
+        with open(args_path, "w", encoding="utf-8") as f:
+            f.write(f"--array-delimiter={self.delimiter_option()}\n")
+            for node_path in node_paths:
+                f.write(f"--nodes={node_path}\n")
+            f.write(f"--relationships={rel_path}\n")
+        if self.debug:
+            print(
+                f"neo4j CSV: {self.node_count} nodes ({self.duplicate_count} merged) "
+                f"{self.relationship_count} relationships → {output_dir}"
+            )
+        return paths
+
+
+class CypherWriter(Neo4jExport):
+    """Write a Cypher script with batched ``UNWIND`` statements.
+
+    Rows are buffered per label (or relationship type) and flushed as one
+    statement when ``batch_size`` rows are collected so memory stays bounded
+    by the number of labels times the batch size.
+    """
+
+    identifier_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+    @classmethod
+    def quote_name(cls, name: str) -> str:
+        """Quote a label, type or key name if needed."""
+        if cls.identifier_pattern.match(name):
+            return name
+        return "`" + name.replace("`", "``") + "`"
+
+    @classmethod
+    def literal(cls, value: Any) -> str:
+        """Convert a python value to a Cypher literal."""
+        if isinstance(value, list):
+            return "[" + ", ".join(cls.literal(v) for v in value) + "]"
+        if isinstance(value, dict):
+            entries = (
+                f"{cls.quote_name(str(k))}: {cls.literal(v)}" for k, v in value.items()
+            )
+            return "{" + ", ".join(entries) + "}"
+        value = cls.to_value(value)
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, float) and not math.isfinite(value):
+            # Cypher has no NaN/infinity literals
+            return "null"
+        if isinstance(value, (int, float)):
+            return repr(value)
+        escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+        escaped = escaped.replace("\n", "\\n").replace("\r", "\\r")
+        return f"'{escaped}'"
+
+    def write_nodes_batch(self, out: TextIO, label: str, rows: List[Dict[str, Any]]):
+        out.write(f"UNWIND {self.literal(rows)} AS row\n")
+        out.write(
+            f"MERGE (n:{self.common_label} {{id: row.id}}) "
+            f"SET n += row.props, n:{self.quote_name(label)};\n"
+        )
+
+    def write_relationships_batch(
+        self, out: TextIO, rel_type: str, rows: List[Dict[str, Any]]
+    ):
+        out.write(f"UNWIND {self.literal(rows)} AS row\n")
+        out.write(
+            f"MATCH (a:{self.common_label} {{id: row.start}}) "
+            f"MATCH (b:{self.common_label} {{id: row.end}}) "
+            f"MERGE (a)-[:{self.quote_name(rel_type)}]->(b);\n"
+        )
+
+    def write(self, lod: List[Dict[str, Any]], out: Optional[TextIO] = None):
+        """Write the Cypher script for the given list of dicts.
+
+        Args:
+            lod: the list of dicts.
+            out: the stream to write to (default: stdout).
+        """
+        if out is None:
+            out = sys.stdout
+        out.write(
+            f"CREATE CONSTRAINT sem3_id IF NOT EXISTS "
+            f"FOR (n:{self.common_label}) REQUIRE n.id IS UNIQUE;\n"
+        )
+        self.id_minter.prepare(lod, self.type_name, self.id_field)
+        node_ids: Set[str] = set()
+        batches: Dict[str, List[Dict[str, Any]]] = {}
+        for node_id, label, props in self.iter_nodes(lod):
+            node_ids.add(node_id)
+            batch = batches.setdefault(label, [])
+            values = {key: self.to_value(value) for key, value in props.items()}
+            batch.append({"id": node_id, "props": values})
+            self.node_count += 1
+            if len(batch) >= self.batch_size:
+                self.write_nodes_batch(out, label, batch)
+                batches[label] = []
+        for label, batch in batches.items():
+            if batch:
+                self.write_nodes_batch(out, label, batch)
+
+        batches = {}
+        for start_id, end_id, rel_type in self.iter_relationships(lod, node_ids):
+            batch = batches.setdefault(rel_type, [])
+            batch.append({"start": start_id, "end": end_id})
+            self.relationship_count += 1
+            if len(batch) >= self.batch_size:
+                self.write_relationships_batch(out, rel_type, batch)
+                batches[rel_type] = []
+        for rel_type, batch in batches.items():
+            if batch:
+                self.write_relationships_batch(out, rel_type, batch)
+        if self.debug:
+            print(
+                f"cypher: {self.node_count} nodes {self.relationship_count} relationships"
+            )
@@ -0,0 +1,73 @@
+"""
+```yaml
+# 🌐🕸
+notebook:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: cell aware access to the sources of Jupyter notebooks for semantify³.
+```
+"""
+
+import json
+import os
+from typing import Iterator, List, Tuple, Union
+
+notebook_extensions = (".ipynb",)
+
+
+def is_notebook(filepath: str) -> bool:
+    """Check whether the given file is a Jupyter notebook by its extension."""
+    return os.path.splitext(filepath)[1].lower() in notebook_extensions
+
+
+def marker_variants(marker: str) -> List[bytes]:
+    """Get the byte sequences a marker can have in notebook JSON.
+
+    Notebooks are usually written with raw UTF-8 but some writers escape
+    non ASCII characters as ``\\uXXXX`` sequences.
+    """
+    escaped = json.dumps(marker)[1:-1]
+    variants = [marker.encode("utf-8"), escaped.encode("ascii")]
+    upper = escaped.replace("\\u", "\\U").upper().replace("\\U", "\\u")
+    if upper != escaped:
+        variants.append(upper.encode("ascii"))
+    return variants
+
+
+def iter_cell_sources(
+    content: Union[str, bytes], markers: List[bytes]
+) -> Iterator[Tuple[int, str]]:
+    """Iterate the sources of the cells of a notebook.
+
+    Outputs such as base64 encoded images are never looked at and the
+    JSON is not even parsed if none of the marker variants occurs.
+
+    Args:
+        content: the notebook JSON.
+        markers: the byte variants of the marker - see marker_variants.
+
+    Yields:
+        Tuple[int, str]: the index of the cell in ``cells`` and its source.
+
+    Raises:
+        ValueError: if the content is not valid JSON.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if not any(marker in data for marker in markers):
+        return
+    notebook = json.loads(data)
+    cells = notebook.get("cells")
+    if cells is None:
+        # nbformat 3: cells of the worksheets, code cells have "input"
+        cells = [
+            cell
+            for worksheet in notebook.get("worksheets", [])
+            for cell in worksheet.get("cells", [])
+        ]
+    for cell_idx, cell in enumerate(cells):
+        source = cell.get("source", cell.get("input", ""))
+        if isinstance(source, list):
+            source = "".join(source)
+        if source:
+            yield cell_idx, source
@@ -0,0 +1,182 @@
+"""
+```yaml
+# 🌐🕸
+parse_limits:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: resource bounded parsing of untrusted markup for semantify³.
+```
+"""
+
+import logging
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterator
+
+import yaml
+from basemkit.yamlable import lod_storable
+
+logger = logging.getLogger(__name__)
+
+
+class LimitExceeded(Exception):
+    """Raised when parsing a markup exceeds one of the ParseLimits."""
+
+    def __init__(self, limit: str, message: str):
+        super().__init__(f"{limit}: {message}")
+        self.limit = limit
+
+
+@lod_storable
+@dataclass
+class SkippedMarkup:
+    """A markup that was skipped since it exceeded a parse limit."""
+
+    source: str
+    lang: str
+    limit: str
+    reason: str
+
+
+@lod_storable
+@dataclass
+class ParseLimits:
+    """Per markup resource limits - 0 means unlimited."""
+
+    # maximum UTF-8 encoded size of the code of a markup in bytes
+    max_bytes: int = 1_000_000
+    # maximum number of YAML aliases
+    max_aliases: int = 100
+    # maximum number of YAML nodes with all aliases expanded
+    max_nodes: int = 100_000
+    # maximum nesting depth of YAML nodes
+    max_depth: int = 100
+    # maximum parse time in seconds - only the main thread on POSIX can be
+    # interrupted, other threads raise after the parse has finished
+    timeout: float = 10.0
+
+    def check_size(self, code: str):
+        """Check the UTF-8 encoded size of the given code.
+
+        Raises:
+            LimitExceeded: if the code is too large.
+        """
+        # a character takes 1 to 4 bytes - only encode if that is undecided
+        if not self.max_bytes or len(code) * 4 <= self.max_bytes:
+            return
+        size = len(code) if len(code) > self.max_bytes else len(code.encode("utf-8"))
+        if size > self.max_bytes:
+            raise LimitExceeded("max_bytes", f"{size} bytes > {self.max_bytes}")
+
+    def yaml_load(self, code: str) -> Any:
+        """Safely load YAML within the alias, expansion and depth limits.
+
+        Args:
+            code: the YAML source.
+
+        Returns:
+            Any: the loaded data.
+        """
+        loader = LimitedSafeLoader(code, self)
+        try:
+            return loader.get_single_data()
+        finally:
+            loader.dispose()
+
+    @contextmanager
+    def time_limit(self) -> Iterator[None]:
+        """Limit the time spent in the with block.
+
+        The block is interrupted via SIGALRM where available (main thread on
+        POSIX). Elsewhere the timeout can not be enforced: the elapsed time
+        is only checked when the block is done and a warning is logged once
+        per thread.
+
+        Raises:
+            LimitExceeded: if the block took longer than the timeout.
+        """
+        if not self.timeout:
+            yield
+            return
+        start = time.monotonic()
+        can_interrupt = (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+        if not can_interrupt:
+            warn_not_interruptible(threading.current_thread().name)
+            yield
+            elapsed = time.monotonic() - start
+            if elapsed > self.timeout:
+                raise LimitExceeded("timeout", f"{elapsed:.1f} s > {self.timeout} s")
+            return
+
+        def on_alarm(_signum, _frame):
+            raise LimitExceeded("timeout", f"parsing took more than {self.timeout} s")
+
+        previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, self.timeout)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+
+@lru_cache(maxsize=None)
+def warn_not_interruptible(thread_name: str):
+    """Warn once per thread that parse timeouts can not interrupt it."""
+    logger.warning(
+        f"parse timeout can not interrupt thread {thread_name} - "
+        "it is checked after each markup only"
+    )
+
+
+class LimitedSafeLoader(yaml.SafeLoader):
+    """SafeLoader that counts aliases, expanded nodes and nesting depth while
+    composing so that "billion laughs" style documents are rejected before
+    anything gets expanded."""
+
+    def __init__(self, stream, limits: ParseLimits):
+        super().__init__(stream)
+        self.limits = limits
+        self.alias_count = 0
+        self.depth = 0
+        # expanded node count by node id
+        self.node_sizes: Dict[int, int] = {}
+
+    def compose_node(self, parent, index):
+        limits = self.limits
+        if self.check_event(yaml.AliasEvent):
+            self.alias_count += 1
+            if limits.max_aliases and self.alias_count > limits.max_aliases:
+                raise LimitExceeded(
+                    "max_aliases", f"more than {limits.max_aliases} aliases"
+                )
+            return super().compose_node(parent, index)
+        self.depth += 1
+        if limits.max_depth and self.depth > limits.max_depth:
+            raise LimitExceeded("max_depth", f"nesting deeper than {limits.max_depth}")
+        try:
+            node = super().compose_node(parent, index)
+        finally:
+            self.depth -= 1
+        size = 1
+        if isinstance(node, yaml.SequenceNode):
+            for child in node.value:
+                size += self.node_sizes.get(id(child), 1)
+        elif isinstance(node, yaml.MappingNode):
+            for key, value in node.value:
+                size += self.node_sizes.get(id(key), 1)
+                size += self.node_sizes.get(id(value), 1)
+        if limits.max_nodes and size > limits.max_nodes:
+            raise LimitExceeded(
+                "max_nodes", f"more than {limits.max_nodes} nodes when expanded"
+            )
+        self.node_sizes[id(node)] = size
+        return node
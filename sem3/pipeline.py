@@ -0,0 +1,296 @@
+"""
+```yaml
+# 🌐🕸
+pipeline:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: pipelined read/scan/parse/emit stages with bounded queues for semantify³.
+```
+"""
+
+import queue
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from basemkit.yamlable import lod_storable
+
+from sem3.dedup import TripleDeduplicator
+from sem3.extractor import Extractor
+from sem3.lod2rdf import RDFDumper
+from sem3.rdf_backend import RDFBackend
+
+LOD = List[Dict[str, Any]]
+
+
+@lod_storable
+@dataclass
+class PipelineStats:
+    """Statistics of a pipeline run."""
+
+    files: int = 0
+    bytes: int = 0
+    markups: int = 0
+    entities: int = 0
+    # seconds until the first entities were handed to the sink
+    first_output: Optional[float] = None
+    seconds: float = 0.0
+
+    def __str__(self) -> str:
+        first = "-" if self.first_output is None else f"{self.first_output:.3f} s"
+        return (
+            f"{self.files} files ({self.bytes} bytes) → {self.markups} markups → "
+            f"{self.entities} entities in {self.seconds:.3f} s (first output after {first})"
+        )
+
+
+class NTriplesSink:
+    """Sink writing the N-Triples of each list of dicts chunk as soon as it arrives.
+
+    Without a deduplicator lines are not deduplicated across chunks - the
+    RDF stays the same graph but may contain repeated triples.
+    """
+
+    def __init__(
+        self,
+        dumper: RDFDumper,
+        type_name: str,
+        id_field: Optional[str],
+        out: IO[str],
+        dedup: Optional[TripleDeduplicator] = None,
+    ):
+        self.dumper = dumper
+        self.type_name = type_name
+        self.id_field = id_field
+        self.out = out
+        self.dedup = dedup
+        # running index so fallback ids match the non pipelined output
+        self.idx = 0
+        self.triples = 0
+
+    def __call__(self, lod: LOD):
+        self.dumper.id_minter.prepare(lod, self.type_name, self.id_field)
+        lines = []
+        for item in lod:
+            for triple in self.dumper.iter_resource_triples(
+                item, self.type_name, self.id_field, self.idx
+            ):
+                lines.append(self.dumper.to_ntriple(triple))
+            self.idx += 1
+        self.write_lines(lines)
+
+    def write_lines(self, lines: List[str]):
+        if self.dedup is not None:
+            lines = list(self.dedup.filter(lines))
+        self.out.writelines(lines)
+        self.out.flush()
+        self.triples += len(lines)
+
+    def close(self):
+        """Write the triples of the class hierarchy closure if types are inferred."""
+        lines = [
+            self.dumper.to_ntriple(t) for t in self.dumper.iter_hierarchy_triples()
+        ]
+        self.write_lines(lines)
+
+
+class GraphSink:
+    """Sink adding the triples of each chunk to an RDFBackend serialized on close."""
+
+    def __init__(
+        self,
+        dumper: RDFDumper,
+        type_name: str,
+        id_field: Optional[str],
+        output_format: str,
+        destination: Optional[str] = None,
+    ):
+        self.dumper = dumper
+        self.type_name = type_name
+        self.id_field = id_field
+        self.output_format = output_format
+        self.destination = destination
+        self.backend = RDFBackend.create(
+            dumper.backend, dumper.namespace_prefix, dumper.base_uri
+        )
+        self.idx = 0
+
+    def __call__(self, lod: LOD):
+        self.dumper.id_minter.prepare(lod, self.type_name, self.id_field)
+        for item in lod:
+            self.backend.add_all(
+                self.dumper.iter_resource_triples(
+                    item, self.type_name, self.id_field, self.idx
+                )
+            )
+            self.idx += 1
+
+    def close(self):
+        """Serialize the collected triples (stdout if no destination)."""
+        self.backend.add_all(self.dumper.iter_hierarchy_triples())
+        if self.destination:
+            self.backend.serialize(
+                destination=self.destination, format=self.output_format
+            )
+        else:
+            serialized = self.backend.serialize(format=self.output_format)
+            if isinstance(serialized, bytes):
+                serialized = serialized.decode("utf-8")
+            print(serialized)
+
+
+class Pipeline:
+    """Run reading, scanning/parsing and emitting of files concurrently.
+
+    Stages:
+        read: a thread pool prefetches the file contents (latency bound I/O)
+        scan/parse: the calling thread extracts and parses the markups so
+            that the SIGALRM based parse timeout stays effective
+        emit: a single thread hands the list of dicts chunks to the sink
+
+    The stages are connected by bounded queues so memory stays bounded and
+    throughput follows the slowest stage instead of the sum of all stages.
+    """
+
+    # polling interval for the bounded emit queue
+    poll_interval = 0.1
+
+    def __init__(
+        self,
+        extractor: Extractor,
+        read_threads: int = 8,
+        queue_size: int = 64,
+        debug: bool = False,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            extractor: the extractor for the scan/parse stage.
+            read_threads: number of threads prefetching file contents.
+            queue_size: maximum number of files read ahead / chunks waiting for the sink.
+            debug: if True print debug output.
+        """
+        self.extractor = extractor
+        self.read_threads = max(1, read_threads)
+        self.queue_size = max(1, queue_size)
+        self.debug = debug
+        self.stats = PipelineStats()
+
+    def read(self, filepath: str) -> Optional[Union[str, bytes]]:
+        """Read the content of a file - None if it is not readable text."""
+        try:
+            return self.extractor.read_content(filepath)
+        except (IOError, UnicodeDecodeError) as e:
+            self.extractor.logger.warning(f"Error reading {filepath}: {e}")
+            return None
+
+    def iter_contents(self, files: Iterable[str]) -> Iterator[tuple]:
+        """Prefetch the file contents with a bounded read ahead window.
+
+        Args:
+            files: the files to read - consumed lazily.
+
+        Yields:
+            tuple: (filepath, content) in the order of the given files.
+        """
+        window: Deque[tuple] = deque()
+        with ThreadPoolExecutor(max_workers=self.read_threads) as executor:
+            for filepath in files:
+                window.append((filepath, executor.submit(self.read, filepath)))
+                if len(window) >= self.queue_size:
+                    filepath, future = window.popleft()
+                    yield filepath, future.result()
+            while window:
+                filepath, future = window.popleft()
+                yield filepath, future.result()
+
+    def iter_lods(self, files: Iterable[str]) -> Iterator[LOD]:
+        """Scan and parse the prefetched files.
+
+        Yields:
+            LOD: the list of dicts of each file with markups.
+        """
+        extractor = self.extractor
+        for filepath, content in self.iter_contents(files):
+            self.stats.files += 1
+            if content is None:
+                continue
+            # bytes as read - decoded text is counted in its UTF-8 encoding
+            if isinstance(content, str):
+                self.stats.bytes += len(content.encode("utf-8"))
+            else:
+                self.stats.bytes += len(content)
+            markups = extractor.extract_from_content(content, filepath)
+            if not markups:
+                continue
+            self.stats.markups += len(markups)
+            lod = extractor.markups_to_lod(markups)
+            if lod:
+                yield lod
+
+    def run(self, files: Iterable[str], sink: Callable[[LOD], None]) -> PipelineStats:
+        """Run the pipeline.
+
+        Args:
+            files: the files to process - consumed lazily.
+            sink: called in the emit thread with each list of dicts chunk in file order.
+
+        Returns:
+            PipelineStats: the statistics of the run.
+        """
+        start = time.time()
+        chunks: "queue.Queue[Optional[LOD]]" = queue.Queue(maxsize=self.queue_size)
+
+        def emit():
+            while True:
+                lod = chunks.get()
+                if lod is None:
+                    break
+                if self.stats.first_output is None:
+                    self.stats.first_output = time.time() - start
+                sink(lod)
+
+        def put(lod: Optional[LOD], emitter: Future):
+            # do not block forever if the sink failed
+            while True:
+                if emitter.done():
+                    emitter.result()
+                    return
+                try:
+                    chunks.put(lod, timeout=self.poll_interval)
+                    return
+                except queue.Full:
+                    pass
+
+        with ThreadPoolExecutor(max_workers=1) as emit_executor:
+            emitter = emit_executor.submit(emit)
+            try:
+                for lod in self.iter_lods(files):
+                    self.stats.entities += len(lod)
+                    put(lod, emitter)
+            except BaseException:
+                # stop the emitter without hiding the extraction error
+                with suppress(Exception):
+                    put(None, emitter)
+                raise
+            put(None, emitter)
+            emitter.result()
+        self.stats.seconds = time.time() - start
+        if self.debug:
+            print(self.stats)
+        return self.stats
@@ -0,0 +1,292 @@
+"""
+```yaml
+# 🌐🕸
+rdf_backend:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: pluggable triple store and serializer backends for the RDFDumper of semantify³.
+```
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from rdflib import Graph, Literal, Namespace
+
+Triple = Tuple[Any, Any, Any]
+
+
+def nt_term(term: Any) -> str:
+    """Get the N-Triples representation of an IRI or literal.
+
+    Args:
+        term: URIRef or Literal.
+
+    Returns:
+        str: the N-Triples term.
+    """
+    if isinstance(term, Literal):
+        lexical = (
+            str(term)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+        if term.language:
+            return f'"{lexical}"@{term.language}'
+        if term.datatype:
+            return f'"{lexical}"^^<{term.datatype}>'
+        return f'"{lexical}"'
+    return f"<{term}>"
+
+
+def to_ntriple(triple: Triple) -> str:
+    """Get the N-Triples line (with trailing newline) of the given triple."""
+    s, p, o = triple
+    return f"{nt_term(s)} {nt_term(p)} {nt_term(o)} .\n"
+
+
+class RDFBackend(ABC):
+    """Interface of the triple stores/serializers the RDFDumper can target.
+
+    A backend collects the triples of an ``as_rdf`` run and serializes them
+    with the same ``serialize(destination=None, format=...)`` signature as
+    rdflib's Graph so that callers do not need to know the backend.
+    """
+
+    name = "abstract"
+    # formats the backend can serialize
+    formats: List[str] = []
+    # registry of backend classes by name
+    backends: Dict[str, Type["RDFBackend"]] = {}
+
+    def __init__(self, namespace_prefix: str, base_uri: str):
+        """Initialize the backend.
+
+        Args:
+            namespace_prefix: Prefix for namespace.
+            base_uri: Base URI for resources.
+        """
+        self.namespace_prefix = namespace_prefix
+        self.base_uri = base_uri
+
+    @classmethod
+    def register(cls, backend_class: Type["RDFBackend"]) -> Type["RDFBackend"]:
+        """Class decorator registering a backend by its name."""
+        cls.backends[backend_class.name] = backend_class
+        return backend_class
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check whether the (optional) dependencies of the backend are installed."""
+        return True
+
+    @classmethod
+    def available_backends(cls) -> List[str]:
+        """Get the names of the backends usable in this installation."""
+        return [
+            name
+            for name, backend_class in cls.backends.items()
+            if backend_class.is_available()
+        ]
+
+    @classmethod
+    def create(cls, name: str, namespace_prefix: str, base_uri: str) -> "RDFBackend":
+        """Create the backend with the given name.
+
+        Raises:
+            ValueError: if the backend is unknown or not installed.
+        """
+        backend_class = cls.backends.get(name)
+        if backend_class is None:
+            raise ValueError(f"unknown RDF backend {name}")
+        if not backend_class.is_available():
+            raise ValueError(f"RDF backend {name} is not installed")
+        return backend_class(namespace_prefix, base_uri)
+
+    def check_format(self, format: str):
+        if format not in self.formats:
+            raise ValueError(f"{self.name} backend can not serialize {format}")
+
+    @abstractmethod
+    def add(self, triple: Triple):
+        """Add a single triple."""
+
+    def add_all(self, triples: Iterable[Triple]):
+        """Add all given triples."""
+        for triple in triples:
+            self.add(triple)
+
+    def as_graph(self) -> Any:
+        """Get the object returned by RDFDumper.as_rdf."""
+        return self
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Get the number of triples."""
+
+    @abstractmethod
+    def serialize(
+        self, destination: Optional[str] = None, format: str = "turtle"
+    ) -> Optional[str]:
+        """Serialize the triples.
+
+        Args:
+            destination: the file path to write to (None → return string).
+            format: the serialization format.
+
+        Returns:
+            Optional[str]: the serialization if no destination was given.
+        """
+
+
+@RDFBackend.register
+class RdflibBackend(RDFBackend):
+    """Default backend - the rdflib in-memory Graph."""
+
+    name = "rdflib"
+    formats = ["turtle", "n3", "ntriples", "nt", "json-ld", "xml"]
+
+    def __init__(self, namespace_prefix: str, base_uri: str):
+        super().__init__(namespace_prefix, base_uri)
+        self.graph = Graph()
+        self.graph.bind(namespace_prefix, Namespace(base_uri))
+
+    def add(self, triple: Triple):
+        self.graph.add(triple)
+
+    def as_graph(self) -> Graph:
+        return self.graph
+
+    def __len__(self) -> int:
+        return len(self.graph)
+
+    def serialize(
+        self, destination: Optional[str] = None, format: str = "turtle"
+    ) -> Optional[str]:
+        return self.graph.serialize(destination=destination, format=format)
+
+
+@RDFBackend.register
+class NTriplesBackend(RDFBackend):
+    """Native N-Triples writer - deduplicated lines without an rdflib store."""
+
+    name = "ntriples"
+    formats = ["ntriples", "nt"]
+
+    def __init__(self, namespace_prefix: str, base_uri: str):
+        super().__init__(namespace_prefix, base_uri)
+        # insertion ordered set of lines
+        self.lines: Dict[str, None] = {}
+
+    def add(self, triple: Triple):
+        self.lines[to_ntriple(triple)] = None
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def serialize(
+        self, destination: Optional[str] = None, format: str = "ntriples"
+    ) -> Optional[str]:
+        self.check_format(format)
+        if destination is None:
+            return "".join(self.lines)
+        with open(destination, "w", encoding="utf-8") as f:
+            f.writelines(self.lines)
+        return None
+
+
+@RDFBackend.register
+class OxigraphBackend(RDFBackend):
+    """Optional pyoxigraph (Rust) in-memory store and serializers."""
+
+    name = "oxigraph"
+    formats = ["turtle", "n3", "ntriples", "nt", "json-ld", "xml"]
+
+    def __init__(self, namespace_prefix: str, base_uri: str):
+        super().__init__(namespace_prefix, base_uri)
+        import pyoxigraph
+
+        self.ox = pyoxigraph
+        self.store = pyoxigraph.Store()
+        self.default_graph = pyoxigraph.DefaultGraph()
+        format_names = {
+            "turtle": "TURTLE",
+            "n3": "N3",
+            "ntriples": "N_TRIPLES",
+            "nt": "N_TRIPLES",
+            # JSON_LD is missing in pyoxigraph releases before 0.5
+            "json-ld": "JSON_LD",
+            "xml": "RDF_XML",
+        }
+        self.format_map = {
+            fmt: getattr(pyoxigraph.RdfFormat, format_name)
+            for fmt, format_name in format_names.items()
+            if hasattr(pyoxigraph.RdfFormat, format_name)
+        }
+        self.formats = list(self.format_map)
+        self.nodes: Dict[str, Any] = {}
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import pyoxigraph  # noqa: F401
+
+            return True
+        except ImportError:
+            return False
+
+    def to_term(self, term: Any) -> Any:
+        """Convert an rdflib term to a pyoxigraph term."""
+        ox = self.ox
+        if isinstance(term, Literal):
+            if term.language:
+                return ox.Literal(str(term), language=term.language)
+            if term.datatype:
+                return ox.Literal(str(term), datatype=self.to_node(str(term.datatype)))
+            return ox.Literal(str(term))
+        return self.to_node(str(term))
+
+    def to_node(self, iri: str) -> Any:
+        node = self.nodes.get(iri)
+        if node is None:
+            node = self.ox.NamedNode(iri)
+            # IRIs of subjects are unique per resource - only cache the
+            # vocabulary to keep memory bounded
+            if len(self.nodes) < 100_000:
+                self.nodes[iri] = node
+        return node
+
+    def add(self, triple: Triple):
+        self.add_all([triple])
+
+    def add_all(self, triples: Iterable[Triple]):
+        ox = self.ox
+        to_term = self.to_term
+        quads = (
+            ox.Quad(to_term(s), to_term(p), to_term(o), self.default_graph)
+            for s, p, o in triples
+        )
+        self.store.extend(quads)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def serialize(
+        self, destination: Optional[str] = None, format: str = "turtle"
+    ) -> Optional[str]:
+        self.check_format(format)
+        prefixes = None
+        if format in ("turtle", "n3", "xml"):
+            prefixes = {self.namespace_prefix: self.base_uri}
+        data: Union[bytes, None] = self.store.dump(
+            destination,
+            format=self.format_map[format],
+            from_graph=self.default_graph,
+            prefixes=prefixes,
+        )
+        if data is None:
+            return None
+        return data.decode("utf-8")
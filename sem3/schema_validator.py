@@ -0,0 +1,235 @@
+"""
+```yaml
+# 🌐🕸
+schema_validator:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: compiled YAML schema validation of extracted LOD for semantify³.
+```
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+from basemkit.yamlable import lod_storable
+
+
+@lod_storable
+@dataclass
+class SchemaViolation:
+    """A single schema violation of an extracted entity."""
+
+    source: str
+    name: str
+    isA: str
+    prop: str
+    message: str
+
+    def __str__(self) -> str:
+        source = self.source or "unknown"
+        return f"{source}: {self.name} ({self.isA}) {self.prop}: {self.message}"
+
+
+# a compiled check returns an error message or None
+PropertyCheck = Callable[[Any], Optional[str]]
+# a compiled class validator returns a list of (prop, message) tuples
+ClassValidator = Callable[[Dict[str, Any]], List[Tuple[str, str]]]
+
+
+class SchemaValidator:
+    """Validate a list of dicts against a YAML schema.
+
+    The schema maps class names (the ``isA`` values) to their properties.
+    A property is either given by its type name or by a dict with the keys
+    ``type``, ``required`` (default: True) and ``pattern``::
+
+        PythonModule:
+          author: str
+          createdAt: date
+          purpose:
+            type: str
+            pattern: ".+"
+
+    The schema is compiled once into one validator function per class so that
+    large LODs are checked in a single pass without re-interpreting the schema.
+    """
+
+    type_checks: Dict[str, Callable[[Any], bool]] = {}
+
+    def __init__(self, schema: Dict[str, Any], debug: bool = False):
+        """Initialize and compile the validator.
+
+        Args:
+            schema: class name → property specification mapping.
+            debug: if True print debug output.
+
+        Raises:
+            ValueError: if the schema is malformed.
+        """
+        self.schema = schema
+        self.debug = debug
+        self.validators: Dict[str, ClassValidator] = {}
+        for class_name, props in schema.items():
+            self.validators[class_name] = self.compile_class(class_name, props)
+
+    @classmethod
+    def load(cls, schema_path: str, debug: bool = False) -> "SchemaValidator":
+        """Load and compile a YAML schema file.
+
+        Args:
+            schema_path: path of the YAML schema file.
+            debug: if True print debug output.
+
+        Returns:
+            SchemaValidator: the compiled validator.
+        """
+        with open(schema_path, "r", encoding="utf-8") as f:
+            schema = yaml.safe_load(f)
+        if not isinstance(schema, dict):
+            raise ValueError(f"schema {schema_path} must be a mapping of classes")
+        return cls(schema, debug=debug)
+
+    @staticmethod
+    def is_date(value: Any) -> bool:
+        if isinstance(value, date):
+            return True
+        if isinstance(value, str):
+            try:
+                date.fromisoformat(value)
+                return True
+            except ValueError:
+                return False
+        return False
+
+    @staticmethod
+    def is_datetime(value: Any) -> bool:
+        if isinstance(value, date):
+            return True
+        if isinstance(value, str):
+            try:
+                datetime.fromisoformat(value)
+                return True
+            except ValueError:
+                return False
+        return False
+
+    def compile_property(
+        self, class_name: str, prop: str, spec: Any
+    ) -> Tuple[bool, PropertyCheck]:
+        """Compile a single property specification.
+
+        Args:
+            class_name: the class the property belongs to (for error messages).
+            prop: the property name.
+            spec: type name or dict with type/required/pattern.
+
+        Returns:
+            Tuple[bool, PropertyCheck]: required flag and value check function.
+        """
+        if isinstance(spec, str) or spec is None:
+            spec = {"type": spec or "any"}
+        if not isinstance(spec, dict):
+            raise ValueError(f"{class_name}.{prop}: invalid property spec {spec!r}")
+        type_name = spec.get("type", "any")
+        type_check = self.type_checks.get(type_name)
+        if type_check is None:
+            raise ValueError(f"{class_name}.{prop}: unknown type {type_name}")
+        required = bool(spec.get("required", True))
+        pattern = spec.get("pattern")
+        regex = re.compile(pattern) if pattern else None
+
+        def check(value: Any) -> Optional[str]:
+            if not type_check(value):
+                return f"expected {type_name} but got {type(value).__name__} {value!r}"
+            if regex and not regex.fullmatch(str(value)):
+                return f"{value!r} does not match {pattern}"
+            return None
+
+        return required, check
+
+    def compile_class(
+        self, class_name: str, props: Optional[Dict[str, Any]]
+    ) -> ClassValidator:
+        """Compile the property specifications of a class into a validator function.
+
+        Args:
+            class_name: the name of the class.
+            props: property name → property specification.
+
+        Returns:
+            ClassValidator: function returning the (prop, message) errors of an entity.
+        """
+        if props is None:
+            props = {}
+        if not isinstance(props, dict):
+            raise ValueError(f"{class_name}: properties must be a mapping")
+        compiled = [
+            (prop, *self.compile_property(class_name, prop, spec))
+            for prop, spec in props.items()
+        ]
+
+        def validate(item: Dict[str, Any]) -> List[Tuple[str, str]]:
+            errors = []
+            for prop, required, check in compiled:
+                value = item.get(prop)
+                if value is None:
+                    if required:
+                        errors.append((prop, "missing required property"))
+                    continue
+                msg = check(value)
+                if msg:
+                    errors.append((prop, msg))
+            return errors
+
+        return validate
+
+    def validate(self, lod: List[Dict[str, Any]]) -> List[SchemaViolation]:
+        """Validate all entities of the given list of dicts in a single pass.
+
+        Entities whose ``isA`` is not declared in the schema are not checked.
+
+        Args:
+            lod: the list of dicts as returned by Extractor.markups_to_lod.
+
+        Returns:
+            List[SchemaViolation]: the violations found (empty if valid).
+        """
+        violations = []
+        validators = self.validators
+        for item in lod:
+            class_name = item.get("isA")
+            validator = (
+                validators.get(class_name) if isinstance(class_name, str) else None
+            )
+            if validator is None:
+                continue
+            for prop, message in validator(item):
+                violation = SchemaViolation(
+                    source=item.get("source", ""),
+                    name=str(item.get("name", "")),
+                    isA=class_name,
+                    prop=prop,
+                    message=message,
+                )
+                violations.append(violation)
+        if self.debug:
+            print(f"validated {len(lod)} entities: {len(violations)} violations")
+        return violations
+
+
+SchemaValidator.type_checks = {
+    "any": lambda value: True,
+    "str": lambda value: isinstance(value, str),
+    "int": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "float": lambda value: isinstance(value, (int, float))
+    and not isinstance(value, bool),
+    "bool": lambda value: isinstance(value, bool),
+    "date": SchemaValidator.is_date,
+    "datetime": SchemaValidator.is_datetime,
+    "list": lambda value: isinstance(value, list),
+    "dict": lambda value: isinstance(value, dict),
+}
@@ -11,19 +11,42 @@ sem3_cmd:
 """
 
 import glob
+import itertools
 import sys
 from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional
 
 from basemkit.base_cmd import BaseCmd
 
+from sem3.batch import BatchRunner
+from sem3.binary_rdf import BinaryRDFWriter
+from sem3.canonical import CanonicalWriter
+from sem3.census import Census
+from sem3.class_hierarchy import ClassHierarchy
+from sem3.compact_markup import SourceTable
+from sem3.dedup import TripleDeduplicator
 from sem3.extractor import Extractor
+from sem3.file_list import iter_files_from
+from sem3.filters import EntityFilter
 from sem3.lod2rdf import RDFDumper
+from sem3.neo4j_writer import CypherWriter, Neo4jCsvWriter
+from sem3.parse_limits import ParseLimits
+from sem3.pipeline import GraphSink, NTriplesSink, Pipeline
+from sem3.rdf_backend import RDFBackend
+from sem3.schema_validator import SchemaValidator
+from sem3.sparql_upload import SparqlUploader
+from sem3.sqlite_export import SqliteExporter
+from sem3.subject_ids import SubjectIdMinter
 from sem3.version import Version
 
 
 class Semantify3Cmd(BaseCmd):
     """Command line interface for semantify³."""
 
+    # formats serialized from the graph built by RDFDumper.as_rdf
+    graph_formats = ["turtle", "n3", "ntriples", "json-ld"]
+
     def __init__(self):
         """Initialize the semantify³ command."""
         super().__init__(version=Version, description=Version.description)
@@ -41,11 +64,17 @@ class Semantify3Cmd(BaseCmd):
             dest="input_patterns",
             help="Input file glob pattern (can be specified multiple times)",
         )
+        parser.add_argument(
+            "--files-from",
+            metavar="PATH",
+            help="read NUL or newline separated input file paths from PATH or - for stdin - processed as they arrive",
+        )
         parser.add_argument(
             "-o",
             "--output",
-            type=str,
-            help="Output file path for triples",
+            action="append",
+            dest="outputs",
+            help="Output file path for triples (can be specified multiple times - one per --format)",
         )
         parser.add_argument(
             "--extract",
@@ -53,8 +82,46 @@ class Semantify3Cmd(BaseCmd):
             help="only extract and display markup snippets",
         )
         parser.add_argument(
-            "--format",
+            "--batch",
             type=str,
+            metavar="MANIFEST",
+            help="process all repositories of the given batch manifest YAML file on one shared worker pool",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="number of worker processes for --batch (default: cpu count, 0: no worker processes)",
+        )
+        parser.add_argument(
+            "--pipeline",
+            action="store_true",
+            help="overlap reading, parsing and writing of the files - ntriples output is streamed as soon as a file is parsed",
+        )
+        parser.add_argument(
+            "--read-threads",
+            type=int,
+            default=8,
+            help="number of threads prefetching file contents for --pipeline and --census (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--census",
+            action="store_true",
+            help="only report the files, marked files and blocks per directory and extension - no parsing",
+        )
+        parser.add_argument(
+            "--scan-bytes",
+            type=int,
+            metavar="N",
+            help="header only mode: scan only the first N bytes of each file - extended to close a block starting in them",
+        )
+        parser.add_argument(
+            "--compact",
+            action="store_true",
+            help="keep markups as offsets into memory mapped sources to save memory",
+        )
+        parser.add_argument(
+            "--format",
             choices=[
                 "turtle",
                 "n3",
@@ -64,10 +131,52 @@ class Semantify3Cmd(BaseCmd):
                 # "sidif",
                 # "graphml",
                 # "graphson",
-                # "cypher",
+                "cypher",
+                "neo4j-csv",
+                "sem3b",
+                "sqlite",
             ],
-            default="turtle",
-            help="Output serialization format (default: turtle)",
+            action="append",
+            dest="formats",
+            help="Output serialization format (default: turtle) - neo4j-csv needs an --output directory, sqlite an --output database. "
+            "Can be specified multiple times with one --output each to write all formats from a single run",
+        )
+        parser.add_argument(
+            "--canonical",
+            action="store_true",
+            help="write ntriples or subject grouped turtle in a deterministic sorted order",
+        )
+        parser.add_argument(
+            "--sort-buffer",
+            type=int,
+            default=100_000,
+            help="lines kept in memory by --canonical before spilling a sorted run to a temporary file (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--dedup-memory",
+            type=float,
+            default=64,
+            metavar="MB",
+            help="memory ceiling of the triple deduplication of streamed ntriples and sem3b output - spilling to disk beyond (default: %(default)s, 0=no deduplication)",
+        )
+        parser.add_argument(
+            "--bloom",
+            type=float,
+            default=0,
+            metavar="MB",
+            help="size of the bloom filter saving disk lookups of the spilled triple deduplication (default: %(default)s=none)",
+        )
+        parser.add_argument(
+            "--backend",
+            choices=list(RDFBackend.backends.keys()),
+            default="rdflib",
+            help="RDF backend to collect and serialize the triples (default: %(default)s) - oxigraph needs pyoxigraph, ntriples only writes ntriples",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="rows per batch for bulk output formats (default: %(default)s)",
         )
         parser.add_argument(
             "--base-uri",
@@ -93,6 +202,100 @@ class Semantify3Cmd(BaseCmd):
             default="name",
             help="Dict field for subject ID (default: name)",
         )
+        parser.add_argument(
+            "--id-scheme",
+            choices=SubjectIdMinter.schemes,
+            default="hash",
+            help="subject ids of entities without --id-field: hash of source and content or index in the list (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--class-hierarchy",
+            type=str,
+            metavar="PATH",
+            help="YAML file (class: superclass) or file with subClassOf markup declaring the isA class hierarchy",
+        )
+        parser.add_argument(
+            "--infer-types",
+            action="store_true",
+            help="add rdf:type triples of all superclasses and the rdfs:subClassOf closure of the class hierarchy",
+        )
+        parser.add_argument(
+            "--only-isa",
+            action="append",
+            metavar="CLASS",
+            help="only keep entities of this isA class or its --class-hierarchy subclasses (can be specified multiple times)",
+        )
+        parser.add_argument(
+            "--where",
+            action="append",
+            metavar="KEY=VALUE",
+            help="only keep entities with this property value (can be specified multiple times - all must match)",
+        )
+        parser.add_argument(
+            "--upload",
+            type=str,
+            metavar="ENDPOINT",
+            help="upload the triples to the given SPARQL graph store/update endpoint (replacing the graph of each source file)",
+        )
+        parser.add_argument(
+            "--upload-protocol",
+            choices=SparqlUploader.protocols,
+            default="gsp",
+            help="gsp: SPARQL 1.1 Graph Store Protocol, update: SPARQL 1.1 Update (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--upload-threads",
+            type=int,
+            default=4,
+            help="number of concurrent upload requests (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--upload-retries",
+            type=int,
+            default=3,
+            help="number of retries of a failed upload request (default: %(default)s)",
+        )
+        limits = ParseLimits()
+        parser.add_argument(
+            "--max-markup-bytes",
+            type=int,
+            default=limits.max_bytes,
+            help="skip markups larger than this many UTF-8 encoded bytes (default: %(default)s, 0=unlimited)",
+        )
+        parser.add_argument(
+            "--max-yaml-aliases",
+            type=int,
+            default=limits.max_aliases,
+            help="skip YAML markups with more aliases (default: %(default)s, 0=unlimited)",
+        )
+        parser.add_argument(
+            "--max-yaml-nodes",
+            type=int,
+            default=limits.max_nodes,
+            help="skip YAML markups with more nodes when aliases are expanded (default: %(default)s, 0=unlimited)",
+        )
+        parser.add_argument(
+            "--max-yaml-depth",
+            type=int,
+            default=limits.max_depth,
+            help="skip YAML markups nested deeper (default: %(default)s, 0=unlimited)",
+        )
+        parser.add_argument(
+            "--parse-timeout",
+            type=float,
+            default=limits.timeout,
+            help="skip markups taking longer to parse in seconds (default: %(default)s, 0=unlimited)",
+        )
+        parser.add_argument(
+            "--schema",
+            type=str,
+            help="YAML schema file to validate the extracted entities against",
+        )
+        parser.add_argument(
+            "--validate",
+            action="store_true",
+            help="only validate the extracted entities against the --schema - no RDF output",
+        )
 
         return parser
 
@@ -108,24 +311,369 @@ class Semantify3Cmd(BaseCmd):
 
         return sorted(list(set(file_list)))
 
-    def serialize_lod(self, lod: list[dict], args) -> bool:
-        """LOD → RDF Graph → serialize (file/stdout)."""
+    def write_neo4j(self, lod: list[dict], args) -> bool:
+        """LOD → neo4j-admin import CSV files or batched Cypher script."""
+        if args.format == "neo4j-csv":
+            if not args.output:
+                raise ValueError("--format neo4j-csv needs an --output directory")
+            writer = Neo4jCsvWriter(
+                args.type_name,
+                args.id_field,
+                args.batch_size,
+                debug=self.debug,
+                id_scheme=args.id_scheme,
+            )
+            writer.write(lod, args.output)
+        else:
+            writer = CypherWriter(
+                args.type_name,
+                args.id_field,
+                args.batch_size,
+                debug=self.debug,
+                id_scheme=args.id_scheme,
+            )
+            if args.output:
+                with open(args.output, "w", encoding="utf-8") as out:
+                    writer.write(lod, out)
+            else:
+                writer.write(lod)
+        if self.debug and args.output:
+            print(f"{args.format} saved to: {args.output}")
+        return True
+
+    def get_dumper(self, args: Namespace, lod: Optional[list] = None) -> RDFDumper:
+        """Get the RDFDumper for the arguments.
+
+        The class hierarchy of --class-hierarchy is extended by the
+        subClassOf declarations of the given list of dicts.
+        """
+        hierarchy = None
+        if args.class_hierarchy or args.infer_types:
+            if args.class_hierarchy:
+                hierarchy = ClassHierarchy.load(args.class_hierarchy, debug=self.debug)
+            else:
+                hierarchy = ClassHierarchy(debug=self.debug)
+            if lod:
+                hierarchy.add_lod(lod)
         dumper = RDFDumper(
             base_uri=args.base_uri,
             namespace_prefix=args.namespace,
-            debug=self.debug,  # Pass CLI debug
+            debug=self.debug,
+            backend=args.backend,
+            id_scheme=args.id_scheme,
+            class_hierarchy=hierarchy,
+            infer_types=args.infer_types,
         )
-        rdf_graph = dumper.as_rdf(lod, args.type_name, args.id_field)
-        output_format = args.format
-        if args.output:
-            rdf_graph.serialize(destination=args.output, format=output_format)
+        return dumper
+
+    def get_entity_filter(self, args: Namespace) -> Optional[EntityFilter]:
+        """Get the entity filter of the --only-isa and --where arguments."""
+        if not args.only_isa and not args.where:
+            return None
+        hierarchy = None
+        if args.only_isa and args.class_hierarchy:
+            hierarchy = ClassHierarchy.load(args.class_hierarchy, debug=self.debug)
+        entity_filter = EntityFilter(
+            only_isa=args.only_isa, where=args.where, class_hierarchy=hierarchy
+        )
+        return entity_filter
+
+    def get_canonical_writer(self, dumper: RDFDumper, args) -> CanonicalWriter:
+        """Get the sorting writer for --canonical output."""
+        writer = CanonicalWriter(
+            dumper,
+            args.type_name,
+            args.id_field,
+            output_format=args.format,
+            destination=args.output,
+            max_lines=args.sort_buffer,
+        )
+        return writer
+
+    def get_dedup(self, args: Namespace) -> Optional[TripleDeduplicator]:
+        """Get the triple deduplicator for streamed output (None if disabled)."""
+        if not args.dedup_memory or args.dedup_memory <= 0:
+            return None
+        dedup = TripleDeduplicator(max_memory_mb=args.dedup_memory, bloom_mb=args.bloom)
+        return dedup
+
+    def write_binary(self, dumper: RDFDumper, lod: list[dict], args) -> bool:
+        """LOD → triples → streamed sem3b binary RDF (file/stdout)."""
+        triples = dumper.iter_triples(lod, args.type_name, args.id_field)
+        dedup = self.get_dedup(args)
+        # --dedup-memory 0 writes repeated triples as well
+        deduplicate = dedup is not None
+        try:
+            if args.output:
+                with (
+                    open(args.output, "wb") as out,
+                    BinaryRDFWriter(
+                        out, dedup=dedup, deduplicate=deduplicate
+                    ) as writer,
+                ):
+                    writer.write_all(triples)
+            else:
+                with BinaryRDFWriter(
+                    sys.stdout.buffer, dedup=dedup, deduplicate=deduplicate
+                ) as writer:
+                    writer.write_all(triples)
+        finally:
+            if dedup is not None:
+                dedup.close()
+        if self.debug:
+            print(f"sem3b: {writer.triple_count} triples", file=sys.stderr)
+            if dedup is not None:
+                print(dedup, file=sys.stderr)
+        return True
+
+    def write_sqlite(self, lod: list[dict], args) -> bool:
+        """LOD → entity and property tables of the --output SQLite database."""
+        if not args.output:
+            raise ValueError("--format sqlite needs an --output database")
+        exporter = SqliteExporter(
+            args.output,
+            type_name=args.type_name,
+            id_field=args.id_field,
+            batch_size=args.batch_size,
+            debug=self.debug,
+        )
+        exporter.write(lod, source_files=getattr(args, "scanned_files", None))
+        return True
+
+    @staticmethod
+    def record_files(files: Iterable[str], scanned: List[str]) -> Iterator[str]:
+        """Yield the given files recording each one as scanned."""
+        for filepath in files:
+            scanned.append(filepath)
+            yield filepath
+
+    def resolve_targets(self, args: Namespace):
+        """Pair the --format and --output arguments into args.targets.
+
+        args.format and args.output are set to the first target.
+
+        Raises:
+            ValueError: if multiple formats or outputs are not given pairwise.
+        """
+        formats = args.formats or ["turtle"]
+        outputs = args.outputs or []
+        if len(formats) > 1 or len(outputs) > 1:
+            if len(formats) != len(outputs):
+                raise ValueError(
+                    f"{len(formats)} --format and {len(outputs)} --output given - "
+                    "multiple outputs need one --format and --output each"
+                )
+            args.targets = list(zip(formats, outputs))
+        else:
+            args.targets = [(formats[0], outputs[0] if outputs else None)]
+        args.format, args.output = args.targets[0]
+
+    def write_graph(self, rdf_graph, output_format: str, output: Optional[str]):
+        """Serialize the given graph (file/stdout)."""
+        if output:
+            rdf_graph.serialize(destination=output, format=output_format)
             if self.debug:
-                print(f"RDF saved to: {args.output}")
+                print(f"RDF saved to: {output}")
         else:
             serialized = rdf_graph.serialize(format=output_format)
             if isinstance(serialized, bytes):
                 serialized = serialized.decode("utf-8")
             print(serialized)
+
+    def serialize_lod(self, lod: list[dict], args) -> bool:
+        """LOD → RDF Graph → serialize to all --format/--output targets.
+
+        The graph is built once for all graph formats, the targets are
+        written concurrently.
+        """
+        if len(args.targets) == 1:
+            return self.serialize_target(lod, args)
+        graph_targets = []
+        other_targets = []
+        for output_format, output in args.targets:
+            if output_format in self.graph_formats and not args.canonical:
+                graph_targets.append((output_format, output))
+            else:
+                target_args = Namespace(**vars(args))
+                target_args.format, target_args.output = output_format, output
+                other_targets.append(target_args)
+        rdf_graph = None
+        if graph_targets:
+            dumper = self.get_dumper(args, lod)
+            rdf_graph = dumper.as_rdf(lod, args.type_name, args.id_field)
+        with ThreadPoolExecutor(max_workers=len(args.targets)) as executor:
+            futures = [
+                executor.submit(self.write_graph, rdf_graph, output_format, output)
+                for output_format, output in graph_targets
+            ]
+            # other writers get their own dumper to not share state
+            futures.extend(
+                executor.submit(self.serialize_target, lod, target_args)
+                for target_args in other_targets
+            )
+            for future in futures:
+                future.result()
+        return True
+
+    def serialize_target(self, lod: list[dict], args) -> bool:
+        """LOD → RDF Graph → serialize args.format to args.output (file/stdout)."""
+        if args.format in ("cypher", "neo4j-csv"):
+            return self.write_neo4j(lod, args)
+        if args.format == "sqlite":
+            return self.write_sqlite(lod, args)
+        dumper = self.get_dumper(args, lod)
+        if args.canonical:
+            self.get_canonical_writer(dumper, args).write(lod)
+            return True
+        if args.format == "sem3b":
+            return self.write_binary(dumper, lod, args)
+        rdf_graph = dumper.as_rdf(lod, args.type_name, args.id_field)
+        self.write_graph(rdf_graph, args.format, args.output)
+        return True
+
+    def upload_lod(self, lod: list[dict], args) -> bool:
+        """LOD → triples → batched upload to the SPARQL endpoint."""
+        dumper = self.get_dumper(args, lod)
+        uploader = SparqlUploader(
+            args.upload,
+            protocol=args.upload_protocol,
+            batch_size=args.batch_size,
+            max_in_flight=args.upload_threads,
+            retries=args.upload_retries,
+            debug=self.debug,
+        )
+        stats = uploader.upload_lod(lod, dumper, args.type_name, args.id_field)
+        if args.verbose:
+            print(stats)
+        return True
+
+    def get_parse_limits(self, args: Namespace) -> ParseLimits:
+        """Get the per markup parse limits from the command line arguments."""
+        limits = ParseLimits(
+            max_bytes=args.max_markup_bytes,
+            max_aliases=args.max_yaml_aliases,
+            max_nodes=args.max_yaml_nodes,
+            max_depth=args.max_yaml_depth,
+            timeout=args.parse_timeout,
+        )
+        return limits
+
+    def validate_lod(self, lod: list[dict], args) -> bool:
+        """Validate the LOD against the --schema and report violations.
+
+        Returns:
+            bool: True if the LOD is valid.
+        """
+        validator = SchemaValidator.load(args.schema, debug=self.debug)
+        violations = validator.validate(lod)
+        # stdout may carry the RDF output
+        for violation in violations:
+            print(violation, file=sys.stderr)
+        if args.verbose or self.debug:
+            print(
+                f"{len(violations)} schema violations in {len(lod)} entities",
+                file=sys.stderr,
+            )
+        if violations:
+            self.exit_code = 1
+        return not violations
+
+    def run_pipeline(self, files: list, extractor: Extractor, args: Namespace) -> bool:
+        """Read, parse and serialize the files in a pipeline."""
+        for option in ["compact", "schema", "upload"]:
+            if getattr(args, option):
+                raise ValueError(f"--pipeline does not support --{option}")
+        if len(args.targets) > 1:
+            raise ValueError("--pipeline supports a single --format")
+        if args.format in ("cypher", "neo4j-csv", "sem3b", "sqlite"):
+            raise ValueError(f"--pipeline does not support --format {args.format}")
+        # the hierarchy must be known before the first chunk: --class-hierarchy only
+        dumper = self.get_dumper(args)
+        pipeline = Pipeline(extractor, read_threads=args.read_threads, debug=self.debug)
+        if args.canonical:
+            sink = self.get_canonical_writer(dumper, args)
+            pipeline.run(files, sink)
+            sink.close()
+        elif args.format == "ntriples":
+            out = (
+                open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+            )
+            dedup = self.get_dedup(args)
+            try:
+                sink = NTriplesSink(
+                    dumper, args.type_name, args.id_field, out, dedup=dedup
+                )
+                pipeline.run(files, sink)
+                sink.close()
+            finally:
+                if args.output:
+                    out.close()
+                if dedup is not None:
+                    dedup.close()
+                    if args.verbose:
+                        print(dedup, file=sys.stderr)
+        else:
+            sink = GraphSink(
+                dumper, args.type_name, args.id_field, args.format, args.output
+            )
+            pipeline.run(files, sink)
+            sink.close()
+        if args.verbose:
+            print(pipeline.stats, file=sys.stderr)
+        return True
+
+    def run_census(self, files: list, extractor: Extractor, args: Namespace) -> bool:
+        """Report the marker density of the files by fence scan only."""
+        census = Census(extractor, threads=args.read_threads, debug=self.debug)
+        report = census.run(files)
+        print(report.to_yaml())
+        return True
+
+    def run_batch(self, args: Namespace) -> bool:
+        """Run the batch manifest given by --batch and show the summary."""
+        runner = BatchRunner.from_manifest_file(
+            args.batch,
+            workers=args.workers,
+            limits=self.get_parse_limits(args),
+            backend=args.backend,
+            scan_bytes=args.scan_bytes,
+            debug=self.debug,
+        )
+        summary = runner.run()
+        print(summary.to_yaml())
+        if summary.errors:
+            self.exit_code = 1
+        return True
+
+    def handle_markups(
+        self, extractor: Extractor, markups: list, args: Namespace
+    ) -> bool:
+        """Print or convert, validate, serialize and upload the extracted markups."""
+        if args.extract:
+            extractor.print_markups(markups, verbose=args.verbose)
+        else:
+            # get the list of dict representation of the markups
+            lod = extractor.markups_to_lod(markups)
+            if self.debug:
+                print(f"LOD: {len(lod)} items")
+            if extractor.skipped and (args.verbose or self.debug):
+                print(f"skipped {len(extractor.skipped)} markups exceeding limits")
+            entity_filter = extractor.entity_filter
+            if entity_filter and (args.verbose or self.debug):
+                print(
+                    f"filter: {entity_filter.skipped_blocks} markups not parsed, "
+                    f"{entity_filter.filtered_entities} entities dropped"
+                )
+            if args.validate and not args.schema:
+                raise ValueError("--validate needs a --schema")
+            if args.schema:
+                self.validate_lod(lod, args)
+            if not args.validate:
+                # with --upload only write RDF if an --output is given
+                if args.output or not args.upload:
+                    self.serialize_lod(lod, args)
+                if args.upload:
+                    self.upload_lod(lod, args)
         return True
 
     def handle_args(self, args: Namespace) -> bool:
@@ -134,6 +682,10 @@ class Semantify3Cmd(BaseCmd):
         if handled:
             return True
 
+        self.resolve_targets(args)
+        if args.batch:
+            return self.run_batch(args)
+
         # 1. Collect all input patterns from both -i and positional arguments
         raw_patterns = []
         if args.input_patterns:
@@ -141,27 +693,41 @@ class Semantify3Cmd(BaseCmd):
         if args.files:
             raw_patterns.extend(args.files)
 
-        if raw_patterns:
+        if raw_patterns or args.files_from:
             # 2. Expand globs and deduplicate before passing to Extractor
             files = self.expand_files(raw_patterns)
 
-            if not files and args.verbose:
+            if args.files_from:
+                # streamed paths are neither globbed nor sorted
+                files = itertools.chain(files, iter_files_from(args.files_from))
+            elif not files and args.verbose:
                 print("No files found matching the provided patterns.")
                 return True
 
-            extractor = Extractor(debug=self.debug)
+            extractor = Extractor(
+                debug=self.debug,
+                limits=self.get_parse_limits(args),
+                scan_bytes=args.scan_bytes,
+                entity_filter=self.get_entity_filter(args),
+            )
 
+            if args.census:
+                return self.run_census(files, extractor, args)
+
+            if args.pipeline and not args.extract:
+                return self.run_pipeline(files, extractor, args)
+
+            # the scanned files are refreshed even without markup left in them
+            args.scanned_files = []
+            files = self.record_files(files, args.scanned_files)
             # Passing concrete files list to the extractor
-            markups = extractor.extract_from_glob_list(files)
-            if args.extract:
-                extractor.print_markups(markups, verbose=args.verbose)
-            else:
-                # get the list of dict representation of the markups
-                lod = extractor.markups_to_lod(markups)
-                if self.debug:
-                    print(f"LOD: {len(lod)} items")
-                self.serialize_lod(lod, args)
-            return True
+            if args.compact:
+                # compact markups read their code from the open source table
+                with SourceTable() as table:
+                    markups = extractor.extract_compact_from_files(files, table)
+                    return self.handle_markups(extractor, markups, args)
+            markups = extractor.extract_from_files(files)
+            return self.handle_markups(extractor, markups, args)
 
         return False
 
@@ -0,0 +1,124 @@
+"""
+```yaml
+# 🌐🕸
+sidif_fast:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: linear time parser for the common SiDIF subset with fallback to py-sidif for semantify³.
+```
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+from sidif.sidif import SiDIFParser
+
+DictOfDicts = Dict[str, Dict[str, Any]]
+
+
+class FastSiDIFParser:
+    """Parse the common SiDIF subset without pyparsing.
+
+    The subset consists of blank lines, ``#`` comments and the lines::
+
+        X isA Y
+        "value" is prop of it
+        42 is prop of it
+        true is prop of it
+
+    with ASCII identifiers, one line strings without tabs and decimal
+    integers. Any other line makes the whole text fall back to the full
+    py-sidif parser so that the result is always what
+    ``DataInterchange.toDictOfDicts()`` would give.
+    """
+
+    identifier = r"[A-Za-z_][A-Za-z0-9_]*"
+    isa_pattern = re.compile(rf"^({identifier})[ \t]+isA[ \t]+({identifier})$")
+    value_pattern = re.compile(
+        rf'^(?:"([^"\t]*)"|(true|false)|([+-]?[0-9]+))[ \t]*'
+        rf"is[ \t]+({identifier})[ \t]+of[ \t]+it$"
+    )
+    # pyparsing Latin1 printables plus blanks
+    comment_pattern = re.compile(r"^#[ \t!-~¡-ÿ]*$")
+
+    def __init__(self, fallback: Optional[SiDIFParser] = None):
+        """Initialize the parser.
+
+        Args:
+            fallback: the full parser - created when first needed if None.
+        """
+        self.fallback = fallback
+        self.fast_count = 0
+        self.fallback_count = 0
+
+    def parse_subset(self, text: str) -> Optional[DictOfDicts]:
+        """Parse the given text if it is in the subset.
+
+        Args:
+            text: the SiDIF text.
+
+        Returns:
+            Optional[DictOfDicts]: the dict of dicts or None if the text uses
+            constructs outside of the subset.
+        """
+        if not text or "\r" in text:
+            return None
+        dod: DictOfDicts = {}
+        it: Optional[Dict[str, Any]] = None
+        for line in text.split("\n"):
+            line = line.strip(" \t")
+            if not line:
+                continue
+            if line[0] == "#":
+                if not self.comment_pattern.match(line):
+                    return None
+                continue
+            match = self.isa_pattern.match(line)
+            if match:
+                subject, type_name = match.groups()
+                # "ofY" would be read as "X is A of Y" and "it" as reference
+                if type_name == "it" or (
+                    type_name.startswith("of") and len(type_name) > 2
+                ):
+                    return None
+                it = dod.setdefault(subject, {})
+                it["isA"] = type_name
+                continue
+            match = self.value_pattern.match(line)
+            if match is None or it is None:
+                return None
+            string_value, bool_value, int_value, prop = match.groups()
+            if string_value is not None:
+                value = string_value
+            elif bool_value is not None:
+                value = bool_value == "true"
+            else:
+                value = int(int_value)
+            it[prop] = value
+        return dod
+
+    def to_dict_of_dicts(self, text: str) -> Optional[DictOfDicts]:
+        """Parse the given SiDIF text to a dict of dicts.
+
+        Args:
+            text: the SiDIF text.
+
+        Returns:
+            Optional[DictOfDicts]: the dict of dicts or None if py-sidif
+            reported a parse error.
+
+        Raises:
+            Exception: as toDictOfDicts for invalid "it" references.
+        """
+        dod = self.parse_subset(text)
+        if dod is not None:
+            self.fast_count += 1
+            return dod
+        self.fallback_count += 1
+        if self.fallback is None:
+            self.fallback = SiDIFParser(showErrors=False)
+        result, error = self.fallback.parseText(text)
+        if error is not None or not result:
+            return None
+        return result[0].toDictOfDicts()
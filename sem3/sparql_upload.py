@@ -0,0 +1,314 @@
+"""
+```yaml
+# 🌐🕸
+sparql_upload:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: batched bulk upload of triples to SPARQL graph store or update endpoints for semantify³.
+```
+"""
+
+import http.client
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote, urlencode, urlsplit
+
+from basemkit.yamlable import lod_storable
+
+from sem3.extractor import source_file as get_source_file
+from sem3.lod2rdf import RDFDumper
+
+
+class UploadError(Exception):
+    """Raised when a batch could not be uploaded."""
+
+
+@lod_storable
+@dataclass
+class UploadStats:
+    """Statistics of an upload."""
+
+    graphs: int = 0
+    batches: int = 0
+    triples: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"uploaded {self.triples} triples in {self.batches} batches "
+            f"to {self.graphs} graphs in {self.seconds:.1f} s ({self.retries} retries)"
+        )
+
+
+class ConnectionPool:
+    """Pool of keep-alive HTTP connections to a single host."""
+
+    def __init__(self, url: str, size: int, timeout: float = 60.0):
+        """Initialize the pool.
+
+        Args:
+            url: the endpoint URL.
+            size: the maximum number of pooled connections.
+            timeout: socket timeout in seconds.
+        """
+        parts = urlsplit(url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path or "/"
+        self.query = parts.query
+        self.timeout = timeout
+        self.pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(
+            maxsize=size
+        )
+
+    def new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def request(
+        self, method: str, path: str, body: bytes, headers: Dict[str, str]
+    ) -> Tuple[int, bytes]:
+        """Send a request on a pooled connection.
+
+        Returns:
+            Tuple[int, bytes]: the HTTP status and the response body.
+        """
+        try:
+            conn = self.pool.get_nowait()
+        except queue.Empty:
+            conn = self.new_connection()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except Exception:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            try:
+                self.pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+        return response.status, data
+
+    def close(self):
+        """Close all pooled connections."""
+        while True:
+            try:
+                self.pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class SparqlUploader:
+    """Stream the triples of a list of dicts to a SPARQL endpoint in batches.
+
+    Supported protocols:
+        gsp: SPARQL 1.1 Graph Store HTTP Protocol - PUT replaces, POST appends
+        update: SPARQL 1.1 Update - DROP SILENT GRAPH + INSERT DATA
+
+    Each source file gets its own named graph which is replaced by the
+    first batch of the file and appended to by the following ones.
+    """
+
+    protocols = ["gsp", "update"]
+
+    def __init__(
+        self,
+        endpoint: str,
+        protocol: str = "gsp",
+        batch_size: int = 10000,
+        max_in_flight: int = 4,
+        retries: int = 3,
+        backoff: float = 0.5,
+        replace: bool = True,
+        timeout: float = 60.0,
+        debug: bool = False,
+    ):
+        """Initialize the uploader.
+
+        Args:
+            endpoint: the graph store or update endpoint URL.
+            protocol: gsp or update.
+            batch_size: number of triples per request.
+            max_in_flight: number of concurrent requests.
+            retries: number of retries of a failed request.
+            backoff: initial backoff in seconds - doubled with every retry.
+            replace: if True replace the graph of each source file.
+            timeout: socket timeout in seconds.
+            debug: if True print debug output.
+        """
+        if protocol not in self.protocols:
+            raise ValueError(f"unknown upload protocol {protocol}")
+        self.endpoint = endpoint
+        self.protocol = protocol
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.backoff = backoff
+        self.replace = replace
+        self.debug = debug
+        self.pool = ConnectionPool(endpoint, max_in_flight, timeout)
+        self.stats = UploadStats()
+        self.lock = threading.Lock()
+
+    def graph_uri(self, base_uri: str, source_file: str) -> str:
+        """Get the named graph URI for the given source file."""
+        name = quote(source_file, safe="/") if source_file else "default"
+        return f"{base_uri}graph/{name}"
+
+    def request_for(
+        self, graph_uri: str, body: str, first: bool
+    ) -> Tuple[str, str, bytes, Dict[str, str]]:
+        """Get method, path, body and headers of a batch request."""
+        pool = self.pool
+        query = pool.query
+        if self.protocol == "gsp":
+            method = "PUT" if first and self.replace else "POST"
+            graph_query = urlencode({"graph": graph_uri})
+            query = f"{query}&{graph_query}" if query else graph_query
+            headers = {"Content-Type": "application/n-triples"}
+        else:
+            method = "POST"
+            update = f"INSERT DATA {{ GRAPH <{graph_uri}> {{\n{body}}} }}"
+            if first and self.replace:
+                update = f"DROP SILENT GRAPH <{graph_uri}> ;\n{update}"
+            body = update
+            headers = {"Content-Type": "application/sparql-update"}
+        path = f"{pool.path}?{query}" if query else pool.path
+        return method, path, body.encode("utf-8"), headers
+
+    def send(self, graph_uri: str, lines: List[str], first: bool):
+        """Send a batch with retry and exponential backoff.
+
+        Raises:
+            UploadError: if the batch failed after all retries.
+        """
+        method, path, body, headers = self.request_for(graph_uri, "".join(lines), first)
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            error = None
+            try:
+                status, data = self.pool.request(method, path, body, headers)
+                if 200 <= status < 300:
+                    with self.lock:
+                        self.stats.batches += 1
+                        self.stats.triples += len(lines)
+                    return
+                error = f"HTTP {status}: {data[:200]!r}"
+                if status < 500 and status != 429:
+                    break
+            except (OSError, http.client.HTTPException) as ex:
+                error = str(ex)
+            if attempt < self.retries:
+                with self.lock:
+                    self.stats.retries += 1
+                time.sleep(delay)
+                delay *= 2
+        raise UploadError(f"{method} {graph_uri} failed: {error}")
+
+    def iter_graphs(
+        self,
+        lod: List[Dict[str, Any]],
+        dumper: RDFDumper,
+        type_name: str,
+        id_field: Optional[str],
+    ) -> Iterator[Tuple[str, Iterator[str]]]:
+        """Group the N-Triples lines of the list of dicts by source file graph."""
+        dumper.id_minter.prepare(lod, type_name, id_field)
+        by_file: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        for idx, item in enumerate(lod):
+            item_dict = asdict(item) if is_dataclass(item) else item
+            source_file = get_source_file(item_dict.get("source"))
+            by_file.setdefault(source_file, []).append((idx, item_dict))
+        for source_file, items in by_file.items():
+
+            def lines(items=items) -> Iterator[str]:
+                for idx, item_dict in items:
+                    for triple in dumper.iter_resource_triples(
+                        item_dict, type_name, id_field, idx
+                    ):
+                        yield dumper.to_ntriple(triple)
+
+            yield self.graph_uri(dumper.base_uri, source_file), lines()
+        hierarchy_lines = [
+            dumper.to_ntriple(triple) for triple in dumper.iter_hierarchy_triples()
+        ]
+        if hierarchy_lines:
+            yield f"{dumper.base_uri}graph/class-hierarchy", iter(hierarchy_lines)
+
+    def upload_lod(
+        self,
+        lod: List[Dict[str, Any]],
+        dumper: RDFDumper,
+        type_name: str,
+        id_field: Optional[str] = None,
+    ) -> UploadStats:
+        """Upload the triples of the given list of dicts.
+
+        Args:
+            lod: the list of dicts.
+            dumper: the RDFDumper mapping the dicts to triples.
+            type_name: RDF type name for resources.
+            id_field: Field to use as resource identifier.
+
+        Returns:
+            UploadStats: the statistics of the upload.
+        """
+        start = time.time()
+        # bound the number of batches held in memory
+        slots = threading.BoundedSemaphore(self.max_in_flight * 2)
+        futures: List[Future] = []
+
+        def submit(graph_uri: str, batch: List[str], first: Optional[Future]):
+            slots.acquire()
+
+            def run():
+                try:
+                    # appending batches wait for the replacing first batch
+                    if first is not None:
+                        first.result()
+                    self.send(graph_uri, batch, first is None)
+                finally:
+                    slots.release()
+
+            future = executor.submit(run)
+            futures.append(future)
+            return future
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+                for graph_uri, lines in self.iter_graphs(
+                    lod, dumper, type_name, id_field
+                ):
+                    self.stats.graphs += 1
+                    first = None
+                    batch = []
+                    for line in lines:
+                        batch.append(line)
+                        if len(batch) >= self.batch_size:
+                            future = submit(graph_uri, batch, first)
+                            first = first or future
+                            batch = []
+                    if batch or first is None:
+                        submit(graph_uri, batch, first)
+                for future in futures:
+                    future.result()
+        finally:
+            self.pool.close()
+        self.stats.seconds = time.time() - start
+        if self.debug:
+            print(self.stats)
+        return self.stats
@@ -0,0 +1,208 @@
+"""
+```yaml
+# 🌐🕸
+sqlite_export:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: indexed SQLite export of extracted entities with per source file refresh for semantify³.
+```
+"""
+
+import json
+import sqlite3
+from dataclasses import asdict, is_dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sem3.extractor import source_file
+
+
+class SqliteExporter:
+    """Bulk load a list of dicts into entity and property tables.
+
+    Every entity is a row of ``entity`` and each of its property values a
+    row of ``property`` - list values get one row per element. Entities are
+    keyed on their source file: loading a list of dicts first deletes all
+    entities of the scanned source files - including files whose markup has
+    been removed - so that a refresh of some files leaves the entities of
+    all other files untouched. Refresh and load are a single transaction.
+
+    Example query - PythonModules by author created after a date::
+
+        SELECT e.name FROM entity e
+        JOIN property a ON a.entity_id = e.id AND a.property = 'author'
+        JOIN property c ON c.entity_id = e.id AND c.property = 'createdAt'
+        WHERE e.isA = 'PythonModule' AND a.value = 'Wolfgang Fahl'
+        AND c.value > '2025-11-01'
+    """
+
+    schema = [
+        """CREATE TABLE IF NOT EXISTS entity (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            isA TEXT,
+            source TEXT,
+            source_file TEXT
+        )""",
+        # no declared type for value: ints, floats and texts keep their type
+        """CREATE TABLE IF NOT EXISTS property (
+            entity_id INTEGER NOT NULL,
+            property TEXT NOT NULL,
+            value,
+            position INTEGER NOT NULL DEFAULT 0
+        )""",
+        """CREATE VIEW IF NOT EXISTS entity_property AS
+            SELECT e.id, e.name, e.isA, e.source, p.property, p.value, p.position
+            FROM entity e JOIN property p ON p.entity_id = e.id""",
+    ]
+    indexes = {
+        "idx_entity_name": "entity(name)",
+        "idx_entity_isA": "entity(isA)",
+        "idx_entity_source_file": "entity(source_file)",
+        "idx_property_value": "property(property, value)",
+        "idx_property_entity": "property(entity_id)",
+    }
+    # drop the indexes for the load unless the database has this many times more entities
+    rebuild_factor = 10
+
+    def __init__(
+        self,
+        db_path: str,
+        type_name: str = "PythonModule",
+        id_field: Optional[str] = "name",
+        batch_size: int = 1000,
+        debug: bool = False,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            db_path: path of the SQLite database file (created if missing).
+            type_name: isA of entities without isA.
+            id_field: Field to use as entity name.
+            batch_size: number of entities per bulk insert.
+            debug: if True print debug output.
+        """
+        self.db_path = db_path
+        self.type_name = type_name
+        self.id_field = id_field
+        self.batch_size = max(1, batch_size)
+        self.debug = debug
+        self.entity_count = 0
+        self.property_count = 0
+        self.deleted_count = 0
+
+    @staticmethod
+    def to_value(value: Any) -> Any:
+        """Convert a property value to an SQLite value."""
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, (int, float, str)):
+            return value
+        if isinstance(value, date):
+            return value.isoformat()
+        return json.dumps(value, default=str)
+
+    def iter_property_rows(
+        self, entity_id: int, item_dict: Dict[str, Any]
+    ) -> Iterator[Tuple[int, str, Any, int]]:
+        for key, value in item_dict.items():
+            if value is None:
+                continue
+            values = value if isinstance(value, list) else [value]
+            for position, element in enumerate(values):
+                yield entity_id, key, self.to_value(element), position
+
+    def refresh(self, conn: sqlite3.Connection, source_files: List[str]):
+        """Delete the entities of the given source files."""
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS refreshed (source_file TEXT)")
+        conn.execute("DELETE FROM refreshed")
+        conn.executemany(
+            "INSERT INTO refreshed VALUES (?)", [(f,) for f in source_files]
+        )
+        stale = "SELECT id FROM entity WHERE source_file IN (SELECT source_file FROM refreshed)"
+        conn.execute(f"DELETE FROM property WHERE entity_id IN ({stale})")
+        cursor = conn.execute(
+            "DELETE FROM entity WHERE source_file IN (SELECT source_file FROM refreshed)"
+        )
+        self.deleted_count += cursor.rowcount
+
+    def load(
+        self,
+        conn: sqlite3.Connection,
+        items: List[Dict[str, Any]],
+        source_files: List[str],
+    ):
+        """Refresh the given source files and insert the items in the open transaction."""
+        for statement in self.schema:
+            conn.execute(statement)
+        (existing,) = conn.execute("SELECT COUNT(*) FROM entity").fetchone()
+        # bulk loads insert without index maintenance - small
+        # refreshes of a large database keep the indexes
+        if existing < self.rebuild_factor * len(items):
+            for index_name in self.indexes:
+                conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+        self.refresh(conn, source_files)
+        (next_id,) = conn.execute(
+            "SELECT COALESCE(MAX(id), 0) + 1 FROM entity"
+        ).fetchone()
+        for batch_start in range(0, len(items), self.batch_size):
+            entity_rows = []
+            property_rows = []
+            for item in items[batch_start : batch_start + self.batch_size]:
+                name = item.get(self.id_field) if self.id_field else None
+                source = item.get("source")
+                entity_rows.append(
+                    (
+                        next_id,
+                        None if name is None else str(name),
+                        str(item.get("isA", self.type_name)),
+                        source,
+                        source_file(source),
+                    )
+                )
+                property_rows.extend(self.iter_property_rows(next_id, item))
+                next_id += 1
+            conn.executemany("INSERT INTO entity VALUES (?, ?, ?, ?, ?)", entity_rows)
+            conn.executemany("INSERT INTO property VALUES (?, ?, ?, ?)", property_rows)
+            self.entity_count += len(entity_rows)
+            self.property_count += len(property_rows)
+        for index_name, columns in self.indexes.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {columns}")
+
+    def write(
+        self, lod: List[Dict[str, Any]], source_files: Optional[Iterable[str]] = None
+    ) -> str:
+        """Load the given list of dicts.
+
+        Args:
+            lod: the list of dicts.
+            source_files: the scanned input files to refresh - the source files
+                of the list of dicts are always refreshed.
+
+        Returns:
+            str: the database path.
+        """
+        items = [asdict(item) if is_dataclass(item) else item for item in lod]
+        refreshed = {source_file(item.get("source")) for item in items}
+        refreshed.update(source_files or [])
+        # explicit transaction control - DDL, refresh and load commit together
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("BEGIN")
+            try:
+                self.load(conn, items, sorted(refreshed))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("ANALYZE")
+        finally:
+            conn.close()
+        if self.debug:
+            print(
+                f"sqlite: {self.entity_count} entities {self.property_count} properties "
+                f"({self.deleted_count} stale entities deleted) → {self.db_path}"
+            )
+        return self.db_path
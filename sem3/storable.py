@@ -0,0 +1,31 @@
+"""
+```yaml
+# 🌐🕸
+storable:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: mutable field defaults of lod_storable dataclasses for semantify³.
+```
+"""
+
+from typing import Any, Callable, ClassVar, Dict
+
+
+class NoneDefaults:
+    """Mixin filling the None fields of a ``@lod_storable @dataclass`` class.
+
+    lod_storable applies dataclass a second time. The first pass removes
+    the class attribute of a ``field(default_factory=...)`` field so the
+    second pass sees that field without a default and the class definition
+    fails with a TypeError. Such fields default to None instead and get the
+    value of their factory in ``__post_init__``.
+    """
+
+    # field name → factory of its default value
+    none_defaults: ClassVar[Dict[str, Callable[[], Any]]] = {}
+
+    def __post_init__(self):
+        for name, factory in self.none_defaults.items():
+            if getattr(self, name) is None:
+                setattr(self, name, factory())
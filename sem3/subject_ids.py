@@ -0,0 +1,160 @@
+"""
+```yaml
+# 🌐🕸
+subject_ids:
+  isA: PythonModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: stable content derived subject ids for entities without an id field for semantify³.
+```
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Iterable, Optional, Set
+
+
+class SubjectIdMinter:
+    """Mint the identifiers of resources that have no id field.
+
+    Schemes:
+        hash: ``<type>_<digest>`` from the SHA-256 of the canonical JSON of the
+            entity including its source location - stable across runs and
+            independent of the processing order
+        index: ``<type>_<idx>`` from the position in the list of dicts
+
+    Identical entities get the same id. Different entities sharing a digest
+    prefix all get the full digest: ``prepare`` finds these collisions of a
+    list of dicts in a sorted pass before any id is minted so the ids do not
+    depend on the order of the entities. A collision with an entity of an
+    earlier, unprepared chunk gives the full digest to the later entity.
+    """
+
+    schemes = ["hash", "index"]
+
+    def __init__(self, scheme: str = "hash", digest_length: int = 12):
+        """Initialize the minter.
+
+        Args:
+            scheme: hash or index.
+            digest_length: number of hex digits of the digest used in hash ids.
+        """
+        if scheme not in self.schemes:
+            raise ValueError(f"unknown id scheme {scheme}")
+        self.scheme = scheme
+        self.digest_length = digest_length
+        # minted id → full hex digest
+        self.index: Dict[str, str] = {}
+        # digests of colliding entities minted with the full digest
+        self.full_digests: Set[str] = set()
+        self.collisions = 0
+
+    @classmethod
+    def canonical_keys(cls, value: Any) -> Any:
+        """Stringify the mapping keys so that mixed int/str keys can be sorted."""
+        if isinstance(value, dict):
+            return {str(key): cls.canonical_keys(v) for key, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls.canonical_keys(v) for v in value]
+        return value
+
+    @classmethod
+    def digest(cls, item_dict: Dict[str, Any]) -> str:
+        """Get the hex SHA-256 digest of the canonical JSON of an entity."""
+        canonical = json.dumps(
+            cls.canonical_keys(item_dict),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def short_id(self, prefix: str, digest: str) -> str:
+        return f"{prefix}_{digest[: self.digest_length]}"
+
+    def prepare(
+        self,
+        lod: Iterable[Any],
+        type_name: str,
+        id_field: Optional[str],
+    ):
+        """Find the digest prefix collisions of a list of dicts before minting.
+
+        Args:
+            lod: the list of dicts or dataclass instances.
+            type_name: RDF type name for resources.
+            id_field: Field name containing resource identifier.
+        """
+        if self.scheme != "hash":
+            return
+        by_id: Dict[str, Set[str]] = {}
+        for item in lod:
+            item_dict = asdict(item) if is_dataclass(item) else item
+            if id_field and id_field in item_dict:
+                continue
+            digest = self.digest(item_dict)
+            short_id = self.short_id(type_name.lower(), digest)
+            by_id.setdefault(short_id, set()).add(digest)
+        for short_id in sorted(by_id):
+            digests = by_id[short_id]
+            known = self.index.get(short_id)
+            if known is not None:
+                # an entity minted from an earlier chunk keeps its id
+                colliding = digests - {known}
+            elif len(digests) > 1:
+                colliding = digests
+            else:
+                continue
+            new_digests = colliding - self.full_digests
+            self.collisions += len(new_digests)
+            self.full_digests.update(new_digests)
+
+    def mint(self, item_dict: Dict[str, Any], type_name: str, idx: int) -> str:
+        """Mint the identifier of an entity without id field.
+
+        Args:
+            item_dict: Dictionary with resource data.
+            type_name: type name prefix of the id.
+            idx: Index of the entity in the list of dicts (index scheme).
+
+        Returns:
+            str: the resource identifier.
+        """
+        prefix = type_name.lower()
+        if self.scheme == "index":
+            return f"{prefix}_{idx}"
+        digest = self.digest(item_dict)
+        if digest in self.full_digests:
+            return f"{prefix}_{digest}"
+        resource_id = self.short_id(prefix, digest)
+        known = self.index.setdefault(resource_id, digest)
+        if known != digest:
+            # collision with an entity of an earlier chunk
+            self.collisions += 1
+            self.full_digests.add(digest)
+            return f"{prefix}_{digest}"
+        return resource_id
+
+    def resource_id(
+        self,
+        item_dict: Dict[str, Any],
+        type_name: str,
+        id_field: Optional[str],
+        idx: int,
+    ) -> str:
+        """Get the identifier of a resource.
+
+        Args:
+            item_dict: Dictionary with resource data.
+            type_name: type name for minted IDs.
+            id_field: Field name containing resource identifier.
+            idx: Index of the entity in the list of dicts.
+
+        Returns:
+            str: the id field value or the minted identifier.
+        """
+        if id_field and id_field in item_dict:
+            return item_dict[id_field]
+        return self.mint(item_dict, type_name, idx)
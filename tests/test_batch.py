@@ -0,0 +1,128 @@
+"""
+```yaml
+# 🌐🕸
+test_batch:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for multi repository batch runs from a manifest.
+```
+"""
+
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from rdflib import Graph
+
+from sem3 import batch
+from sem3.batch import BatchManifest, BatchRunner, BatchSummary, RepositoryConfig
+from sem3.parse_limits import ParseLimits
+from sem3.sem3_cmd import Semantify3Cmd
+from tests.base_sem3test import BaseSem3test
+
+
+class TestBatch(BaseSem3test):
+    """Test batch runs over several repositories."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        for repo in ["repo_a", "repo_b"]:
+            for i in range(3):
+                module_dir = os.path.join(self.tmp_path, repo, "src")
+                os.makedirs(module_dir, exist_ok=True)
+                with open(os.path.join(module_dir, f"m{i}.py"), "w") as f:
+                    f.write(
+                        f'"""\n```yaml\n# 🌐🕸\n{repo}_m{i}:\n  isA: PythonModule\n```\n"""\n'
+                    )
+        with open(os.path.join(self.tmp_path, "repo_b", "src", "skip.py"), "w") as f:
+            f.write('"""\n```yaml\n# 🌐🕸\nskipped:\n  isA: PythonModule\n```\n"""\n')
+        self.manifest_path = os.path.join(self.tmp_path, "manifest.yaml")
+        manifest = BatchManifest(
+            repositories=[
+                RepositoryConfig(name="repo_a", root="repo_a", output="out/a.ttl"),
+                RepositoryConfig(
+                    name="repo_b",
+                    root="repo_b",
+                    include=["src/*.py"],
+                    exclude=["src/skip.py"],
+                    base_uri="https://example.org/b/",
+                    namespace="b",
+                    output="out/b.nt",
+                    format="ntriples",
+                ),
+                RepositoryConfig(name="empty", root="missing"),
+            ],
+            summary="out/summary.yaml",
+        )
+        manifest.save_to_yaml_file(self.manifest_path)
+
+    def check_summary(self, summary: BatchSummary):
+        if self.debug:
+            print(summary.to_yaml())
+        self.assertEqual(6, summary.files)
+        self.assertEqual(6, summary.entities)
+        self.assertEqual(0, summary.errors)
+        repo_a, repo_b, empty = summary.repositories
+        self.assertEqual(3, repo_a.entities)
+        self.assertEqual(0, empty.files)
+        g = Graph()
+        g.parse(repo_b.output, format="nt")
+        self.assertEqual(repo_b.triples, len(g))
+        subjects = {str(s) for s in g.subjects()}
+        self.assertIn("https://example.org/b/repo_b_m0", subjects)
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.tmp_path, "out", "summary.yaml"))
+        )
+
+    def test_batch(self):
+        """Test a batch run on worker processes and inline."""
+        for workers in [2, 0]:
+            with self.subTest(workers=workers):
+                runner = BatchRunner.from_manifest_file(
+                    self.manifest_path, workers=workers, debug=self.debug
+                )
+                self.check_summary(runner.run())
+
+    def test_in_flight(self):
+        """Test that the number of submitted files is bounded."""
+        sizes = []
+        original_wait = batch.wait
+
+        def recording_wait(futures, **kwargs):
+            sizes.append(len(futures))
+            return original_wait(futures, **kwargs)
+
+        runner = BatchRunner.from_manifest_file(
+            self.manifest_path, workers=0, max_in_flight=2, debug=self.debug
+        )
+        with patch("sem3.batch.wait", side_effect=recording_wait):
+            self.check_summary(runner.run())
+        if self.debug:
+            print(f"in flight: {sizes}")
+        self.assertEqual(2, max(sizes))
+
+    def test_skipped(self):
+        """Test that skipped markups are aggregated in the summary."""
+        runner = BatchRunner.from_manifest_file(
+            self.manifest_path, workers=0, limits=ParseLimits(max_depth=1)
+        )
+        summary = runner.run()
+        if self.debug:
+            print(summary.to_yaml())
+        self.assertEqual(6, summary.markups)
+        self.assertEqual(6, summary.skipped)
+        self.assertEqual(0, summary.entities)
+
+    def test_cmd_batch(self):
+        """Test the --batch command line option."""
+        cmd = Semantify3Cmd()
+        capture = io.StringIO()
+        with redirect_stdout(capture):
+            exit_code = cmd.run(["--batch", self.manifest_path, "--workers", "2"])
+        self.assertEqual(0, exit_code)
+        summary = BatchSummary.from_yaml(capture.getvalue())
+        self.check_summary(summary)
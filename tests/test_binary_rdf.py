@@ -0,0 +1,155 @@
+"""
+```yaml
+# 🌐🕸
+test_binary_rdf:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests and benchmark of the sem3b binary RDF format.
+```
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import time
+
+from rdflib import Graph, Literal, URIRef
+
+from sem3.binary_rdf import BinaryRDFReader, BinaryRDFWriter, unzigzag, zigzag
+from sem3.lod2rdf import RDFDumper
+from sem3.sem3_cmd import Semantify3Cmd
+from tests.base_sem3test import BaseSem3test
+
+
+class TestBinaryRdf(BaseSem3test):
+    """Test the sem3b writer and reader."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        self.base_uri = "https://semantify3.bitplan.com/source_code/"
+        self.dumper = RDFDumper(self.base_uri, namespace_prefix="python_module")
+        self.lod = [
+            {
+                "name": f"module{i}",
+                "isA": "PythonModule" if i % 3 else "Service",
+                "author": "Wolfgang Fahl",
+                "lines": i * 7,
+                "ratio": i / 8,
+                "public": i % 2 == 0,
+                "purpose": f'module "{i}"\nwith ünïcode 🌐',
+                "source": f"sem3/module{i}.py:2",
+            }
+            for i in range(1000)
+        ]
+
+    def test_zigzag(self):
+        for value in [0, 1, -1, 63, -64, 2**40, -(2**40)]:
+            self.assertEqual(value, unzigzag(zigzag(value)))
+
+    def test_roundtrip(self):
+        """Test that graph and list of dicts survive a roundtrip."""
+        graph = self.dumper.as_rdf(self.lod, "PythonModule", "name")
+        graph.add(
+            (
+                URIRef("http://example.org/x"),
+                URIRef("http://example.org/label"),
+                Literal("x", lang="de"),
+            )
+        )
+        out = io.BytesIO()
+        with BinaryRDFWriter(out) as writer:
+            writer.write_all(graph)
+            # duplicates are dropped
+            writer.write_all(graph)
+        self.assertEqual(len(graph), writer.triple_count)
+        with BinaryRDFWriter(io.BytesIO(), deduplicate=False) as writer:
+            writer.write_all(graph)
+            writer.write_all(graph)
+        self.assertEqual(2 * len(graph), writer.triple_count)
+        self.assertEqual(set(), writer.seen)
+        reader = BinaryRDFReader(out.getvalue())
+        self.assertTrue(graph.isomorphic(reader.to_graph()))
+        lod = reader.to_lod(self.base_uri)
+        by_name = {item.get("name"): item for item in lod}
+        for item in self.lod[:10]:
+            self.assertEqual(item, by_name[item["name"]])
+        with self.assertRaises(ValueError):
+            BinaryRDFReader(b"@prefix")
+
+    def test_streaming(self):
+        """Test incremental decoding at all chunk boundaries and from streams."""
+        out = io.BytesIO()
+        lod = self.lod[:5] + [{"purpose": "no isA"}]
+        with BinaryRDFWriter(out) as writer:
+            writer.write_all(self.dumper.iter_triples(lod, "PythonModule", "name"))
+        data = out.getvalue()
+        expected = list(BinaryRDFReader(data).iter_triples())
+        for chunk_size in [1, 2, 3, 7, 64]:
+            reader = BinaryRDFReader(io.BytesIO(data), chunk_size=chunk_size)
+            self.assertEqual(expected, list(reader.iter_triples()), chunk_size)
+        with self.assertRaises(ValueError):
+            list(BinaryRDFReader(data[:-2], chunk_size=5).iter_triples())
+        # the rdf:type of an entity without isA property gives isA
+        fallback = BinaryRDFReader(data).to_lod(self.base_uri)[-1]
+        self.assertEqual("PythonModule", fallback["isA"])
+        self.assertEqual("no isA", fallback["purpose"])
+
+    def test_benchmark(self):
+        """Compare size and load speed with Turtle and N-Triples."""
+        graph = self.dumper.as_rdf(self.lod, "PythonModule", "name")
+        results = {}
+        for name, rdf_format in [
+            ("turtle", "turtle"),
+            ("ntriples", "nt"),
+            ("sem3b", None),
+        ]:
+            path = os.path.join(self.tmp_path, f"benchmark.{name}")
+            if rdf_format:
+                graph.serialize(destination=path, format=rdf_format)
+            else:
+                with open(path, "wb") as f, BinaryRDFWriter(f) as writer:
+                    writer.write_all(
+                        self.dumper.iter_triples(self.lod, "PythonModule", "name")
+                    )
+            start = time.time()
+            loaded = Graph()
+            if rdf_format:
+                loaded.parse(path, format=rdf_format)
+            else:
+                BinaryRDFReader.from_file(path).to_graph(loaded)
+            results[name] = (os.path.getsize(path), time.time() - start)
+            self.assertEqual(len(graph), len(loaded))
+        if self.debug:
+            for name, (size, seconds) in results.items():
+                print(f"{name:9}: {size:9d} bytes load {seconds:.3f} s")
+        self.assertLess(results["sem3b"][0], results["ntriples"][0] / 2)
+        self.assertLess(results["sem3b"][0], results["turtle"][0])
+        self.assertLess(results["sem3b"][1], results["turtle"][1])
+        self.assertLess(results["sem3b"][1], results["ntriples"][1])
+
+    def test_cmd_sem3b(self):
+        """Test --format sem3b."""
+        path = os.path.join(self.tmp_path, "sem3.sem3b")
+        pattern = os.path.join(self.project_root, "sem3", "*.py")
+        exit_code = Semantify3Cmd().run(["--format", "sem3b", "-o", path, pattern])
+        self.assertEqual(0, exit_code)
+        graph = BinaryRDFReader.from_file(path).to_graph()
+        subjects = {str(s) for s in graph.subjects()}
+        self.assertIn(f"{self.base_uri}binary_rdf", subjects)
+        # --dedup-memory 0 keeps repeated triples of repeated files
+        copy_path = os.path.join(self.tmp_path, "copy.py")
+        shutil.copy(os.path.join(self.project_root, "sem3", "binary_rdf.py"), copy_path)
+        counts = []
+        for dedup_memory in ["64", "0"]:
+            exit_code = Semantify3Cmd().run(
+                ["--format", "sem3b", "--dedup-memory", dedup_memory, "-o", path]
+                + [os.path.join(self.project_root, "sem3", "binary_rdf.py"), copy_path]
+            )
+            self.assertEqual(0, exit_code)
+            counts.append(len(list(BinaryRDFReader.from_file(path).iter_triples())))
+        if self.debug:
+            print(f"sem3b triples with/without dedup: {counts}")
+        self.assertLess(counts[0], counts[1])
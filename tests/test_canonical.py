@@ -0,0 +1,140 @@
+"""
+```yaml
+# 🌐🕸
+test_canonical:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the canonical sorted output.
+```
+"""
+
+import os
+import random
+import tempfile
+from unittest.mock import patch
+
+from rdflib import Graph
+
+from sem3.canonical import CanonicalWriter, ExternalSorter
+from sem3.extractor import Extractor
+from sem3.lod2rdf import RDFDumper
+from sem3.sem3_cmd import Semantify3Cmd
+from tests.base_sem3test import BaseSem3test
+
+
+class TestCanonical(BaseSem3test):
+    """Test the external merge sort and the canonical writer."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        extractor = Extractor()
+        markups = extractor.extract_from_glob(
+            os.path.join(self.project_root, "sem3", "*.py")
+        )
+        self.lod = extractor.markups_to_lod(markups)
+        self.dumper = RDFDumper(
+            base_uri="https://semantify3.bitplan.com/source_code/",
+            namespace_prefix="python_module",
+        )
+
+    def test_external_sorter(self):
+        """Test sorting with spill files against sorted(set())."""
+        lines = [f"line {random.randint(0, 500)}\n" for _i in range(2000)]
+        sorter = ExternalSorter(max_lines=100, tmp_dir=self.tmp_path)
+        sorter.add_all(lines)
+        self.assertGreater(len(sorter.runs), 10)
+        self.assertEqual(sorted(set(lines)), list(sorter))
+        self.assertEqual([], os.listdir(self.tmp_path))
+
+    def test_fan_in(self):
+        """Test the merge passes with more runs than open files allowed."""
+        lines = [f"line {random.randint(0, 5000)}\n" for _i in range(5000)]
+        sorter = ExternalSorter(max_lines=50, tmp_dir=self.tmp_path, fan_in=4)
+        sorter.add_all(lines)
+        self.assertGreater(len(sorter.runs), 4 * 4)
+        opened = []
+        original_open = open
+
+        def counting_open(*args, **kwargs):
+            f = original_open(*args, **kwargs)
+            opened.append(f)
+            open_count = sum(1 for f in opened if not f.closed)
+            self.assertLessEqual(open_count, 4)
+            return f
+
+        with patch("sem3.canonical.open", counting_open, create=True):
+            result = list(sorter)
+        self.assertGreater(len(opened), 4)
+        self.assertEqual(sorted(set(lines)), result)
+        self.assertEqual([], os.listdir(self.tmp_path))
+        # spill files are removed when the iteration fails
+        sorter = ExternalSorter(max_lines=10, tmp_dir=self.tmp_path, fan_in=4)
+        sorter.add_all(lines[:100])
+        with self.assertRaises(RuntimeError):
+            for _line in sorter:
+                raise RuntimeError("consumer failed")
+        self.assertEqual([], os.listdir(self.tmp_path))
+
+    def test_split_ntriple(self):
+        """Test the N-Triples term parsing."""
+        for line, expected in [
+            (
+                '<http://a/b c> <http://p/x y> "x y ." .\n',
+                ("<http://a/b c>", "<http://p/x y>", '"x y ."'),
+            ),
+            (
+                "_:b1 <http://p> <http://o> .\n",
+                ("_:b1", "<http://p>", "<http://o>"),
+            ),
+            ('<s> <p> "a"@en .', ("<s>", "<p>", '"a"@en')),
+        ]:
+            self.assertEqual(expected, CanonicalWriter.split_ntriple(line))
+        with self.assertRaises(ValueError):
+            CanonicalWriter.split_ntriple("not a triple\n")
+
+    def canonical(self, lod, output_format: str) -> str:
+        path = os.path.join(self.tmp_path, f"canonical.{output_format}")
+        writer = CanonicalWriter(
+            self.dumper,
+            "PythonModule",
+            "name",
+            output_format=output_format,
+            destination=path,
+            max_lines=7,
+        )
+        writer.write(lod)
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_canonical(self):
+        """Test that the output is independent of the input order and complete."""
+        reference = self.dumper.as_rdf(self.lod, "PythonModule", "name")
+        shuffled = list(self.lod)
+        random.Random(42).shuffle(shuffled)
+        for output_format, rdf_format in [("ntriples", "nt"), ("turtle", "turtle")]:
+            with self.subTest(output_format=output_format):
+                text = self.canonical(self.lod, output_format)
+                self.assertEqual(text, self.canonical(shuffled, output_format))
+                self.assertEqual(
+                    text, self.canonical(self.lod + self.lod, output_format)
+                )
+                graph = Graph()
+                graph.parse(data=text, format=rdf_format)
+                self.assertTrue(graph.isomorphic(reference))
+                if self.debug:
+                    print(text[:500])
+
+    def test_cmd_canonical(self):
+        """Test that --canonical output is the same with and without --pipeline."""
+        pattern = os.path.join(self.project_root, "sem3", "*.py")
+        texts = []
+        for options in [[], ["--pipeline"]]:
+            path = os.path.join(self.tmp_path, f"canonical{len(texts)}.ttl")
+            args = ["--canonical", "--format", "turtle", "-o", path, pattern]
+            exit_code = Semantify3Cmd().run(options + args)
+            self.assertEqual(0, exit_code)
+            with open(path, encoding="utf-8") as f:
+                texts.append(f.read())
+        self.assertEqual(texts[0], texts[1])
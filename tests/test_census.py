@@ -0,0 +1,95 @@
+"""
+```yaml
+# 🌐🕸
+test_census:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the marker density census.
+```
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from sem3.census import Census
+from sem3.extractor import Extractor
+from tests.base_sem3test import BaseSem3test
+
+
+class TestCensus(BaseSem3test):
+    """Test the census mode."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+
+    def write(self, relpath: str, text: str) -> str:
+        path = os.path.join(self.tmp_path, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_census(self):
+        """Test the counts per directory and extension."""
+        yaml_block = "```yaml\n# 🌐🕸\nname:\n  isA: Thing\n```\n"
+        sidif_block = "# ```sidif\n# # 🌐🕸\n# x isA Thing\n# ```\n"
+        files = [
+            self.write("src/a.py", f'"""\n{yaml_block}"""\n{sidif_block}'),
+            self.write("src/b.py", "print('no marker')\n"),
+            # marker but no fence / block without marker
+            self.write("src/c.py", "# 🌐🕸\n```yaml\nname: x\n```\n"),
+            self.write(
+                "db/schema.sql", "-- ```sidif\n-- # 🌐🕸\n-- t isA Table\n-- ```\n"
+            ),
+            self.write(
+                "nb/n.ipynb",
+                json.dumps(
+                    {"cells": [{"cell_type": "markdown", "source": yaml_block}]}
+                ),
+            ),
+            os.path.join(self.tmp_path, "src", "missing.py"),
+        ]
+        report = Census(Extractor(), threads=4, debug=self.debug).run(
+            files, chunk_size=2
+        )
+        if self.debug:
+            print(report.to_yaml())
+        self.assertEqual(5, report.total.files)
+        self.assertEqual(3, report.total.marked_files)
+        self.assertEqual(4, report.total.blocks)
+        self.assertEqual({"yaml": 2, "sidif": 2}, report.total.blocks_by_lang)
+        self.assertEqual(1, report.errors)
+        src = report.by_directory[os.path.join(self.tmp_path, "src")]
+        self.assertEqual((3, 1, 2), (src.files, src.marked_files, src.blocks))
+        self.assertEqual([".ipynb", ".py", ".sql"], list(report.by_extension))
+        self.assertEqual({"sidif": 1}, report.by_extension[".sql"].blocks_by_lang)
+        total_bytes = sum(os.path.getsize(path) for path in files[:-1])
+        self.assertEqual(total_bytes, report.total.bytes)
+
+    def test_census_matches_extraction(self):
+        """Test that the census counts the blocks the extractor finds."""
+        extractor = Extractor()
+        files = sorted(
+            os.path.join(root, name)
+            for folder in ["sem3", "tests"]
+            for root, _dirs, names in os.walk(os.path.join(self.project_root, folder))
+            for name in names
+            if name.endswith(".py")
+        )
+        start = time.time()
+        report = Census(extractor, debug=self.debug).run(files)
+        census_time = time.time() - start
+        start = time.time()
+        markups = extractor.extract_from_glob_list(files)
+        extract_time = time.time() - start
+        if self.debug:
+            print(
+                f"census {report.total.blocks} blocks in {census_time:.3f} s "
+                f"({report.mb_per_second:.1f} MB/s) - extraction {len(markups)} "
+                f"markups in {extract_time:.3f} s"
+            )
+        self.assertEqual(len(markups), report.total.blocks)
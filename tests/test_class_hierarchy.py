@@ -0,0 +1,135 @@
+"""
+```yaml
+# 🌐🕸
+test_class_hierarchy:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the materialized isA class hierarchy index.
+```
+"""
+
+import io
+import os
+import tempfile
+
+from rdflib import Graph
+from rdflib.namespace import RDF, RDFS
+
+from sem3.class_hierarchy import ClassHierarchy
+from sem3.lod2rdf import RDFDumper
+from sem3.pipeline import NTriplesSink
+from tests.base_sem3test import BaseSem3test
+
+
+class TestClassHierarchy(BaseSem3test):
+    """Test the class hierarchy closure and the inferred triples."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        self.base_uri = "https://semantify3.bitplan.com/source_code/"
+        self.lod = [
+            {"name": "test_a", "isA": "PythonTestModule", "source": "a.py:1"},
+            {"name": "mod_b", "isA": "PythonModule", "source": "b.py:1"},
+            {"name": "doc_c", "isA": "Document", "source": "c.md:1"},
+        ]
+
+    def get_hierarchy(self) -> ClassHierarchy:
+        hierarchy = ClassHierarchy(debug=self.debug)
+        hierarchy.add_mapping(
+            {
+                "PythonTestModule": "PythonModule",
+                "PythonModule": ["Module", "SourceFile"],
+                "SourceFile": "File",
+                # a cycle must not hang the closure
+                "File": "SourceFile",
+            }
+        )
+        return hierarchy
+
+    def test_closure(self):
+        """Test the transitive closure lookups."""
+        hierarchy = self.get_hierarchy()
+        self.assertEqual(
+            ("File", "Module", "PythonModule", "SourceFile"),
+            hierarchy.superclasses("PythonTestModule"),
+        )
+        self.assertEqual(("SourceFile",), hierarchy.superclasses("File"))
+        self.assertEqual(
+            {"PythonModule", "PythonTestModule"}, hierarchy.subclasses("Module")
+        )
+        self.assertTrue(hierarchy.is_subclass("PythonTestModule", "File"))
+        self.assertTrue(hierarchy.is_subclass("Document", "Document"))
+        self.assertFalse(hierarchy.is_subclass("Module", "PythonModule"))
+        names = [item["name"] for item in hierarchy.select(self.lod, "Module")]
+        self.assertEqual(["test_a", "mod_b"], names)
+        # adding invalidates the closure
+        hierarchy.add("Document", "File")
+        self.assertEqual(("File", "SourceFile"), hierarchy.superclasses("Document"))
+
+    def test_load(self):
+        """Test loading from a plain YAML file and from SiDIF markup."""
+        yaml_path = os.path.join(self.tmp_path, "classes.yaml")
+        with open(yaml_path, "w", encoding="utf-8") as f:
+            f.write(
+                "PythonTestModule: PythonModule\nPythonModule:\n  subClassOf: Module\n"
+            )
+        sidif_path = os.path.join(self.tmp_path, "classes.txt")
+        with open(sidif_path, "w", encoding="utf-8") as f:
+            f.write(
+                "```sidif\n# 🌐🕸\nPythonTestModule isA Class\n"
+                '"PythonModule" is subClassOf of it\n'
+                "PythonModule isA Class\n"
+                '"Module" is subClassOf of it\n```\n'
+            )
+        for path in [yaml_path, sidif_path]:
+            hierarchy = ClassHierarchy.load(path, debug=self.debug)
+            self.assertEqual(
+                ("Module", "PythonModule"), hierarchy.superclasses("PythonTestModule")
+            )
+
+    def test_infer_types(self):
+        """Test the inferred rdf:type and rdfs:subClassOf triples."""
+        hierarchy = self.get_hierarchy()
+        dumper = RDFDumper(
+            self.base_uri,
+            namespace_prefix="python_module",
+            class_hierarchy=hierarchy,
+            infer_types=True,
+        )
+        ns = dumper.ns
+        graph = dumper.as_rdf(self.lod, "PythonModule", "name")
+        test_a = ns["test_a"]
+        types = set(graph.objects(test_a, RDF.type))
+        expected = {
+            ns[name]
+            for name in [
+                "PythonTestModule",
+                "PythonModule",
+                "Module",
+                "SourceFile",
+                "File",
+            ]
+        }
+        self.assertEqual(expected, types)
+        self.assertEqual({ns["Document"]}, set(graph.objects(ns["doc_c"], RDF.type)))
+        self.assertIn((ns["PythonTestModule"], RDFS.subClassOf, ns["File"]), graph)
+        # a subclass lookup is a direct hit - no property path needed
+        query = f"""SELECT ?s WHERE {{ ?s a <{ns["Module"]}> }}"""
+        subjects = {row.s for row in graph.query(query)}
+        self.assertEqual({test_a, ns["mod_b"]}, subjects)
+        # without inference the output is unchanged
+        plain = RDFDumper(self.base_uri, class_hierarchy=hierarchy)
+        plain_graph = plain.as_rdf(self.lod, "PythonModule", "name")
+        self.assertEqual(len(self.lod), len(set(plain_graph.subject_objects(RDF.type))))
+        # the streaming sink writes the same graph
+        out = io.StringIO()
+        sink = NTriplesSink(dumper, "PythonModule", "name", out)
+        sink(self.lod)
+        sink.close()
+        streamed = Graph()
+        streamed.parse(data=out.getvalue(), format="nt")
+        if self.debug:
+            print(f"{len(graph)} triples, {len(streamed)} streamed")
+        self.assertEqual(len(graph), len(streamed))
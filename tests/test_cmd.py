@@ -185,6 +185,38 @@ class TestCmd(BaseSem3test):
             if keep_files:
                 print (cmd)
 
+    def test_multiple_formats(self):
+        """Test writing several formats from a single run"""
+        formats = [
+            ("turtle", "ttl"),
+            ("ntriples", "nt"),
+            ("json-ld", "jsonld"),
+            ("sqlite", "db"),
+        ]
+        pattern = os.path.join(self.project_root, "sem3", "*.py")
+        tmp_path = tempfile.mkdtemp()
+        args = []
+        for fmt, ext in formats:
+            args.extend(["--format", fmt, "--output", os.path.join(tmp_path, f"out.{ext}")])
+        exit_code, _output = self.capture_run(args + [pattern])
+        self.assertEqual(exit_code, 0)
+        graphs = []
+        for fmt, ext in formats[:3]:
+            g = Graph()
+            g.parse(os.path.join(tmp_path, f"out.{ext}"), format=fmt)
+            graphs.append(g)
+            if self.debug:
+                print(f"✓ {fmt} ({len(g)} triples)")
+        self.assertGreater(len(graphs[0]), 0)
+        for g in graphs[1:]:
+            self.assertEqual(set(graphs[0]), set(g))
+        self.assertTrue(os.path.getsize(os.path.join(tmp_path, "out.db")) > 0)
+        # formats and outputs must be given pairwise
+        exit_code, _output = self.capture_run(
+            ["--format", "turtle", "--format", "ntriples", "-o", "x.ttl", pattern]
+        )
+        self.assertNotEqual(exit_code, 0)
+
     def test_extract_from_own_source(self):
         """Test that the extractor can find annotations in the project's own source code."""
         pattern = os.path.join(self.project_root, "**", "*.py")
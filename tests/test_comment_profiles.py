@@ -0,0 +1,183 @@
+"""
+```yaml
+# 🌐🕸
+test_comment_profiles:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the per file extension comment syntax profiles.
+```
+"""
+
+import os
+import random
+import tempfile
+
+from sem3.comment_profiles import CommentProfiles
+from sem3.compact_markup import SourceTable
+from sem3.extractor import Extractor
+from tests.base_sem3test import BaseSem3test
+
+
+class TestCommentProfiles(BaseSem3test):
+    """Test the extraction with comment syntax profiles."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        self.samples = {
+            "schema.sql": """-- ```yaml
+-- # 🌐🕸
+-- schema_sql:
+--   isA: SqlScript
+--   purpose: tables
+-- ```
+CREATE TABLE t (id INTEGER);
+""",
+            "init.lua": """--[[
+```sidif
+# 🌐🕸
+init_lua isA LuaModule
+"startup" is purpose of it
+```
+]]
+-- ```yaml
+-- # 🌐🕸
+-- init_config:
+--   isA: LuaConfig
+-- ```
+local x = 1
+""",
+            "paper.tex": """\\documentclass{article}
+% ```yaml
+% # 🌐🕸
+% paper_tex:
+%   isA: LatexDocument
+%
+%   purpose: paper
+% ```
+\\begin{document}
+""",
+            "index.html": """<html>
+<!--
+  ```yaml
+  # 🌐🕸
+  index_html:
+    isA: WebPage
+  ```
+-->
+</html>
+""",
+            "main.c": """/*
+ * ```yaml
+ * # 🌐🕸
+ * main_c:
+ *   isA: CModule
+ *   purpose: entry point
+ * ```
+ */
+// ```sidif
+// # 🌐🕸
+// main_function isA CFunction
+// ```
+int main() { return 0; }
+""",
+        }
+        self.expected = {
+            "schema.sql": ["schema_sql:\n  isA: SqlScript\n  purpose: tables"],
+            "init.lua": [
+                'init_lua isA LuaModule\n"startup" is purpose of it',
+                "init_config:\n  isA: LuaConfig",
+            ],
+            "paper.tex": ["paper_tex:\n  isA: LatexDocument\n\n  purpose: paper"],
+            "index.html": ["index_html:\n  isA: WebPage"],
+            "main.c": [
+                "main_c:\n  isA: CModule\n  purpose: entry point",
+                "main_function isA CFunction",
+            ],
+        }
+        self.paths = {}
+        for name, text in self.samples.items():
+            path = os.path.join(self.tmp_path, name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            self.paths[name] = path
+
+    def test_for_path(self):
+        """Test the profile selection by extension."""
+        profiles = CommentProfiles()
+        for path, name in [
+            ("a/schema.sql", "dashdash"),
+            ("init.LUA", "dashdash"),
+            ("paper.tex", "percent"),
+            ("index.html", "markup"),
+            ("main.c", "c"),
+            ("tool.py", "hash"),
+            ("httpd.conf", "default"),
+            (None, "default"),
+        ]:
+            self.assertEqual(name, profiles.for_path(path).name, path)
+
+    def test_extract_per_syntax(self):
+        """Test text, compact and header only extraction for each syntax."""
+        # the first block of each sample starts in the first 32 bytes
+        for scan_bytes in [None, 32]:
+            extractor = Extractor(debug=self.debug, scan_bytes=scan_bytes)
+            table = SourceTable()
+            try:
+                for name, path in self.paths.items():
+                    expected = self.expected[name]
+                    if scan_bytes:
+                        expected = expected[:1]
+                    markups = extractor.extract_from_file(path)
+                    codes = [markup.code for markup in markups]
+                    if self.debug:
+                        print(f"{name} ({scan_bytes}): {codes}")
+                    self.assertEqual(expected, codes, name)
+                    compact = extractor.extract_compact_from_file(path, table)
+                    self.assertEqual(expected, [markup.code for markup in compact])
+                    self.assertEqual(
+                        [markup.source for markup in markups],
+                        [markup.source for markup in compact],
+                    )
+            finally:
+                table.close()
+
+    def test_profile_only(self):
+        """Test that a file is only scanned with the prefixes of its type."""
+        extractor = Extractor(debug=self.debug)
+        text = """# ```yaml
+# # 🌐🕸
+# hash_comment:
+#   isA: Comment
+# ```
+"""
+        self.assertEqual(1, len(extractor.extract_from_text(text, "script.py")))
+        self.assertEqual(0, len(extractor.extract_from_text(text, "schema.sql")))
+        self.assertEqual(1, len(extractor.extract_from_text(text)))
+
+    def test_iter_byte_blocks(self):
+        """Test that the fence jumping scan finds the blocks of finditer."""
+        profiles = CommentProfiles()
+        lines = [
+            "# ```yaml",
+            "```sidif",
+            "-- ```yaml",
+            "```",
+            "# ```",
+            "-- ```",
+            "x = '```' ```yaml",
+            "# 🌐🕸",
+            "text",
+            "",
+            "``````",
+        ]
+        rng = random.Random(42)
+        for _ in range(1000):
+            text = "\n".join(rng.choice(lines) for _ in range(rng.randint(0, 20)))
+            buf = text.encode("utf-8")
+            for name in ["default", "dashdash", "markup"]:
+                profile = profiles.profiles[name]
+                expected = [m.span() for m in profile.byte_pattern.finditer(buf)]
+                spans = [m.span() for m in profile.iter_byte_blocks(buf)]
+                self.assertEqual(expected, spans, text)
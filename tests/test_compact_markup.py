@@ -0,0 +1,110 @@
+"""
+```yaml
+# 🌐🕸
+test_compact_markup:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the compact markup representation.
+```
+"""
+
+import glob
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from sem3.compact_markup import CompactMarkup, SourceTable
+from sem3.extractor import Extractor
+from sem3.sem3_cmd import Semantify3Cmd
+from tests.base_sem3test import BaseSem3test
+
+
+class TestCompactMarkup(BaseSem3test):
+    """Test the compact offset based markup representation."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.extractor = Extractor(debug=self.debug)
+        self.tmp_path = tempfile.mkdtemp()
+
+    def test_own_source(self):
+        """Compact markups must be equivalent to the regular markups."""
+        pattern = os.path.join(self.project_root, "**", "*.py")
+        files = sorted(glob.glob(pattern, recursive=True))
+        markups = self.extractor.extract_from_glob_list(files)
+        with SourceTable(max_open=2) as table:
+            compact_markups = self.extractor.extract_compact_from_files(files, table)
+            self.assertEqual(len(markups), len(compact_markups))
+            for markup, compact in zip(markups, compact_markups):
+                self.assertEqual(markup.lang, compact.lang)
+                self.assertEqual(markup.source, compact.source)
+                self.assertEqual(markup.code, compact.code)
+            self.assertLessEqual(len(table.maps), 2)
+            lod = self.extractor.markups_to_lod(compact_markups)
+            self.assertEqual(self.extractor.markups_to_lod(markups), lod)
+
+    def test_slots(self):
+        """Compact markups must not carry a per instance dict."""
+        path = os.path.join(self.tmp_path, "slots.sql")
+        with open(path, "w", newline="\r\n") as f:
+            f.write(
+                "select 1;\n-- ```yaml\n-- 🌐🕸\n-- slots:\n--   isA: Table\n-- ```\n"
+            )
+        with SourceTable() as table:
+            markups = self.extractor.extract_compact_from_file(path, table)
+            self.assertEqual(1, len(markups))
+            markup = markups[0]
+            self.assertIsInstance(markup, CompactMarkup)
+            self.assertFalse(hasattr(markup, "__dict__"))
+            self.assertEqual("slots:\n  isA: Table", markup.code)
+            self.assertEqual(f"{path}:2", markup.source)
+
+    def test_line_separators(self):
+        """Compact markups must split lines like the regular markups."""
+        path = os.path.join(self.tmp_path, "separators.py")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(
+                "# ```yaml\r\n# 🌐🕸\r\n# sep:\r\n"
+                "#   text: a\x0bb\u2028c\x1cd\x85e\r\n#   isA: Test\r\n# ```\r\n"
+            )
+        markups = self.extractor.extract_from_files([path])
+        with SourceTable() as table:
+            compact_markups = self.extractor.extract_compact_from_file(path, table)
+            self.assertEqual(1, len(markups))
+            self.assertEqual(1, len(compact_markups))
+            self.assertEqual(markups[0].code, compact_markups[0].code)
+
+    def test_cmd_compact(self):
+        """Test that --compact gives the regular output and closes the source table."""
+        pattern = os.path.join(self.project_root, "sem3", "*.py")
+        outputs = []
+        original_close = SourceTable.close
+        with patch.object(
+            SourceTable, "close", autospec=True, side_effect=original_close
+        ) as close:
+            for options in [[], ["--compact"]]:
+                capture = io.StringIO()
+                with redirect_stdout(capture):
+                    exit_code = Semantify3Cmd().run(
+                        options + ["--format", "ntriples", pattern]
+                    )
+                self.assertEqual(0, exit_code)
+                outputs.append(sorted(set(capture.getvalue().splitlines())))
+        self.assertEqual(1, close.call_count)
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_empty_and_unmarked(self):
+        """Empty files and blocks without marker or code yield no markups."""
+        empty = os.path.join(self.tmp_path, "empty.py")
+        open(empty, "w").close()
+        no_code = os.path.join(self.tmp_path, "no_code.py")
+        with open(no_code, "w") as f:
+            f.write("```yaml\n🌐🕸\n\n```\n```yaml\nname: no marker\n```\n")
+        with SourceTable() as table:
+            for path in [empty, no_code]:
+                self.assertEqual(
+                    [], self.extractor.extract_compact_from_file(path, table)
+                )
@@ -0,0 +1,114 @@
+"""
+```yaml
+# 🌐🕸
+test_dedup:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the bounded memory triple deduplication.
+```
+"""
+
+import io
+import os
+import random
+import tempfile
+from contextlib import redirect_stdout
+
+from sem3.binary_rdf import BinaryRDFReader
+from sem3.dedup import BloomFilter, TripleDeduplicator
+from sem3.sem3_cmd import Semantify3Cmd
+from tests.base_sem3test import BaseSem3test
+
+
+class TestDedup(BaseSem3test):
+    """Test the triple deduplicator."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        self.marked_file = os.path.join(self.project_root, "sem3", "dedup.py")
+
+    def test_bloom_filter(self):
+        """Test that the bloom filter has no false negatives."""
+        bloom = BloomFilter(1024)
+        digests = [TripleDeduplicator.digest(f"key {i}") for i in range(500)]
+        for digest in digests:
+            bloom.add(digest)
+        for digest in digests:
+            self.assertIn(digest, bloom)
+
+    def test_contains(self):
+        """Test membership checks in memory and after a spill."""
+        dedup = TripleDeduplicator(max_memory_mb=0.0002, tmp_dir=self.tmp_path)
+        try:
+            for i in range(5):
+                dedup.add(f"node {i}")
+            self.assertGreater(dedup.spills, 0)
+            for i in range(5):
+                self.assertIn(f"node {i}", dedup)
+            self.assertNotIn("node 5", dedup)
+            self.assertEqual(5, dedup.unique)
+        finally:
+            dedup.close()
+
+    def test_spill(self):
+        """Test exactness against a set with spills and with/without bloom filter."""
+        rng = random.Random(4711)
+        keys = [f"<s{rng.randrange(3000)}> <p> <o> .\n" for _i in range(10000)]
+        expected = list(dict.fromkeys(keys))
+        lookups = {}
+        for bloom_mb in [0, 0.01]:
+            # 0.01 MB → 100 digests in memory
+            dedup = TripleDeduplicator(
+                max_memory_mb=0.01, bloom_mb=bloom_mb, tmp_dir=self.tmp_path
+            )
+            try:
+                unique = list(dedup.filter(keys))
+                db_path = dedup.db_path
+                self.assertTrue(os.path.exists(db_path))
+            finally:
+                dedup.close()
+            if self.debug:
+                print(f"bloom {bloom_mb} MB: {dedup}")
+            self.assertEqual(expected, unique)
+            self.assertGreater(dedup.spills, 10)
+            self.assertEqual(len(keys) - len(expected), dedup.duplicates)
+            self.assertFalse(os.path.exists(db_path))
+            lookups[bloom_mb] = dedup.lookups
+        # new keys skip the spill database lookup
+        self.assertLess(lookups[0.01], lookups[0])
+
+    def test_cmd_dedup(self):
+        """Test that streamed output of duplicate markups is duplicate free."""
+        # the same markup in different files gives the same triples
+        files = []
+        for i in range(3):
+            path = os.path.join(self.tmp_path, f"copy{i}.py")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(open(self.marked_file, encoding="utf-8").read())
+            files.append(path)
+        line_counts = {}
+        for memory in ["0", "0.001", "64"]:
+            capture = io.StringIO()
+            with redirect_stdout(capture):
+                exit_code = Semantify3Cmd().run(
+                    ["--pipeline", "--format", "ntriples", "--dedup-memory", memory]
+                    + files
+                )
+            self.assertEqual(0, exit_code)
+            lines = [line for line in capture.getvalue().splitlines() if line]
+            line_counts[memory] = (len(lines), len(set(lines)))
+        if self.debug:
+            print(line_counts)
+        lines, unique = line_counts["0"]
+        self.assertGreater(lines, unique)
+        for memory in ["0.001", "64"]:
+            self.assertEqual((unique, unique), line_counts[memory])
+        path = os.path.join(self.tmp_path, "dedup.sem3b")
+        exit_code = Semantify3Cmd().run(
+            ["--format", "sem3b", "--output", path, "--dedup-memory", "0.001"] + files
+        )
+        self.assertEqual(0, exit_code)
+        triples = list(BinaryRDFReader.from_file(path).iter_triples())
+        self.assertEqual(len(set(triples)), len(triples))
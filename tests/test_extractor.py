@@ -8,6 +8,11 @@ test_extractor isA PythonModule
 ```
 """
 
+import os
+import tempfile
+
+from sem3.compact_markup import SourceTable
+from sem3.extractor import Extractor
 from tests.base_sem3test import BaseSem3test
 
 
@@ -75,3 +80,37 @@ class Test_Extractor(BaseSem3test):
         self.assertTrue(
             found, "The embedded YAML block in the docstring was not extracted."
         )
+
+    def test_scan_bytes(self):
+        """
+        test the header only scan mode
+        """
+        tmp_path = tempfile.mkdtemp()
+        path = os.path.join(tmp_path, "big_module.py")
+        header = '"""\n```yaml\n# 🌐🕸\nbig_module:\n  isA: PythonModule\n'
+        header += "".join(f"  line{i}: {i}\n" for i in range(20)) + '```\n"""\n'
+        tail = "".join(f"x{i} = {i}\n" for i in range(100_000))
+        tail += "# ```yaml\n# # 🌐🕸\n# tail_block:\n#   isA: Hidden\n# ```\n"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(header + tail)
+        full_extractor = Extractor()
+        full = full_extractor.extract_from_file(path)
+        self.assertEqual(2, len(full))
+        # the window ends inside the header block which is then closed
+        for scan_bytes in [10, 64, 4096]:
+            with self.subTest(scan_bytes=scan_bytes):
+                extractor = Extractor(scan_bytes=scan_bytes)
+                content = extractor.read_content(path)
+                self.assertLess(len(content), 4200)
+                markups = extractor.extract_from_file(path)
+                self.assertEqual(full[:1], markups)
+                compact = extractor.extract_compact_from_files([path], SourceTable())
+                self.assertEqual([full[0].code], [markup.code for markup in compact])
+        if self.debug:
+            print(
+                f"header scan of {len(content)} instead of {len(header + tail)} bytes"
+            )
+        # the own sources have their annotations in the module docstrings
+        pattern = os.path.join(self.project_root, "sem3", "*.py")
+        header_markups = Extractor(scan_bytes=256).extract_from_glob(pattern)
+        self.assertEqual(full_extractor.extract_from_glob(pattern), header_markups)
@@ -0,0 +1,81 @@
+"""
+```yaml
+# 🌐🕸
+test_file_list:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the streamed input file lists.
+```
+"""
+
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+from sem3.file_list import iter_file_list
+from sem3.sem3_cmd import Semantify3Cmd
+from tests.base_sem3test import BaseSem3test
+
+
+class TestFileList(BaseSem3test):
+    """Test NUL and newline separated file lists."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.paths = ["a.py", "dir with space/b.py", "c[1].py", "ümlaut.py"]
+
+    def test_separators(self):
+        """Test both separators at all chunk boundaries."""
+        encoded = [os.fsencode(path) for path in self.paths]
+        for name, data in [
+            ("nul", b"\0".join(encoded) + b"\0"),
+            ("newline", b"\n".join(encoded) + b"\n"),
+            ("crlf", b"\r\n".join(encoded)),
+            ("blank lines", b"\n\n" + b"\n\n".join(encoded)),
+        ]:
+            for chunk_size in [1, 2, 3, 7, 1 << 16]:
+                paths = list(iter_file_list(io.BytesIO(data), chunk_size))
+                self.assertEqual(self.paths, paths, f"{name} {chunk_size}")
+        self.assertEqual([], list(iter_file_list(io.BytesIO(b""))))
+        self.assertEqual(["x"], list(iter_file_list(io.BytesIO(b"x"))))
+
+    def test_streaming(self):
+        """Test that paths are yielded before the list is complete."""
+        read_fd, write_fd = os.pipe()
+        with open(read_fd, "rb") as reader, open(write_fd, "wb") as writer:
+            paths = iter_file_list(reader)
+            writer.write(b"first.py\0sec")
+            writer.flush()
+            self.assertEqual("first.py", next(paths))
+            writer.write(b"ond.py\0")
+            writer.close()
+            self.assertEqual(["second.py"], list(paths))
+
+    def test_files_from(self):
+        """Test --files-from against the same files given as arguments."""
+        sem3_dir = os.path.join(self.project_root, "sem3")
+        files = sorted(
+            os.path.join(sem3_dir, name)
+            for name in os.listdir(sem3_dir)
+            if name.endswith(".py")
+        )
+        fd, list_path = tempfile.mkstemp(suffix=".lst")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"\0".join(os.fsencode(path) for path in files))
+        outputs = []
+        for args in [["--files-from", list_path], files]:
+            for mode in [[], ["--pipeline"]]:
+                capture = io.StringIO()
+                with redirect_stdout(capture):
+                    exit_code = Semantify3Cmd().run(
+                        ["--format", "ntriples"] + mode + args
+                    )
+                self.assertEqual(0, exit_code)
+                outputs.append(sorted(set(capture.getvalue().splitlines()) - {""}))
+        if self.debug:
+            print(f"{len(files)} files → {len(outputs[0])} triples")
+        self.assertGreater(len(outputs[0]), 0)
+        for output in outputs[1:]:
+            self.assertEqual(outputs[0], output)
@@ -0,0 +1,107 @@
+"""
+```yaml
+# 🌐🕸
+test_filters:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the entity filters with raw markup pre-check.
+```
+"""
+
+from sem3.class_hierarchy import ClassHierarchy
+from sem3.extractor import Extractor, Markup
+from sem3.filters import EntityFilter
+from tests.base_sem3test import BaseSem3test
+
+
+class TestFilters(BaseSem3test):
+    """Test the entity filters."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.markups = [
+            Markup("yaml", "auth:\n  isA: Service\n  port: 443", "a.py:1"),
+            Markup("yaml", "db:\n  isA: Database\n  port: 5432", "b.py:1"),
+            Markup("sidif", 'web isA Service\n"80" is port of it', "c.py:1"),
+            Markup(
+                "yaml",
+                "base: &base\n  isA: Service\n  port: 8080\ncopy: *base",
+                "d.py:1",
+            ),
+            Markup("yaml", "flag:\n  isA: Service\n  enabled: yes", "e.py:1"),
+            Markup("yaml", "notes:\n  isA: Note\n  text: about Service", "f.py:1"),
+        ]
+
+    def test_parse_condition(self):
+        """Test the key=value conditions."""
+        self.assertEqual(("port", "443"), EntityFilter.parse_condition(" port = 443"))
+        self.assertEqual(("a", "b=c"), EntityFilter.parse_condition("a=b=c"))
+        for invalid in ["port", "=443"]:
+            with self.assertRaises(ValueError):
+                EntityFilter.parse_condition(invalid)
+
+    def test_pushdown(self):
+        """Test that pre-checked filtering equals filtering after parsing."""
+        full_lod = Extractor(debug=self.debug).markups_to_lod(self.markups)
+        for only_isa, where, expected_names, expected_skipped in [
+            (["Service"], None, ["auth", "web", "base", "copy", "flag"], 1),
+            # numbers have alternative spellings - no pre-check
+            (None, ["port=443"], ["auth"], 0),
+            (["Service"], ["port=8080"], ["base", "copy"], 1),
+            (None, ["text=about Service"], ["notes"], 4),
+            (["Service"], ["enabled=true"], ["flag"], 1),
+            (["Service"], ["source=c.py:1"], ["web"], 1),
+            (["Missing"], None, [], 5),
+        ]:
+            entity_filter = EntityFilter(only_isa=only_isa, where=where)
+            extractor = Extractor(debug=self.debug, entity_filter=entity_filter)
+            lod = extractor.markups_to_lod(self.markups)
+            names = [item["name"] for item in lod]
+            if self.debug:
+                print(
+                    f"{only_isa} {where}: {names} "
+                    f"({entity_filter.skipped_blocks} not parsed)"
+                )
+            self.assertEqual(expected_names, names)
+            self.assertEqual(expected_skipped, entity_filter.skipped_blocks)
+            reference = [item for item in full_lod if entity_filter.matches(item)]
+            self.assertEqual(reference, lod)
+
+    def test_pushdown_sound(self):
+        """Test that values spelled differently in the markup are not skipped."""
+        for code, where in [
+            ("m:\n  author: >-\n    Wolfgang\n    Fahl", "author=Wolfgang Fahl"),
+            ("m:\n  author: Wolfgang\n    Fahl", "author=Wolfgang Fahl"),
+            ('m:\n  author: "Wolfgang\n    Fahl"', "author=Wolfgang Fahl"),
+            ("m:\n  size: 0x10", "size=16"),
+            ("m:\n  size: 1_6", "size=16"),
+            ("m:\n  size: .inf", "size=inf"),
+            ("m:\n  createdAt: 2025-11-29", "createdAt=2025-11-29"),
+            ("m:\n  author: 'O''Brien'", "author=O'Brien"),
+            ("m:\n  author: !!str 16", "author=16"),
+        ]:
+            entity_filter = EntityFilter(where=[where])
+            markup = Markup("yaml", code, "a.py:1")
+            lod = Extractor(debug=self.debug).markups_to_lod([markup])
+            self.assertTrue(entity_filter.matches(lod[0]), code)
+            self.assertTrue(entity_filter.may_match(code), code)
+        entity_filter = EntityFilter(where=["author=O'Brien"])
+        self.assertFalse(entity_filter.may_match("m:\n  author: OBrien"))
+
+    def test_class_hierarchy(self):
+        """Test that subclasses of the only_isa classes are accepted."""
+        hierarchy = ClassHierarchy()
+        hierarchy.add("PythonTestModule", "PythonModule")
+        entity_filter = EntityFilter(
+            only_isa=["PythonModule"], class_hierarchy=hierarchy
+        )
+        self.assertTrue(entity_filter.matches({"isA": "PythonTestModule"}))
+        self.assertTrue(entity_filter.matches({"isA": ["Other", "PythonModule"]}))
+        self.assertFalse(entity_filter.matches({"isA": "Module"}))
+        self.assertFalse(entity_filter.matches({}))
+        extractor = Extractor(debug=self.debug, entity_filter=entity_filter)
+        lod = extractor.markups_to_lod(self.get_markups())
+        self.assertGreater(len(lod), 0)
+        isas = {item["isA"] for item in lod}
+        self.assertEqual({"PythonModule", "PythonTestModule"}, isas)
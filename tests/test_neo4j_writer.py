@@ -0,0 +1,181 @@
+"""
+```yaml
+# 🌐🕸
+test_neo4j_writer:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the neo4j CSV and Cypher writers.
+```
+"""
+
+import csv
+import io
+import os
+import tempfile
+from datetime import date
+
+from sem3.neo4j_writer import CypherWriter, Neo4jCsvWriter
+from tests.base_sem3test import BaseSem3test
+
+
+class TestNeo4jWriter(BaseSem3test):
+    """Test the neo4j bulk import CSV and Cypher writers."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        self.lod = [
+            {
+                "name": "sem3_cmd",
+                "isA": "PythonModule",
+                "uses": ["extractor", "lod2rdf"],
+                "createdAt": date(2025, 11, 29),
+                "lines": 300,
+            },
+            {"name": "extractor", "isA": "PythonModule", "lines": 450},
+            {"name": "lod2rdf", "isA": "PythonModule", "purpose": "O'Reilly \\ says"},
+            {"name": "ypgen", "isA": "Service", "host": "extractor", "port": 8778},
+            {"purpose": "anonymous"},
+        ]
+
+    def test_csv(self):
+        """Test the neo4j-admin import CSV files."""
+        writer = Neo4jCsvWriter("PythonModule", "name", debug=self.debug)
+        paths = writer.write(self.lod, self.tmp_path)
+        self.assertEqual(4, len(paths))
+        self.assertEqual(5, writer.node_count)
+        self.assertEqual(3, writer.relationship_count)
+        with open(os.path.join(self.tmp_path, "nodes_PythonModule.csv")) as f:
+            rows = list(csv.reader(f))
+        if self.debug:
+            for row in rows:
+                print(row)
+        header = rows[0]
+        self.assertEqual("id:ID", header[0])
+        self.assertEqual(":LABEL", header[-1])
+        self.assertIn("lines:long", header)
+        self.assertIn("uses:string[]", header)
+        self.assertEqual("extractor;lod2rdf", rows[1][header.index("uses:string[]")])
+        self.assertEqual("2025-11-29", rows[1][header.index("createdAt:string")])
+        self.assertRegex(rows[4][0], r"^pythonmodule_[0-9a-f]{12}$")
+        self.assertEqual("PythonModule;Sem3", rows[1][-1])
+        with open(os.path.join(self.tmp_path, "relationships.csv")) as f:
+            rels = list(csv.reader(f))
+        self.assertIn(["sem3_cmd", "lod2rdf", "uses"], rels)
+        self.assertIn(["ypgen", "extractor", "host"], rels)
+
+    def test_csv_duplicates(self):
+        """Test that repeated entities become a single node with merged properties."""
+        lod = self.lod + [
+            {"name": "extractor", "isA": "PythonModule", "author": "WF"},
+            {"name": "extractor", "isA": "Parser", "tags": ["a;b", "c"]},
+            {"name": "sem3_cmd", "isA": "PythonModule", "uses": ["extractor"]},
+        ]
+        writer = Neo4jCsvWriter("PythonModule", "name", debug=self.debug)
+        paths = writer.write(lod, self.tmp_path)
+        self.assertEqual(3, writer.duplicate_count)
+        self.assertEqual(5, writer.node_count)
+        self.assertEqual(3, writer.relationship_count)
+        ids = []
+        for path in paths:
+            if os.path.basename(path).startswith("nodes_"):
+                with open(path) as f:
+                    ids.extend(row[0] for row in list(csv.reader(f))[1:])
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(5, len(ids))
+        # the ; inside an element needs another array delimiter
+        self.assertEqual("|", writer.array_delimiter)
+        with open(os.path.join(self.tmp_path, "nodes_PythonModule.csv")) as f:
+            rows = list(csv.reader(f))
+        header = rows[0]
+        extractor = [row for row in rows if row[0] == "extractor"][0]
+        self.assertEqual("a;b|c", extractor[header.index("tags:string[]")])
+        self.assertEqual("WF", extractor[header.index("author:string")])
+        self.assertEqual("PythonModule|Parser|Sem3", extractor[-1])
+        with open(os.path.join(self.tmp_path, "import.args")) as f:
+            args = f.read().splitlines()
+        self.assertEqual("--array-delimiter=|", args[0])
+        writer = Neo4jCsvWriter("PythonModule", "name")
+        writer.array_delimiter_candidates = [";", "|"]
+        with self.assertRaises(ValueError):
+            writer.write([{"name": "x", "tags": ["a;b", "c|d"]}], self.tmp_path)
+
+    def test_cypher(self):
+        """Test the batched UNWIND Cypher script."""
+        writer = CypherWriter("PythonModule", "name", batch_size=2)
+        out = io.StringIO()
+        writer.write(self.lod, out)
+        script = out.getvalue()
+        if self.debug:
+            print(script)
+        statements = [s for s in script.split(";\n") if s.strip()]
+        # constraint + 2 PythonModule node batches (including the fallback)
+        # + 1 Service + 1 uses and 1 host relationship batch
+        self.assertEqual(1 + 2 + 1 + 2, len(statements))
+        self.assertIn("REQUIRE n.id IS UNIQUE", statements[0])
+        self.assertIn("n:PythonModule", script)
+        self.assertIn("MERGE (a)-[:uses]->(b)", script)
+        self.assertIn("'O\\'Reilly \\\\ says'", script)
+        self.assertIn("lines: 300", script)
+        self.assertIn("uses: ['extractor', 'lod2rdf']", script)
+        self.assertEqual("`my label`", CypherWriter.quote_name("my label"))
+        for value in [float("nan"), float("inf"), float("-inf")]:
+            self.assertEqual("null", CypherWriter.literal(value))
+        self.assertEqual("[1.5, null]", CypherWriter.literal([1.5, float("nan")]))
+
+    def test_nested_values(self):
+        """Test that maps and mixed lists become JSON string properties."""
+        lod = [
+            {
+                "name": "web",
+                "isA": "Service",
+                "config": {"port": 80, "tls": True},
+                "mixed": [1, "a"],
+                "nested": [[1], [2]],
+                "ports": [80, 443],
+            }
+        ]
+        writer = CypherWriter("PythonModule", "name")
+        out = io.StringIO()
+        writer.write(lod, out)
+        script = out.getvalue()
+        if self.debug:
+            print(script)
+        self.assertIn("""config: '{"port": 80, "tls": true}'""", script)
+        self.assertIn("""mixed: '[1, "a"]'""", script)
+        self.assertIn("nested: '[[1], [2]]'", script)
+        self.assertIn("ports: [80, 443]", script)
+        writer = Neo4jCsvWriter("PythonModule", "name")
+        writer.write(lod, self.tmp_path)
+        with open(os.path.join(self.tmp_path, "nodes_Service.csv")) as f:
+            header, row = list(csv.reader(f))
+        self.assertEqual(
+            '{"port": 80, "tls": true}', row[header.index("config:string")]
+        )
+        self.assertEqual('[1, "a"]', row[header.index("mixed:string")])
+        self.assertEqual("80;443", row[header.index("ports:string[]")])
+
+    def test_csv_spill(self):
+        """Test that spilled node ids and relationships give the same files."""
+        lod = self.lod + [
+            {"name": "extractor", "isA": "Parser", "author": "WF"},
+            {"name": "sem3_cmd", "isA": "PythonModule", "uses": ["extractor"]},
+        ]
+        contents = []
+        for max_memory_mb in [64, 0.0001]:
+            output_dir = os.path.join(self.tmp_path, str(max_memory_mb))
+            writer = Neo4jCsvWriter("PythonModule", "name", max_memory_mb=max_memory_mb)
+            paths = writer.write(lod, output_dir)
+            self.assertEqual(2, writer.duplicate_count)
+            self.assertEqual(5, writer.node_count)
+            self.assertEqual(3, writer.relationship_count)
+            files = {}
+            for path in paths:
+                if not path.endswith("import.args"):
+                    with open(path) as f:
+                        files[os.path.basename(path)] = f.read()
+            contents.append(files)
+        if self.debug:
+            print(contents[1])
+        self.assertEqual(contents[0], contents[1])
@@ -0,0 +1,119 @@
+"""
+```yaml
+# 🌐🕸
+test_notebook:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the cell aware extraction from Jupyter notebooks.
+```
+"""
+
+import base64
+import json
+import os
+import tempfile
+import time
+
+from sem3.compact_markup import SourceTable
+from sem3.extractor import Extractor
+from sem3.notebook import iter_cell_sources, marker_variants
+from tests.base_sem3test import BaseSem3test
+
+
+class TestNotebook(BaseSem3test):
+    """Test the extraction from Jupyter notebooks."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        self.extractor = Extractor(debug=self.debug)
+        image = base64.b64encode(os.urandom(3_000_000)).decode("ascii")
+        self.notebook = {
+            "nbformat": 4,
+            "nbformat_minor": 5,
+            "metadata": {},
+            "cells": [
+                {
+                    "cell_type": "markdown",
+                    "metadata": {},
+                    "source": [
+                        "# Analysis\n",
+                        "```yaml\n",
+                        "# 🌐🕸\n",
+                        "analysis_notebook:\n",
+                        "  isA: JupyterNotebook\n",
+                        "```\n",
+                    ],
+                },
+                {
+                    "cell_type": "code",
+                    "metadata": {},
+                    "execution_count": 1,
+                    "source": [
+                        "import pandas as pd\n",
+                        "# ```sidif\n",
+                        "# # 🌐🕸\n",
+                        "# load_data isA NotebookCell\n",
+                        '# "loads the data" is purpose of it\n',
+                        "# ```\n",
+                    ],
+                    "outputs": [
+                        {
+                            "output_type": "display_data",
+                            "metadata": {},
+                            "data": {"image/png": image},
+                        }
+                    ],
+                },
+            ],
+        }
+
+    def write_notebook(self, name: str, ensure_ascii: bool) -> str:
+        path = os.path.join(self.tmp_path, name)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.notebook, f, ensure_ascii=ensure_ascii, indent=1)
+        return path
+
+    def test_notebook(self):
+        """Test the markups and their file:cell:line sources."""
+        for ensure_ascii in [False, True]:
+            with self.subTest(ensure_ascii=ensure_ascii):
+                path = self.write_notebook(f"nb_{ensure_ascii}.ipynb", ensure_ascii)
+                markups = self.extractor.extract_from_file(path)
+                self.assertEqual(2, len(markups))
+                self.assertEqual(f"{path}:0:2", markups[0].source)
+                self.assertEqual(f"{path}:1:2", markups[1].source)
+                lod = self.extractor.markups_to_lod(markups)
+                if self.debug:
+                    print(lod)
+                self.assertEqual("JupyterNotebook", lod[0]["isA"])
+                self.assertEqual("loads the data", lod[1]["purpose"])
+                compact = self.extractor.extract_compact_from_files(
+                    [path], SourceTable()
+                )
+                self.assertEqual(markups, compact)
+
+    def test_speed(self):
+        """Test that scanning the cells beats scanning the notebook as text."""
+        path = self.write_notebook("speed.ipynb", ensure_ascii=False)
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        start = time.time()
+        text_markups = self.extractor.extract_from_text(text, source_path=path)
+        text_time = time.time() - start
+        start = time.time()
+        markups = self.extractor.extract_from_file(path)
+        cell_time = time.time() - start
+        if self.debug:
+            print(
+                f"{len(text) / 1e6:.1f} MB notebook: text scan {text_time:.3f} s "
+                f"({len(text_markups)} markups), cell scan {cell_time:.3f} s ({len(markups)} markups)"
+            )
+        # the escaped cell sources are not found by the text regex
+        self.assertEqual(0, len(text_markups))
+        self.assertEqual(2, len(markups))
+        # notebooks without marker are not parsed at all
+        self.assertEqual(
+            [], list(iter_cell_sources(b"not json", marker_variants("🌐🕸")))
+        )
@@ -0,0 +1,134 @@
+"""
+```yaml
+# 🌐🕸
+test_parse_limits:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for resource bounded parsing of untrusted markup.
+```
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from sem3.extractor import Extractor, Markup
+from sem3.parse_limits import LimitExceeded, ParseLimits
+from sem3.sidif_fast import FastSiDIFParser
+from tests.base_sem3test import BaseSem3test
+
+
+class TestParseLimits(BaseSem3test):
+    """Test the per markup parse limits."""
+
+    billion_laughs = """
+a: &a ["lol","lol","lol","lol","lol","lol","lol","lol","lol"]
+b: &b [*a,*a,*a,*a,*a,*a,*a,*a,*a]
+c: &c [*b,*b,*b,*b,*b,*b,*b,*b,*b]
+d: &d [*c,*c,*c,*c,*c,*c,*c,*c,*c]
+e: &e [*d,*d,*d,*d,*d,*d,*d,*d,*d]
+f: &f [*e,*e,*e,*e,*e,*e,*e,*e,*e]
+g: &g [*f,*f,*f,*f,*f,*f,*f,*f,*f]
+h: &h [*g,*g,*g,*g,*g,*g,*g,*g,*g]
+i: &i [*h,*h,*h,*h,*h,*h,*h,*h,*h]
+"""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+
+    def check_skipped(self, extractor: Extractor, markups, expected_limit: str):
+        lod = extractor.markups_to_lod(markups)
+        self.assertEqual(1, len(lod), "the harmless markup must still be converted")
+        self.assertEqual(1, len(extractor.skipped))
+        skipped = extractor.skipped[0]
+        if self.debug:
+            print(skipped)
+        self.assertEqual(expected_limit, skipped.limit)
+        self.assertEqual("hostile.yaml:1", skipped.source)
+
+    def hostile_markups(self, code: str, lang: str = "yaml"):
+        markups = [
+            Markup(lang=lang, code=code, source="hostile.yaml:1"),
+            Markup(lang="yaml", code="ok:\n  isA: Test", source="ok.yaml:1"),
+        ]
+        return markups
+
+    def test_billion_laughs(self):
+        """Test that alias bombs are skipped before expansion."""
+        limits = ParseLimits(max_aliases=1000, max_nodes=10000)
+        extractor = Extractor(limits=limits)
+        self.check_skipped(
+            extractor, self.hostile_markups(self.billion_laughs), "max_nodes"
+        )
+        extractor = Extractor(limits=ParseLimits(max_aliases=10))
+        self.check_skipped(
+            extractor, self.hostile_markups(self.billion_laughs), "max_aliases"
+        )
+
+    def test_depth(self):
+        """Test that deeply nested YAML is skipped."""
+        code = "x: " + "[" * 50 + "]" * 50
+        extractor = Extractor(limits=ParseLimits(max_depth=20))
+        self.check_skipped(extractor, self.hostile_markups(code), "max_depth")
+
+    def test_size(self):
+        """Test that huge blocks are skipped without parsing."""
+        code = "\n".join(f'"{i}" is value{i} of it' for i in range(1000))
+        code = "huge isA Test\n" + code
+        extractor = Extractor(limits=ParseLimits(max_bytes=1000))
+        self.check_skipped(extractor, self.hostile_markups(code, "sidif"), "max_bytes")
+        # the limit counts UTF-8 encoded bytes not characters
+        limits = ParseLimits(max_bytes=100)
+        limits.check_size("ä" * 50)
+        with self.assertRaises(LimitExceeded):
+            limits.check_size("ä" * 51)
+        with self.assertRaises(LimitExceeded):
+            limits.check_size("a" * 101)
+        ParseLimits(max_bytes=0).check_size("a" * 101)
+
+    def test_timeout(self):
+        """Test that slow parses are interrupted."""
+        limits = ParseLimits(timeout=0.01)
+        with self.assertRaises(LimitExceeded):
+            with limits.time_limit():
+                while True:
+                    pass
+
+        def slow_parse(_self, _code):
+            time.sleep(5)
+
+        code = "slow isA Test"
+        extractor = Extractor(limits=ParseLimits(timeout=0.05))
+        with patch.object(FastSiDIFParser, "to_dict_of_dicts", slow_parse):
+            start = time.monotonic()
+            self.check_skipped(
+                extractor, self.hostile_markups(code, "sidif"), "timeout"
+            )
+            self.assertLess(time.monotonic() - start, 5)
+
+    def test_timeout_thread(self):
+        """Test that the timeout is checked after the parse outside the main thread."""
+        limits = ParseLimits(timeout=0.01)
+        errors = []
+
+        def run():
+            try:
+                with limits.time_limit():
+                    time.sleep(0.05)
+            except LimitExceeded as ex:
+                errors.append(ex)
+
+        with self.assertLogs("sem3.parse_limits", level="WARNING"):
+            thread = threading.Thread(target=run, name="sem3-timeout-test")
+            thread.start()
+            thread.join()
+        self.assertEqual(1, len(errors))
+        self.assertEqual("timeout", errors[0].limit)
+
+    def test_own_source(self):
+        """Test that the default limits do not affect regular markups."""
+        markups = self.get_markups()
+        lod = self.extractor.markups_to_lod(markups)
+        self.assertGreaterEqual(len(lod), len(markups))
+        self.assertEqual([], self.extractor.skipped)
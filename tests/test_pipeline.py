@@ -0,0 +1,127 @@
+"""
+```yaml
+# 🌐🕸
+test_pipeline:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the pipelined read/scan/parse/emit stages.
+```
+"""
+
+import glob
+import io
+import os
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+
+from rdflib import Graph
+
+from sem3.extractor import Extractor
+from sem3.lod2rdf import RDFDumper
+from sem3.pipeline import GraphSink, NTriplesSink, Pipeline
+from sem3.sem3_cmd import Semantify3Cmd
+from tests.base_sem3test import BaseSem3test
+
+
+class SlowPipeline(Pipeline):
+    """Pipeline simulating a latency bound network filesystem."""
+
+    latency = 0.02
+
+    def read(self, filepath):
+        time.sleep(self.latency)
+        return super().read(filepath)
+
+
+class TestPipeline(BaseSem3test):
+    """Test the pipelined executor."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.files = sorted(glob.glob(os.path.join(self.project_root, "sem3", "*.py")))
+        self.dumper = RDFDumper(
+            base_uri="https://semantify3.bitplan.com/source_code/",
+            namespace_prefix="python_module",
+        )
+
+    def reference_graph(self) -> Graph:
+        extractor = Extractor()
+        lod = extractor.markups_to_lod(extractor.extract_from_glob_list(self.files))
+        return self.dumper.as_rdf(lod, "PythonModule", "name")
+
+    def test_ntriples_stream(self):
+        """Test that the streamed ntriples are the same graph as the sequential output."""
+        out = io.StringIO()
+        sink = NTriplesSink(self.dumper, "PythonModule", "name", out)
+        pipeline = Pipeline(Extractor(), read_threads=4, queue_size=2)
+        stats = pipeline.run(iter(self.files), sink)
+        if self.debug:
+            print(stats)
+        self.assertEqual(len(self.files), stats.files)
+        self.assertIsNotNone(stats.first_output)
+        # non-ASCII files are counted in bytes not characters
+        self.assertEqual(sum(os.path.getsize(f) for f in self.files), stats.bytes)
+        graph = Graph()
+        graph.parse(data=out.getvalue(), format="nt")
+        self.assertTrue(graph.isomorphic(self.reference_graph()))
+
+    def test_graph_sink(self):
+        """Test the turtle output collected while parsing."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "sem3.ttl")
+            sink = GraphSink(self.dumper, "PythonModule", "name", "turtle", path)
+            Pipeline(Extractor()).run(self.files, sink)
+            sink.close()
+            graph = Graph()
+            graph.parse(path, format="turtle")
+        self.assertTrue(graph.isomorphic(self.reference_graph()))
+
+    def test_overlap(self):
+        """Test that read latency overlaps instead of adding up."""
+        sequential = len(self.files) * SlowPipeline.latency
+        sink = NTriplesSink(self.dumper, "PythonModule", "name", io.StringIO())
+        stats = SlowPipeline(Extractor(), read_threads=8).run(self.files, sink)
+        if self.debug:
+            print(f"sequential read latency {sequential:.3f} s - pipelined {stats}")
+        self.assertLess(stats.seconds, sequential)
+
+    def test_sink_failure(self):
+        """Test that a failing sink stops the pipeline."""
+
+        def sink(lod):
+            raise RuntimeError("sink failed")
+
+        with self.assertRaises(RuntimeError):
+            Pipeline(Extractor(), queue_size=1).run(self.files, sink)
+
+    def test_extraction_failure(self):
+        """Test that an extraction error is not hidden by a failed sink."""
+        sink_failed = threading.Event()
+
+        def sink(lod):
+            sink_failed.set()
+            raise RuntimeError("sink failed")
+
+        class FailingPipeline(Pipeline):
+            def iter_lods(self, files):
+                yield [{"name": "first"}]
+                sink_failed.wait(timeout=5)
+                raise ValueError("extraction failed")
+
+        with self.assertRaises(ValueError):
+            FailingPipeline(Extractor(), queue_size=1).run(self.files, sink)
+
+    def test_cmd_pipeline(self):
+        """Test the --pipeline command line option."""
+        capture = io.StringIO()
+        with redirect_stdout(capture):
+            exit_code = Semantify3Cmd().run(
+                ["--pipeline", "--format", "ntriples"] + self.files
+            )
+        self.assertEqual(0, exit_code)
+        graph = Graph()
+        graph.parse(data=capture.getvalue(), format="nt")
+        self.assertTrue(graph.isomorphic(self.reference_graph()))
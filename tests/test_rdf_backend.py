@@ -0,0 +1,142 @@
+"""
+```yaml
+# 🌐🕸
+test_rdf_backend:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Conformance tests and comparative benchmark of the RDF backends.
+```
+"""
+
+import os
+import tempfile
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from sem3.lod2rdf import RDFDumper
+from sem3.rdf_backend import RDFBackend
+from tests.base_sem3test import BaseSem3test
+
+
+class TestRDFBackend(BaseSem3test):
+    """Test that all available RDF backends produce the same graphs."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        self.base_uri = "https://example.org/"
+        self.lod = [
+            {
+                "name": "sem3_cmd",
+                "isA": "PythonModule",
+                "purpose": 'multi\nline "quoted" \\ text',
+                "createdAt": date(2025, 11, 29),
+                "lines": 300,
+                "ratio": 0.5,
+                "public": True,
+                "title": "semantify³ 🌐🕸",
+            },
+            {"name": "extractor", "isA": "PythonModule", "lines": 300},
+            {"purpose": "fallback id and type"},
+        ]
+        self.backends = RDFBackend.available_backends()
+
+    def reference_graph(self) -> Graph:
+        dumper = RDFDumper(self.base_uri, "test")
+        return dumper.as_rdf(self.lod, "PythonModule", "name")
+
+    def test_conformance(self):
+        """Every backend must serialize graphs isomorphic to the rdflib reference."""
+        reference = self.reference_graph()
+        for backend in self.backends:
+            dumper = RDFDumper(self.base_uri, "test", backend=backend)
+            graph = dumper.as_rdf(self.lod, "PythonModule", "name")
+            self.assertEqual(len(reference), len(graph))
+            for fmt in RDFBackend.backends[backend].formats:
+                with self.subTest(backend=backend, format=fmt):
+                    path = os.path.join(self.tmp_path, f"{backend}.{fmt}")
+                    graph.serialize(destination=path, format=fmt)
+                    text = graph.serialize(format=fmt)
+                    if isinstance(text, bytes):
+                        text = text.decode("utf-8")
+                    for data in [open(path, encoding="utf-8").read(), text]:
+                        parsed = Graph()
+                        parsed.parse(data=data, format=fmt)
+                        self.assertTrue(isomorphic(reference, parsed))
+
+    def test_unsupported(self):
+        """Test errors for unknown backends and unsupported formats."""
+        with self.assertRaises(ValueError):
+            RDFDumper(self.base_uri, backend="unknown").as_rdf(self.lod, "Thing")
+        graph = RDFDumper(self.base_uri, backend="ntriples").as_rdf(self.lod, "Thing")
+        with self.assertRaises(ValueError):
+            graph.serialize(format="turtle")
+
+    def test_oxigraph_formats(self):
+        """Test that formats missing in the installed pyoxigraph are unsupported."""
+        if "oxigraph" not in self.backends:
+            self.skipTest("pyoxigraph is not installed")
+        import pyoxigraph
+
+        rdf_format = SimpleNamespace(
+            TURTLE=pyoxigraph.RdfFormat.TURTLE,
+            N3=pyoxigraph.RdfFormat.N3,
+            N_TRIPLES=pyoxigraph.RdfFormat.N_TRIPLES,
+            RDF_XML=pyoxigraph.RdfFormat.RDF_XML,
+        )
+        with patch.object(pyoxigraph, "RdfFormat", rdf_format):
+            dumper = RDFDumper(self.base_uri, "test", backend="oxigraph")
+            graph = dumper.as_rdf(self.lod, "PythonModule", "name")
+        self.assertNotIn("json-ld", graph.formats)
+        self.assertIn("sem3_cmd", graph.serialize(format="turtle"))
+        with self.assertRaises(ValueError):
+            graph.serialize(format="json-ld")
+
+    def test_incomplete_backend(self):
+        """Test that a backend missing an abstract method can not be instantiated."""
+
+        class IncompleteBackend(RDFBackend):
+            name = "incomplete"
+
+            def add(self, triple):
+                pass
+
+        with self.assertRaises(TypeError):
+            IncompleteBackend("test", self.base_uri)
+
+    def test_benchmark(self):
+        """Compare the backends on a synthetic list of dicts."""
+        lod = [
+            {
+                "name": f"module_{i}",
+                "isA": "PythonModule",
+                "author": "Wolfgang Fahl",
+                "createdAt": date(2025, 11, 29),
+                "lines": i,
+                "purpose": f"benchmark module {i}",
+            }
+            for i in range(5000)
+        ]
+        for fmt in ["ntriples", "turtle"]:
+            for backend in self.backends:
+                if fmt not in RDFBackend.backends[backend].formats:
+                    continue
+                dumper = RDFDumper(self.base_uri, "bench", backend=backend)
+                start = time.time()
+                graph = dumper.as_rdf(lod, "PythonModule", "name")
+                built = time.time()
+                path = os.path.join(self.tmp_path, f"bench_{backend}.{fmt}")
+                graph.serialize(destination=path, format=fmt)
+                done = time.time()
+                if self.debug:
+                    print(
+                        f"{backend:>9} {fmt:>8}: {len(graph)} triples "
+                        f"build {built - start:.2f} s serialize {done - built:.2f} s"
+                    )
+                self.assertEqual(7 * len(lod), len(graph))
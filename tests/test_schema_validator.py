@@ -0,0 +1,170 @@
+"""
+```yaml
+# 🌐🕸
+test_schema_validator:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the compiled schema validation.
+```
+"""
+
+import io
+import os
+import tempfile
+import time
+from contextlib import redirect_stderr, redirect_stdout
+
+from rdflib import Graph
+
+from sem3.schema_validator import SchemaValidator
+from sem3.sem3_cmd import Semantify3Cmd
+from tests.base_sem3test import BaseSem3test
+
+
+class TestSchemaValidator(BaseSem3test):
+    """Test the schema validation of extracted entities."""
+
+    schema_yaml = """
+PythonModule:
+  author: str
+  createdAt: date
+  purpose:
+    type: str
+    pattern: ".+"
+Service:
+  url:
+    type: str
+    pattern: "https?://.*"
+  createdAt: datetime
+  port:
+    type: int
+    required: false
+"""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        self.schema_path = os.path.join(self.tmp_path, "schema.yaml")
+        with open(self.schema_path, "w") as f:
+            f.write(self.schema_yaml)
+
+    def test_own_source(self):
+        """The modules of semantify³ itself must conform to the schema."""
+        markups = self.get_markups()
+        lod = self.extractor.markups_to_lod(markups)
+        validator = SchemaValidator.load(self.schema_path, debug=self.debug)
+        violations = validator.validate(lod)
+        for violation in violations:
+            print(violation)
+        self.assertEqual(0, len(violations))
+        # SiDIF entities carry their source location as well
+        for item in lod:
+            self.assertIn("source", item, item.get("name"))
+
+    def test_violations(self):
+        """Test that violations are reported with their source location."""
+        validator = SchemaValidator.load(self.schema_path)
+        lod = [
+            {"name": "m1", "isA": "PythonModule", "author": "wf", "source": "a.py:3"},
+            {
+                "name": "m2",
+                "isA": "PythonModule",
+                "author": 42,
+                "createdAt": "yesterday",
+                "purpose": "",
+                "source": "b.py:7",
+            },
+            {
+                "name": "s1",
+                "isA": "Service",
+                "url": "ftp://x",
+                "createdAt": "2024-07-23T09:19:32",
+                "port": "80",
+            },
+            {"name": "other", "isA": "Unknown"},
+        ]
+        violations = validator.validate(lod)
+        found = {(v.name, v.prop) for v in violations}
+        expected = {
+            ("m1", "createdAt"),
+            ("m1", "purpose"),
+            ("m2", "author"),
+            ("m2", "createdAt"),
+            ("m2", "purpose"),
+            ("s1", "url"),
+            ("s1", "port"),
+        }
+        self.assertEqual(expected, found)
+        m1_violations = [v for v in violations if v.name == "m1"]
+        self.assertEqual("a.py:3", m1_violations[0].source)
+        self.assertIn("missing", str(m1_violations[0]))
+
+    def test_invalid_schema(self):
+        """Test that malformed schemas are rejected at compile time."""
+        with self.assertRaises(ValueError):
+            SchemaValidator({"PythonModule": {"author": "string"}})
+        with self.assertRaises(ValueError):
+            SchemaValidator({"PythonModule": ["author"]})
+
+    def test_performance(self):
+        """Check 100k entities in a single pass."""
+        validator = SchemaValidator.load(self.schema_path)
+        lod = [
+            {
+                "name": f"module_{i}",
+                "isA": "PythonModule",
+                "author": "Wolfgang Fahl",
+                "createdAt": "2025-11-29",
+                "purpose": "performance test",
+                "source": f"module_{i}.py:3",
+            }
+            for i in range(100000)
+        ]
+        start = time.time()
+        violations = validator.validate(lod)
+        elapsed = time.time() - start
+        if self.debug:
+            print(f"validated {len(lod)} entities in {elapsed:.2f} s")
+        self.assertEqual(0, len(violations))
+
+    def test_cmd_validate(self):
+        """Test validation only mode of the command line."""
+        sem3_dir = os.path.join(self.project_root, "sem3", "*.py")
+        for schema_yaml, expected_exit_code in [
+            (self.schema_yaml, 0),
+            ("PythonModule:\n  license: str\n", 1),
+        ]:
+            with open(self.schema_path, "w") as f:
+                f.write(schema_yaml)
+            cmd = Semantify3Cmd()
+            capture = io.StringIO()
+            with redirect_stdout(capture):
+                exit_code = cmd.run(
+                    ["--validate", "--schema", self.schema_path, sem3_dir]
+                )
+            output = capture.getvalue()
+            if self.debug:
+                print(output)
+            self.assertEqual(expected_exit_code, exit_code)
+            self.assertNotIn("@prefix", output)
+
+    def test_cmd_violations_stderr(self):
+        """Test that violations do not mix with the RDF on stdout."""
+        with open(self.schema_path, "w") as f:
+            f.write("PythonModule:\n  license: str\n")
+        extractor_py = os.path.join(self.project_root, "sem3", "extractor.py")
+        cmd = Semantify3Cmd()
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            exit_code = cmd.run(
+                ["--schema", self.schema_path, "--format", "ntriples", extractor_py]
+            )
+        if self.debug:
+            print(stderr.getvalue())
+        self.assertEqual(1, exit_code)
+        self.assertIn("license", stderr.getvalue())
+        g = Graph()
+        g.parse(data=stdout.getvalue(), format="nt")
+        self.assertGreater(len(g), 0)
@@ -0,0 +1,149 @@
+"""
+```yaml
+# 🌐🕸
+test_sidif_fast:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Differential tests of the fast SiDIF subset parser against py-sidif.
+```
+"""
+
+import random
+import time
+
+from sidif.sidif import SiDIFParser
+
+from sem3.sidif_fast import FastSiDIFParser
+from tests.base_sem3test import BaseSem3test
+
+
+class TestSidifFast(BaseSem3test):
+    """Compare the fast SiDIF parser with py-sidif."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.reference_parser = SiDIFParser(showErrors=False)
+
+    def reference(self, text: str):
+        """Get the py-sidif dict of dicts, None for parse errors or the exception."""
+        result, error = self.reference_parser.parseText(text)
+        if error is not None or not result:
+            return None
+        try:
+            return result[0].toDictOfDicts()
+        except Exception as ex:
+            return type(ex)
+
+    def fast(self, parser: FastSiDIFParser, text: str):
+        try:
+            return parser.to_dict_of_dicts(text)
+        except Exception as ex:
+            return type(ex)
+
+    def check(self, texts, expect_fast: bool = None):
+        parser = FastSiDIFParser()
+        for text in texts:
+            with self.subTest(text=text):
+                expected = self.reference(text)
+                fast = parser.parse_subset(text)
+                if fast is not None:
+                    self.assertEqual(expected, fast)
+                    # same value types e.g. True and 1 compare equal
+                    for props, expected_props in zip(fast.values(), expected.values()):
+                        for key, value in props.items():
+                            self.assertIs(type(expected_props[key]), type(value))
+                if expect_fast is not None:
+                    self.assertEqual(expect_fast, fast is not None)
+                self.assertEqual(expected, self.fast(parser, text))
+
+    def test_subset(self):
+        """Test texts in the subset."""
+        texts = [
+            'base isA PythonModule\n"Wolfgang Fahl" is author of it\n42 is count of it\n',
+            'a isA B\n"one" is p of it\n"two" is p of it',
+            'a isA B\nb isA C\n"v" is p of it\na isA D\n"x" is q of it\n',
+            '  a  isA  B  \n\t"  lead" is p of it  \n"" is e of it\n',
+            'a isA B\n# comment ä\n#\n\n"v" is p of it\n',
+            "a isA B\ntrue is t of it\nfalse is f of it\n-5 is n of it\n+5 is m of it\n007 is o of it\n",
+            "a isA B\n2025 is year of it\n99999999999999999999 is big of it\n",
+            'a isA B\n"v" is is of it\n"w" is of of it\n"x" is isA of it\n',
+            "true isA B\nit isA C\na isA of\n",
+            'a isA B\n"v"is p of it\ntrueis q of it\n',
+            'a isA B\n"a # b" is p of it\n"ä ü 🌐" is q of it\n',
+            "\n",
+            "# only a comment\n",
+        ]
+        self.check(texts, expect_fast=True)
+
+    def test_fallback(self):
+        """Test texts outside of the subset."""
+        texts = [
+            "",
+            '"v" is p of it\n',
+            "a isA it\n",
+            "a isA offset\n",
+            'a isA B\n"a\tb" is p of it\n',
+            'a isA B\n"multi\nline" is p of it\n',
+            'a isA B\n"with \\"quote\\"" is p of it\n',
+            'a isA B\n# comment 🌐\n"v" is p of it\n',
+            "a isA B\n#\xa0x\n",
+            "a isA B # c\n",
+            'a isA B\r\n"v" is p of it\r\n',
+            'a isA B\n"v" is p of it extra\n',
+            'a isA B\n"v" is p of a\n',
+            'a isA B\n"v" isp of it\n',
+            "a isA B\n1.5 is p of it\n.5 is q of it\n1e3 is r of it\n",
+            "a isA B\n2025-11-29 is d of it\n12:30 is t of it\n0x1f is h of it\n",
+            "a isA B\nhttp://example.org is u of it\n",
+            "a_ü isA B\n",
+            "a isA B\nTrue is p of it\n",
+            "a isA B\nb p c\nParis is capital of France\nFrance has capital Paris\n",
+        ]
+        self.check(texts, expect_fast=False)
+
+    def random_text(self, rnd: random.Random) -> str:
+        """Generate a random text from subset and near subset line fragments."""
+        subjects = ["a", "b", "it", "true", "_x1", "of", "isA", "offset", "ä"]
+        values = ['"v"', '""', '" x "', "42", "-7", "+3", "2025", "true", "false"]
+        values += ["1.5", "True", '"a\tb"', "0x10", "2025-01-01", '"#"']
+        props = ["p", "q", "is", "of", "isA", "p_1", "x9"]
+        lines = []
+        for _i in range(rnd.randint(0, 8)):
+            kind = rnd.random()
+            if kind < 0.3:
+                line = f"{rnd.choice(subjects)} isA {rnd.choice(subjects)}"
+            elif kind < 0.8:
+                line = f"{rnd.choice(values)} is {rnd.choice(props)} of it"
+            elif kind < 0.9:
+                line = rnd.choice(["# c", "#", "", "  ", "# ü", "# 🌐"])
+            else:
+                line = rnd.choice(["a b c", '"v" is p of a', "x isA y # c"])
+            lines.append(rnd.choice(["", " ", "\t"]) + line + rnd.choice(["", " "]))
+        return "\n".join(lines) + rnd.choice(["", "\n"])
+
+    def test_random(self):
+        """Test random texts around the subset."""
+        rnd = random.Random(4711)
+        self.check([self.random_text(rnd) for _i in range(1000)])
+
+    def test_speed(self):
+        """Compare the speed on a typical markup."""
+        text = "\n".join(
+            f'module{i} isA PythonModule\n"Wolfgang Fahl" is author of it\n{i} is lines of it'
+            for i in range(50)
+        )
+        parser = FastSiDIFParser()
+        start = time.time()
+        for _i in range(20):
+            fast = parser.to_dict_of_dicts(text)
+        fast_time = time.time() - start
+        start = time.time()
+        for _i in range(20):
+            reference = self.reference(text)
+        reference_time = time.time() - start
+        if self.debug:
+            print(f"fast: {fast_time:.4f} s py-sidif: {reference_time:.4f} s")
+        self.assertEqual(reference, fast)
+        self.assertEqual(20, parser.fast_count)
+        self.assertLess(fast_time, reference_time)
@@ -0,0 +1,136 @@
+"""
+```yaml
+# 🌐🕸
+test_sparql_upload:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the batched SPARQL endpoint upload against a local stub server.
+```
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from rdflib import Graph
+
+from sem3.lod2rdf import RDFDumper
+from sem3.sem3_cmd import Semantify3Cmd
+from sem3.sparql_upload import SparqlUploader, UploadError
+from tests.base_sem3test import BaseSem3test
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Graph store stub recording all requests."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        pass
+
+    def handle_request(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode("utf-8")
+        with server.lock:
+            server.connections.add(self.client_address)
+            if server.failures > 0:
+                server.failures -= 1
+                status = 503
+            else:
+                status = server.status
+                query = parse_qs(urlsplit(self.path).query)
+                graph = query.get("graph", [None])[0]
+                server.requests.append((self.command, graph, body))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_PUT = handle_request
+    do_POST = handle_request
+
+
+class TestSparqlUpload(BaseSem3test):
+    """Test the batched upload to a SPARQL graph store."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.connections = set()
+        self.server.failures = 0
+        self.server.status = 204
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}/store"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.dumper = RDFDumper(base_uri="https://example.org/")
+        self.lod = [
+            {"name": f"m{i}", "isA": "PythonModule", "source": f"file{i % 2}.py:{i}"}
+            for i in range(10)
+        ]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        BaseSem3test.tearDown(self)
+
+    def test_gsp_upload(self):
+        """Test graph store protocol upload with replace per source file."""
+        uploader = SparqlUploader(
+            self.endpoint, batch_size=4, max_in_flight=2, backoff=0.01
+        )
+        self.server.failures = 2
+        stats = uploader.upload_lod(self.lod, self.dumper, "PythonModule", "name")
+        if self.debug:
+            print(stats)
+        # 10 resources with 4 triples each in 2 graphs
+        self.assertEqual(2, stats.graphs)
+        self.assertEqual(40, stats.triples)
+        self.assertEqual(10, stats.batches)
+        self.assertEqual(2, stats.retries)
+        requests = self.server.requests
+        self.assertEqual(10, len(requests))
+        for graph in [
+            "https://example.org/graph/file0.py",
+            "https://example.org/graph/file1.py",
+        ]:
+            graph_requests = [r for r in requests if r[1] == graph]
+            self.assertEqual("PUT", graph_requests[0][0])
+            self.assertTrue(all(r[0] == "POST" for r in graph_requests[1:]))
+            g = Graph()
+            g.parse(data="".join(r[2] for r in graph_requests), format="nt")
+            self.assertEqual(20, len(g))
+        # keep-alive connections are reused
+        self.assertLessEqual(len(self.server.connections), 2 + 2)
+
+    def test_update_upload(self):
+        """Test SPARQL update protocol upload."""
+        uploader = SparqlUploader(self.endpoint, protocol="update", batch_size=100)
+        uploader.upload_lod(self.lod, self.dumper, "PythonModule", "name")
+        requests = self.server.requests
+        self.assertEqual(2, len(requests))
+        for method, _graph, body in requests:
+            self.assertEqual("POST", method)
+            self.assertTrue(
+                body.startswith("DROP SILENT GRAPH <https://example.org/graph/file")
+            )
+            self.assertIn("INSERT DATA", body)
+
+    def test_failure(self):
+        """Test that client errors are not retried."""
+        self.server.status = 400
+        uploader = SparqlUploader(self.endpoint, retries=3, backoff=0.01)
+        with self.assertRaises(UploadError):
+            uploader.upload_lod(self.lod, self.dumper, "PythonModule", "name")
+        self.assertEqual(0, uploader.stats.retries)
+
+    def test_cmd_upload(self):
+        """Test the --upload command line option."""
+        cmd = Semantify3Cmd()
+        pattern = os.path.join(self.project_root, "sem3", "*.py")
+        exit_code = cmd.run(["--upload", self.endpoint, pattern])
+        self.assertEqual(0, exit_code)
+        self.assertGreater(len(self.server.requests), 0)
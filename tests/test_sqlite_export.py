@@ -0,0 +1,176 @@
+"""
+```yaml
+# 🌐🕸
+test_sqlite_export:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the indexed SQLite export.
+```
+"""
+
+import os
+import sqlite3
+import tempfile
+from datetime import date
+
+from sem3.sem3_cmd import Semantify3Cmd
+from sem3.sqlite_export import SqliteExporter
+from tests.base_sem3test import BaseSem3test
+
+
+class TestSqliteExport(BaseSem3test):
+    """Test the SQLite export."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.tmp_path = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_path, "sem3.db")
+        self.lod = [
+            {
+                "name": "sem3_cmd",
+                "isA": "PythonModule",
+                "author": "Wolfgang Fahl",
+                "createdAt": date(2025, 11, 29),
+                "uses": ["extractor", "lod2rdf"],
+                "source": "sem3/sem3_cmd.py:3",
+            },
+            {
+                "name": "extractor",
+                "isA": "PythonModule",
+                "author": "Wolfgang Fahl",
+                "createdAt": "2025-11-10",
+                "lines": 450,
+                "source": "sem3/extractor.py:2",
+            },
+            {
+                "name": "ypgen",
+                "isA": "Service",
+                "port": 8778,
+                "public": True,
+                "source": "tests/test_extractor.py:42",
+            },
+        ]
+
+    def query(self, sql: str, params=()):
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def test_export(self):
+        """Test the tables, typed values and indexes."""
+        exporter = SqliteExporter(self.db_path, batch_size=2, debug=self.debug)
+        exporter.write(self.lod)
+        self.assertEqual(3, exporter.entity_count)
+        rows = self.query(
+            """SELECT e.name FROM entity e
+            JOIN property a ON a.entity_id = e.id AND a.property = 'author'
+            JOIN property c ON c.entity_id = e.id AND c.property = 'createdAt'
+            WHERE e.isA = 'PythonModule' AND a.value = ? AND c.value > ?
+            ORDER BY e.name""",
+            ("Wolfgang Fahl", "2025-11-15"),
+        )
+        self.assertEqual([("sem3_cmd",)], rows)
+        rows = self.query(
+            "SELECT value, position FROM entity_property WHERE name='sem3_cmd' AND property='uses'"
+        )
+        self.assertEqual([("extractor", 0), ("lod2rdf", 1)], rows)
+        rows = self.query(
+            "SELECT typeof(value), value FROM property WHERE property IN ('port', 'public') ORDER BY property"
+        )
+        self.assertEqual([("integer", 8778), ("integer", 1)], rows)
+        indexes = {
+            name
+            for (name,) in self.query(
+                "SELECT name FROM sqlite_master WHERE type='index'"
+            )
+        }
+        self.assertTrue(set(SqliteExporter.indexes) <= indexes)
+        plan = self.query(
+            "EXPLAIN QUERY PLAN SELECT entity_id FROM property WHERE property='port' AND value=8778"
+        )
+        self.assertIn("idx_property_value", str(plan))
+
+    def test_refresh(self):
+        """Test that a refresh replaces the entities of the given source files only."""
+        SqliteExporter(self.db_path).write(self.lod)
+        changed = [
+            {
+                "name": "extractor",
+                "isA": "PythonModule",
+                "lines": 500,
+                "source": "sem3/extractor.py:2",
+            },
+            {"name": "markup", "isA": "Dataclass", "source": "sem3/extractor.py:30"},
+        ]
+        exporter = SqliteExporter(self.db_path)
+        exporter.write(changed)
+        self.assertEqual(1, exporter.deleted_count)
+        rows = self.query("SELECT name, source_file FROM entity ORDER BY name")
+        self.assertEqual(
+            [
+                ("extractor", "sem3/extractor.py"),
+                ("markup", "sem3/extractor.py"),
+                ("sem3_cmd", "sem3/sem3_cmd.py"),
+                ("ypgen", "tests/test_extractor.py"),
+            ],
+            rows,
+        )
+        rows = self.query("SELECT value FROM entity_property WHERE property='lines'")
+        self.assertEqual([(500,)], rows)
+
+    def test_refresh_removed(self):
+        """Test that scanned files without markup left lose their entities."""
+        SqliteExporter(self.db_path).write(
+            [
+                {"name": "a", "source": "f1.py:1"},
+                {"name": "b", "source": "f2.py:1"},
+            ]
+        )
+        exporter = SqliteExporter(self.db_path)
+        exporter.write(
+            [{"name": "b2", "source": "f2.py:1"}], source_files=["f1.py", "f2.py"]
+        )
+        self.assertEqual(2, exporter.deleted_count)
+        rows = self.query("SELECT name, source_file FROM entity")
+        self.assertEqual([("b2", "f2.py")], rows)
+
+    def test_atomic(self):
+        """Test that an interrupted load leaves the database unchanged."""
+        SqliteExporter(self.db_path).write(self.lod)
+        before = self.query("SELECT * FROM entity_property ORDER BY id, property")
+
+        class FailingExporter(SqliteExporter):
+            def iter_property_rows(self, entity_id, item_dict):
+                if item_dict.get("name") == "ypgen":
+                    raise RuntimeError("interrupted")
+                return super().iter_property_rows(entity_id, item_dict)
+
+        exporter = FailingExporter(self.db_path, batch_size=1)
+        with self.assertRaises(RuntimeError):
+            exporter.write(self.lod)
+        after = self.query("SELECT * FROM entity_property ORDER BY id, property")
+        self.assertEqual(before, after)
+
+    def test_cmd_sqlite(self):
+        """Test --format sqlite."""
+        pattern = os.path.join(self.project_root, "sem3", "*.py")
+        exit_code = Semantify3Cmd().run(
+            ["--format", "sqlite", "-o", self.db_path, pattern]
+        )
+        self.assertEqual(0, exit_code)
+        rows = self.query("SELECT name FROM entity WHERE name='sqlite_export'")
+        self.assertEqual([("sqlite_export",)], rows)
+        # a rescan of a file with its markup removed deletes its entities
+        plain_file = os.path.join(self.tmp_path, "plain.py")
+        with open(plain_file, "w", encoding="utf-8") as f:
+            f.write('"""\n```yaml\n# 🌐🕸\nplain:\n  isA: PythonModule\n```\n"""\n')
+        Semantify3Cmd().run(["--format", "sqlite", "-o", self.db_path, plain_file])
+        rows = self.query("SELECT name FROM entity WHERE source_file=?", (plain_file,))
+        self.assertEqual([("plain",)], rows)
+        with open(plain_file, "w", encoding="utf-8") as f:
+            f.write("# no markup left\n")
+        Semantify3Cmd().run(["--format", "sqlite", "-o", self.db_path, plain_file])
+        rows = self.query("SELECT name FROM entity WHERE source_file=?", (plain_file,))
+        self.assertEqual([], rows)
+        rows = self.query("SELECT name FROM entity WHERE name='sqlite_export'")
+        self.assertEqual([("sqlite_export",)], rows)
@@ -0,0 +1,39 @@
+"""
+```yaml
+# 🌐🕸
+test_storable:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for the mutable field defaults of lod_storable dataclasses.
+```
+"""
+
+from sem3.batch import BatchManifest, RepositoryConfig
+from tests.base_sem3test import BaseSem3test
+
+
+class TestStorable(BaseSem3test):
+    """Test the None defaults of lod_storable dataclasses."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+
+    def test_none_defaults(self):
+        """Test that None fields get fresh defaults on construction and load."""
+        first = RepositoryConfig(name="a")
+        second = RepositoryConfig(name="b")
+        self.assertEqual(["**/*.py"], first.include)
+        self.assertEqual([], first.exclude)
+        first.exclude.append("tests/*")
+        self.assertEqual([], second.exclude)
+        self.assertEqual(
+            ["src/*.py"], RepositoryConfig("c", include=["src/*.py"]).include
+        )
+        manifest = BatchManifest.from_yaml("repositories:\n- name: a\n")
+        yaml_str = manifest.to_yaml()
+        if self.debug:
+            print(yaml_str)
+        self.assertEqual(["**/*.py"], manifest.repositories[0].include)
+        self.assertNotIn("none_defaults", yaml_str)
+        self.assertEqual([], BatchManifest.from_yaml("summary: s.yaml\n").repositories)
@@ -0,0 +1,87 @@
+"""
+```yaml
+# 🌐🕸
+test_subject_ids:
+  isA: PythonTestModule
+  author: Wolfgang Fahl
+  createdAt: 2026-10-19
+  purpose: Unit tests for stable content derived subject ids.
+```
+"""
+
+from sem3.lod2rdf import RDFDumper
+from sem3.subject_ids import SubjectIdMinter
+from tests.base_sem3test import BaseSem3test
+
+
+class TestSubjectIds(BaseSem3test):
+    """Test the subject id minter."""
+
+    def setUp(self, debug=True, profile=True):
+        BaseSem3test.setUp(self, debug=debug, profile=profile)
+        self.lod = [
+            {"purpose": "first", "source": "a.py:3"},
+            {"purpose": "second", "source": "b.py:3"},
+            {"purpose": "third", "source": "c.py:3"},
+        ]
+
+    def subjects(self, lod, id_scheme="hash"):
+        dumper = RDFDumper("http://example.org/", id_scheme=id_scheme)
+        graph = dumper.as_rdf(lod, "Thing", "name")
+        return {str(s) for s in graph.subjects()}
+
+    def test_stable(self):
+        """Test that ids do not depend on the position of an entity."""
+        subjects = self.subjects(self.lod)
+        # removing the first entity keeps the other subjects
+        self.assertEqual(
+            subjects - self.subjects(self.lod[:1]), self.subjects(self.lod[1:])
+        )
+        self.assertEqual(subjects, self.subjects(list(reversed(self.lod))))
+        index_subjects = self.subjects(self.lod[1:], id_scheme="index")
+        self.assertIn("http://example.org/thing_0", index_subjects)
+        if self.debug:
+            print(sorted(subjects))
+
+    def test_id_field(self):
+        """Test that the id field wins over minted ids."""
+        minter = SubjectIdMinter()
+        self.assertEqual("x", minter.resource_id({"name": "x"}, "Thing", "name", 0))
+        minted = minter.resource_id({"purpose": "y"}, "Thing", "name", 0)
+        self.assertRegex(minted, r"^thing_[0-9a-f]{12}$")
+        self.assertEqual(
+            minted, minter.resource_id({"purpose": "y"}, "Thing", "name", 7)
+        )
+
+    def test_collision(self):
+        """Test that colliding digest prefixes give full digest ids in any order."""
+        lod = [{"n": i} for i in range(64)]
+
+        def mint_all(items):
+            minter = SubjectIdMinter(digest_length=1)
+            minter.prepare(items, "Thing", None)
+            ids = {item["n"]: minter.mint(item, "Thing", 0) for item in items}
+            return minter, ids
+
+        minter, ids = mint_all(lod)
+        if self.debug:
+            print(f"{minter.collisions} collisions: {ids}")
+        self.assertEqual(64, len(set(ids.values())))
+        self.assertGreater(minter.collisions, 0)
+        lengths = {len(resource_id) for resource_id in ids.values()}
+        self.assertEqual({len("thing_") + 1, len("thing_") + 64}, lengths)
+        _minter, reversed_ids = mint_all(list(reversed(lod)))
+        self.assertEqual(ids, reversed_ids)
+        # a collision with an entity of an earlier unprepared chunk
+        minter = SubjectIdMinter(digest_length=1)
+        first_ids = [minter.mint(item, "Thing", 0) for item in lod]
+        self.assertEqual(64, len(set(first_ids)))
+        self.assertEqual(first_ids, [minter.mint(item, "Thing", 0) for item in lod])
+
+    def test_mixed_keys(self):
+        """Test the digest of mappings with int and str keys."""
+        item = {"purpose": {1: "one", "two": 2}, "list": [{3: "three", "x": 1}]}
+        digest = SubjectIdMinter.digest(item)
+        self.assertEqual(64, len(digest))
+        same = {"list": [{"x": 1, 3: "three"}], "purpose": {"two": 2, 1: "one"}}
+        self.assertEqual(digest, SubjectIdMinter.digest(same))